@@ -1,47 +1,228 @@
 # app.py - Flask backend for ASL recognition
+#
+# TensorFlow, MediaPipe and OpenCV (and the modules built on them: inference,
+# features, frames, streaming) are imported by the model loaders on
+# background threads, not here, so the server and /health come up at once.
 
-import cv2
 import numpy as np
 import pickle
-import tensorflow as tf
-import mediapipe as mp
-from math import acos, degrees
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g, Response, stream_with_context
 from flask_cors import CORS
-import base64
-import io
-from PIL import Image
+from flask_sock import Sock
 import json
+import functools
+import hashlib
+import itertools
+import logging
+import os
+import time
 from datetime import datetime
+from concurrent.futures import Future
+from batching import MicroBatcher
+from registry import LAZY, LOADING, PENDING, ModelRegistry
+from cache import TTLCache, quantized_key
+from sessions import SessionStore
+from sequence import SequenceStage
+from preprocess import load_scaler
+from labels import LabelLookup
+from events import EventHub, sse_stream
+from sampling import SkipStats, StabilitySampler
+from metrics import Counter, LabeledHistogram, render_histograms, render_prometheus, render_samples
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
+sock = Sock(app)  # WebSocket streaming endpoints
+
+# Observability: per-stage spans, request counters and refiner cascade
+# results, all served in Prometheus text format from /metrics
+stage_ms = LabeledHistogram('asl_stage_ms', 'Time per pipeline stage in milliseconds', 'stage')
+request_ms = LabeledHistogram('asl_request_ms', 'Request latency in milliseconds', 'endpoint')
+requests_total = Counter('asl_requests_total', 'Requests by endpoint and outcome', ('endpoint', 'outcome'))
+frames_total = Counter('asl_frames_total', 'Webcam frames by result', ('result',))
+cascade_total = Counter('asl_refiner_cascade_total', 'Refiner cascade results by refiner', ('refiner', 'result'))
+
+# ESP32 responses are logged at INFO, one in every ESP32_LOG_EVERY
+ESP32_LOG_LEVEL = os.environ.get('ESP32_LOG_LEVEL', 'WARNING')
+ESP32_LOG_EVERY = 100
+esp32_log = logging.getLogger('esp32')
+esp32_log.setLevel(ESP32_LOG_LEVEL)
+esp32_log_counter = itertools.count()
 
 # --- ESP32 CNN Model for Sensor Data ---------------------------------------------------
 
 # Global variable for ESP32 CNN model
 esp32_cnn_model = None
+esp32_engine = None
 esp32_scaler = None
 esp32_label_encoder = None
+esp32_batcher = None
+
+# Glove model backend: "keras" (float), "tflite" (float), "tflite_int8" or
+# "numpy" (TensorFlow-free forward pass reading the .keras archive with h5py)
+ESP32_BACKEND = "keras"
+ESP32_MODEL_PATHS = {
+    'keras': "glove_cnn_model.keras",
+    'tflite': "glove_cnn_float.tflite",
+    'tflite_int8': "glove_cnn_int8.tflite",
+    'numpy': "glove_cnn_model.keras",
+}
+# The glove CNN's 16 outputs (A-I, K, L, M, O, W, Y, Z), in training order
+ESP32_CLASSES = "classes.json"
+
+# Optional sliding-window sequence model (see train_glove_sequence.py).
+# When loaded it classifies each glove's recent readings, which is what
+# dynamic letters like J and Z need; the snapshot CNN covers warm-up.
+ESP32_SEQUENCE_MODEL = "glove_seq_model.keras"
+ESP32_SEQUENCE_CLASSES = "glove_seq_classes.json"
+ESP32_SEQUENCE_STRIDE = 1  # classify every N samples once the window is full
+
+# Glove prediction cache: a held sign gives near-identical 12-bit readings,
+# so model outputs are memoized on readings quantized per finger
+# (thumb, pointer, middle, ring, pinky). Cleared whenever the model reloads.
+ESP32_CACHE = True
+ESP32_CACHE_SIZE = 4096
+ESP32_CACHE_STEP = np.array([16, 16, 16, 16, 16], dtype=np.float32)  # ADC counts per bucket
+esp32_cache = TTLCache(ESP32_CACHE_SIZE, name="glove_cache")
+esp32_model_generation = 0  # part of every cache key, bumped on reload
+esp32_sequence = None
+
+# /esp32/predict_batch: binary bodies are packed little-endian records of
+# uint32 timestamp (ms, device clock) + 5 x uint16 readings (14 bytes each)
+ESP32_BATCH_RECORD = np.dtype([('t', '<u4'), ('values', '<u2', (5,))])
+ESP32_MAX_BATCH_READINGS = 512
+
+# Threshold-rule letters when no glove model is loaded; off unless asked for,
+# so a missing or still-loading model never produces made-up detections
+ESP32_PLACEHOLDER = os.environ.get("ESP32_PLACEHOLDER", "0") == "1"
+ESP32_RETRY_AFTER_S = 1
 
-latest_esp32_prediction = None
-esp32_last_letter = None
-esp32_letter_count = 0
+# Micro-batching: coalesce concurrent /esp32/predict requests into one forward pass
+ESP32_BATCHING = True
+ESP32_BATCH_WINDOW_MS = 3.0   # max time the first request in a batch waits
+ESP32_MAX_BATCH = 32          # dispatch early once this many samples are queued
 
-def load_esp32_models():
+# Per-glove debouncing: "same letter 3 times -> play audio" by default.
+# Alternatives: {'policy': 'vote', 'n': 3, 'm': 5} or
+#               {'policy': 'ewma', 'alpha': 0.5, 'enter': 0.7, 'exit': 0.4}
+ESP32_SMOOTHING = {'policy': 'consecutive', 'n': 3}
+ESP32_SESSION_IDLE_S = 300.0  # forget gloves that have been silent this long
+ESP32_DEFAULT_DEVICE = 'default'
+
+esp32_sessions = SessionStore(ESP32_SMOOTHING, idle_timeout_s=ESP32_SESSION_IDLE_S)
+
+# Push channel (/esp32/events): an event per debounced letter change or
+# audio trigger; subscribers that fall ESP32_EVENT_QUEUE events behind are dropped
+ESP32_EVENT_QUEUE = 32
+ESP32_EVENT_HEARTBEAT_S = 15.0
+esp32_events = EventHub(ESP32_EVENT_QUEUE, name="esp32_events")
+
+# Binary UDP ingestion (udp_ingest.py): one small datagram per reading
+# instead of an HTTP request, results sent back to the glove. Opt-in when
+# running app.py directly (ESP32_UDP=1); serve_glove.py always starts it
+ESP32_UDP = os.environ.get("ESP32_UDP", "0") == "1"
+ESP32_UDP_PORT = int(os.environ.get("ESP32_UDP_PORT", 5005))
+esp32_udp = None
+
+def start_esp32_udp(port=None):
+    """
+    Start the UDP listener; readings go through predict_esp32_readings.
+    A port that can't be bound only disables UDP ingestion (returns None),
+    HTTP keeps serving.
+    """
+    global esp32_udp
+    from udp_ingest import UdpIngestServer
+    port = port or ESP32_UDP_PORT
+    try:
+        esp32_udp = UdpIngestServer(predict_esp32_readings, port=port).start()
+    except OSError as e:
+        print(f"⚠️  ESP32 UDP ingestion disabled, could not bind port {port}: {e}")
+        return None
+    # Sequence numbers are per-session state: forget them with the session
+    esp32_sessions.on_evict.append(esp32_udp.tracker.forget)
+    print(f"📡 ESP32 UDP ingestion listening on port {esp32_udp.port}")
+    return esp32_udp
+
+def load_esp32_engine(backend):
+    """
+    Build the glove model engine for the selected backend.
+    Returns: (keras_model or None, engine)
+    """
+    if backend not in ESP32_MODEL_PATHS:
+        raise ValueError(f"Unknown ESP32 backend '{backend}', expected one of {list(ESP32_MODEL_PATHS)}")
+    path = ESP32_MODEL_PATHS[backend]
+    if backend == 'keras':
+        import tensorflow as tf
+        from inference import build_engine
+        model = tf.keras.models.load_model(path)
+        return model, build_engine(model, name="glove_cnn")
+    if backend == 'numpy':
+        from numpy_engine import NumpyEngine
+        return None, NumpyEngine(path, name="glove_cnn_numpy").warmup()
+    # TFLite float / int8: raw 0-4095 readings are quantized inside the engine
+    from tflite_engine import TFLiteEngine
+    engine = TFLiteEngine(path, name=f"glove_cnn_{backend}").warmup()
+    return None, engine
+
+def load_esp32_sequence_model():
+    """Load the glove sequence model if it has been trained"""
+    global esp32_sequence
+    if GLOVE_ONLY:
+        print("ℹ️  Glove-only mode: the sequence model needs TensorFlow, using single snapshots")
+        return
+    if not os.path.exists(ESP32_SEQUENCE_MODEL):
+        print(f"ℹ️  {ESP32_SEQUENCE_MODEL} not found, glove predictions use single snapshots")
+        return
+    try:
+        engine = load_keras_engine(ESP32_SEQUENCE_MODEL, "glove_seq")
+        with open(ESP32_SEQUENCE_CLASSES) as f:
+            classes = json.load(f)
+        window, channels = engine.input_shape
+        esp32_sequence = SequenceStage(engine, classes, window, channels, stride=ESP32_SEQUENCE_STRIDE)
+        print(f"✅ ESP32 sequence model ({ESP32_SEQUENCE_MODEL}, {window}-sample window) loaded successfully!")
+    except Exception as e:
+        print(f"⚠️  ESP32 sequence model loading failed: {e}")
+
+def load_esp32_models(backend=None):
     """Load CNN model for ESP32 sensor data"""
-    global esp32_cnn_model, esp32_scaler, esp32_label_encoder
+    global esp32_cnn_model, esp32_engine, esp32_scaler, esp32_label_encoder, esp32_batcher, ESP32_BACKEND
+    global esp32_model_generation
     
     try:
-        esp32_cnn_model = tf.keras.models.load_model("glove_cnn_model.keras")
+        backend = backend or ESP32_BACKEND
+        esp32_cnn_model, esp32_engine = load_esp32_engine(backend)
+        ESP32_BACKEND = backend
+        # Outputs of the previous model are stale; the generation bump also
+        # keeps in-flight predictions from repopulating the cache
+        esp32_model_generation += 1
+        esp32_cache.clear()
         # Uncomment and use scaler if needed
         # esp32_scaler = pickle.load(open("esp32_scaler.pkl", "rb"))
-        esp32_label_encoder = pickle.load(open("label_encoder_v3.pkl", "rb"))
-        print("✅ ESP32 CNN model (glove_cnn_model.keras) loaded successfully!")
-        print("✅ ESP32 label encoder (label_encoder_v3.pkl) loaded successfully!")
+        esp32_label_encoder = load_class_list(ESP32_CLASSES)
+        print(f"✅ ESP32 CNN model ({ESP32_MODEL_PATHS[backend]}, backend={backend}) loaded successfully!")
+        print(f"✅ ESP32 classes ({ESP32_CLASSES}, {len(esp32_label_encoder)} letters) loaded successfully!")
+        if ESP32_BATCHING:
+            if esp32_batcher is not None:
+                esp32_batcher.stop()
+            esp32_batcher = MicroBatcher(
+                lambda batch: esp32_engine(batch),
+                max_batch_size=ESP32_MAX_BATCH,
+                max_wait_ms=ESP32_BATCH_WINDOW_MS,
+                name="esp32_batcher",
+            ).start()
+            print(f"✅ ESP32 micro-batching enabled ({ESP32_BATCH_WINDOW_MS} ms window, max {ESP32_MAX_BATCH})")
     except Exception as e:
         print(f"⚠️  ESP32 model or label encoder loading failed: {e}")
-        print("Using placeholder prediction function")
+        if ESP32_PLACEHOLDER:
+            print("Using placeholder prediction function")
+        # Surface the failure so the registry (and /health) reports it
+        raise
+    load_esp32_sequence_model()
+
+def glove_cache_key(reading):
+    """Cache key for one (5,) reading under the current model, or None when caching is off"""
+    if not ESP32_CACHE:
+        return None
+    return esp32_model_generation, quantized_key(reading, ESP32_CACHE_STEP)
 
 def predict_esp32_letter(sensor_data):
     """
@@ -60,31 +241,110 @@ def predict_esp32_letter(sensor_data):
         sensor_array = np.array(sensor_data, dtype=np.float32).reshape(1, 5, 1)
         
         # If you have a trained CNN model, use it here
-        if esp32_cnn_model is not None:
-            # Pass raw sensor_array directly to the model (no normalization)
-            prediction = esp32_cnn_model.predict(sensor_array, verbose=0)
-            if esp32_label_encoder is not None:
-                letter = esp32_label_encoder.inverse_transform([np.argmax(prediction)])[0]
-                confidence = np.max(prediction)
-            else:
-                predicted_index = np.argmax(prediction)
-                if predicted_index < 26:
-                    letter = chr(65 + predicted_index)
+        if esp32_engine is not None:
+            key = glove_cache_key(sensor_array.ravel())
+            prediction = esp32_cache.get(key) if key is not None else None
+            if prediction is None:
+                # Pass raw sensor_array directly to the model (no normalization)
+                if esp32_batcher is not None:
+                    # Coalesced with concurrent requests; returns this sample's row
+                    prediction = esp32_batcher.predict(sensor_array[0])
                 else:
-                    letter = 'X'
-                confidence = np.max(prediction)
+                    prediction = esp32_engine(sensor_array)[0]
+                if key is not None:
+                    esp32_cache.put(key, prediction)
+            letter, confidence = decode_esp32_row(prediction)
             return letter, confidence, True
-        else:
+        elif ESP32_PLACEHOLDER:
             # Placeholder prediction function - replace with your actual logic
-            print(f"🔍 Using placeholder prediction with sensor data: {sensor_data}")
             letter, confidence = placeholder_esp32_prediction(sensor_data)
-            print(f"🎯 Placeholder Prediction: {letter} (confidence: {confidence:.3f})")
+            esp32_log.debug("Placeholder prediction %s (%.3f) for %s", letter, confidence, sensor_data)
             return letter, confidence, True
+        else:
+            return None, 0.0, False
         
     except Exception as e:
         print(f"Error in ESP32 prediction: {e}")
         return None, 0.0, False
 
+def decode_esp32_row(prediction):
+    """(letter, confidence) for one row of glove model output"""
+    if esp32_label_encoder is not None:
+        return esp32_label_encoder.decode(prediction)
+    predicted_index = np.argmax(prediction)
+    letter = chr(65 + predicted_index) if predicted_index < 26 else 'X'
+    return letter, np.max(prediction)
+
+def submit_esp32_letter(sensor_data):
+    """
+    Non-blocking predict_esp32_letter for event-loop servers: a Future of
+    (prediction, confidence, detected), answered from the cache or by the
+    micro-batcher. None when neither applies (no model or batching off);
+    run predict_esp32_letter on a worker thread instead.
+    """
+    if esp32_engine is None or esp32_batcher is None:
+        return None
+    result = Future()
+    try:
+        sensor_array = np.array(sensor_data, dtype=np.float32).reshape(5, 1)
+    except (ValueError, TypeError) as e:
+        # Same answer as predict_esp32_letter for a malformed reading
+        print(f"Invalid ESP32 sensor data: {e}")
+        result.set_result((None, 0.0, False))
+        return result
+    key = glove_cache_key(sensor_array.ravel())
+    cached = esp32_cache.get(key) if key is not None else None
+    if cached is not None:
+        result.set_result((*decode_esp32_row(cached), True))
+        return result
+
+    def finish(row_future):
+        try:
+            row = row_future.result()
+            if key is not None:
+                esp32_cache.put(key, row)
+            result.set_result((*decode_esp32_row(row), True))
+        except Exception as e:
+            print(f"Error in ESP32 prediction: {e}")
+            result.set_result((None, 0.0, False))
+
+    esp32_batcher.submit(sensor_array).add_done_callback(finish)
+    return result
+
+def predict_esp32_batch(readings):
+    """
+    Predict ASL letters for a batch of ESP32 readings in one forward pass
+    readings: (N, 5) array of raw sensor values
+    Returns: (letters list, confidences (N,) array); letters are None
+             when no model is loaded and the placeholder is off
+    """
+    readings = np.asarray(readings, dtype=np.float32)
+    if esp32_engine is None:
+        if not ESP32_PLACEHOLDER:
+            return [None] * len(readings), np.zeros(len(readings), dtype=np.float32)
+        results = [placeholder_esp32_prediction(list(r)) for r in readings]
+        return [r[0] for r in results], np.array([r[1] for r in results], dtype=np.float32)
+
+    if ESP32_CACHE:
+        # Only readings whose quantized bucket isn't cached hit the model
+        keys = [glove_cache_key(r) for r in readings]
+        rows = [esp32_cache.get(k) for k in keys]
+        misses = [i for i, row in enumerate(rows) if row is None]
+        if misses:
+            fresh = esp32_engine(readings[misses].reshape(-1, 5, 1))
+            for i, row in zip(misses, fresh):
+                rows[i] = row
+                esp32_cache.put(keys[i], row)
+        probs = np.stack(rows)
+    else:
+        probs = esp32_engine(readings.reshape(-1, 5, 1))
+    if esp32_label_encoder is not None:
+        letters, confidences = esp32_label_encoder.decode(probs)
+        return list(letters), confidences
+    indices = np.argmax(probs, axis=1)
+    confidences = probs[np.arange(len(indices)), indices]
+    return [chr(65 + i) if i < 26 else 'X' for i in indices], confidences
+
 def placeholder_esp32_prediction(sensor_data):
     """
     Placeholder function for ESP32 prediction
@@ -116,178 +376,375 @@ def get_audio_file_path(letter):
         return f"/audio/{letter.upper()}.mp3"
     return None
 
-# --- Feature helpers --------------------------------------------------------
+# --- Model registry ---------------------------------------------------
 
-def landmark_angles(landmarks):
-    """
-    Compute 2 joint angles per finger from world landmarks.
-    Returns a (10,) array of angles in degrees.
-    """
-    fingers = {
-        'thumb':   [(1,2,3),(2,3,4)],
-        'index':   [(5,6,7),(6,7,8)],
-        'middle':  [(9,10,11),(10,11,12)],
-        'ring':    [(13,14,15),(14,15,16)],
-        'pinky':   [(17,18,19),(18,19,20)],
-    }
-    coords = np.array([[p.x, p.y, p.z] for p in landmarks], dtype=np.float32)
-    angles = []
-    for joints in fingers.values():
-        for a, b, c in joints:
-            v1 = coords[a] - coords[b]
-            v2 = coords[c] - coords[b]
-            cosang = np.dot(v1, v2) / (np.linalg.norm(v1)*np.linalg.norm(v2) + 1e-6)
-            angles.append(degrees(acos(np.clip(cosang, -1, 1))))
-    return np.array(angles, dtype=np.float32)
-
-def tip_distances(landmarks):
-    """
-    Compute Euclidean distance from each fingertip to the wrist.
-    Returns a (5,) array of distances.
-    """
-    pts = np.array([[p.x, p.y, p.z] for p in landmarks], dtype=np.float32)
-    wrist = pts[0]
-    tips  = pts[[4, 8, 12, 16, 20]]
-    return np.linalg.norm(tips - wrist, axis=1)
-
-def hull_area(landmarks, w, h):
-    """
-    Compute 2D convex-hull area of the hand projection.
-    landmarks: normalized image-space landmarks
-    w,h: frame width & height in pixels
-    """
-    pts = np.array([[int(p.x*w), int(p.y*h)] for p in landmarks], dtype=np.int32)
-    hull = cv2.convexHull(pts)
-    return cv2.contourArea(hull)
-
-def get_hand_bbox(landmarks, frame_shape, pad=0.2):
-    """
-    Return a padded bounding box (x1,y1,x2,y2) in pixel coords
-    around the hand landmarks.
-    """
-    h, w = frame_shape[:2]
-    xs = [p.x for p in landmarks]
-    ys = [p.y for p in landmarks]
-    x1 = int(max(0, (min(xs) - pad) * w))
-    x2 = int(min(w, (max(xs) + pad) * w))
-    y1 = int(max(0, (min(ys) - pad) * h))
-    y2 = int(min(h, (max(ys) + pad) * h))
-    return x1, y1, x2, y2
-
-# --- Global variables for models ---------------------------------------------------
-
-# Load models once when the app starts
-main_model = None
-scaler = None
-le = None
-closed_cnn = None
-closed_le = None
-bw_cnn = None
-bw_le = None
-hands = None
-
-def load_models():
-    """Load all models and preprocessors"""
-    global main_model, scaler, le, closed_cnn, closed_le, bw_cnn, bw_le, hands
-    
-    print("Loading ASL recognition models...")
-    
-    # Load main landmark-based model + preprocessor
-    main_model = tf.keras.models.load_model("asl_letter_model_v3.keras")
-    scaler = pickle.load(open("scaler_v3.pkl", "rb"))
-    le = pickle.load(open("label_encoder_v3.pkl", "rb"))
-
-    # Load closed-fist refiner
-    closed_cnn = tf.keras.models.load_model("closed_fist_refiner.keras")
-    closed_le = pickle.load(open("closed_fist_le.pkl", "rb"))
-
-    # Load B-vs-W refiner
-    bw_cnn = tf.keras.models.load_model("bw_refiner.keras")
-    bw_le = pickle.load(open("bw_le.pkl", "rb"))
-
-    # Mediapipe hands (world landmarks)
-    mp_hands = mp.solutions.hands
-    hands = mp_hands.Hands(
+def load_keras_engine(path, name):
+    """Load a Keras model and wrap it in a warmed-up InferenceEngine"""
+    import tensorflow as tf
+    from inference import build_engine
+    return build_engine(tf.keras.models.load_model(path), name=name)
+
+def load_pickle(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+@functools.lru_cache(maxsize=None)
+def load_labels(path):
+    """LabelLookup for a pickled LabelEncoder, shared by every pipeline using it"""
+    return LabelLookup.from_encoder(load_pickle(path))
+
+def load_class_list(path):
+    """LabelLookup for a JSON list of class names"""
+    with open(path) as f:
+        return LabelLookup(json.load(f))
+
+def load_refiner(model_path, le_path, name):
+    """(RefinerStage, LabelLookup): crops from concurrent requests are batched"""
+    from refiners import RefinerStage
+    engine = load_keras_engine(model_path, name)
+    return RefinerStage(engine, name, REFINER_MAX_BATCH, REFINER_BATCH_WINDOW_MS), load_labels(le_path)
+
+def load_hands():
+    """Mediapipe hands (world landmarks)"""
+    import mediapipe as mp
+    return mp.solutions.hands.Hands(
         static_image_mode=True,  # Use static mode for single images
         model_complexity=1,
         max_num_hands=1,
         min_detection_confidence=0.5,
         min_tracking_confidence=0.5
     )
-    
-    # Load ESP32 models
-    load_esp32_models()
-    
-    print("✅ All models loaded successfully!")
 
-def predict_asl_letter(image_data):
+def load_vision_modules():
+    """Import OpenCV and the frame/feature helpers ahead of the first request"""
+    import cv2
+    import features
+    import frames
+    return cv2.__version__
+
+# Eager artifacts load concurrently in the background; refiners load on
+# first cascade use. /health reports 503 until every required eager one is
+# ready; the refiners are optional (the main model's answer is kept without them).
+models = ModelRegistry(max_workers=4)
+models.register('main_model', lambda: load_keras_engine("asl_letter_model_v3.keras", "main_model"))
+# StandardScaler folded to x * a + b (export_scaler.py), no sklearn per frame
+models.register('scaler', lambda: load_scaler("scaler_v3_affine.npz", "scaler_v3.pkl"))
+models.register('label_encoder', lambda: load_labels("label_encoder_v3.pkl"))
+models.register('hands', load_hands)
+models.register('vision', load_vision_modules)
+models.register('glove', load_esp32_models)
+models.register('closed_refiner', lambda: load_refiner("closed_fist_refiner.keras", "closed_fist_le.pkl", "closed_cnn"), lazy=True, required=False)
+models.register('bw_refiner', lambda: load_refiner("bw_refiner.keras", "bw_le.pkl", "bw_cnn"), lazy=True, required=False)
+
+# Glove-only serving (serve_glove.py) never loads these, so TensorFlow,
+# MediaPipe and OpenCV are never imported
+WEBCAM_ARTIFACTS = ('main_model', 'scaler', 'label_encoder', 'hands', 'vision', 'closed_refiner', 'bw_refiner')
+WEBCAM_ENDPOINTS = ('predict', 'predict_frame', 'ws_predict')
+GLOVE_ONLY = False
+
+def load_models(block=True, glove_only=False):
+    """
+    Start loading all models and preprocessors.
+    block: wait until the required models are ready (False lets the server
+           start answering /health while they load)
+    glove_only: load only the glove model; the webcam endpoints answer 404
+    """
+    global GLOVE_ONLY
+    GLOVE_ONLY = glove_only
+    if glove_only:
+        models.disable(*WEBCAM_ARTIFACTS)
+    print("Loading ASL recognition models...")
+    models.start()
+    if block:
+        if models.wait_until_ready():
+            print("✅ All models loaded successfully!")
+        else:
+            print("⚠️  Some required models failed to load, see /health")
+
+# Ranked candidates returned with ?candidates=1 (and kept for skipped frames)
+ASL_TOP_K = 5
+
+# Refiner batching: crops from concurrent requests share one forward pass
+REFINER_MAX_BATCH = 16
+REFINER_BATCH_WINDOW_MS = 2.0
+
+# Refiner results keyed on the quantized, standardized 79-value feature vector
+REFINER_CACHE_SIZE = 1024
+REFINER_CACHE_TTL_S = 2.0
+REFINER_CACHE_STEP = 0.25   # bucket width in standard deviations
+refiner_cache = TTLCache(REFINER_CACHE_SIZE, REFINER_CACHE_TTL_S, name="refiner_cache")
+
+# Hand-ROI tracking for HTTP sessions: each session gets its own
+# tracking-mode Hands, and after a hit MediaPipe only sees a padded crop
+# around the hand, downscaled to ROI_SIZE, falling back to the full frame
+# once the hand is lost. Each tracker holds a MediaPipe graph, so idle
+# ones are closed and at most ROI_MAX_SESSIONS are kept.
+ROI_TRACKING = True
+ROI_SIZE = 256
+ROI_PAD = 0.25              # padding around the hand, as a fraction of its size
+ROI_SESSION_TTL_S = 10.0
+ROI_MAX_SESSIONS = 64
+roi_trackers = TTLCache(ROI_MAX_SESSIONS, ROI_SESSION_TTL_S, name="roi_trackers",
+                        on_evict=lambda roi: roi.close())
+
+# Adaptive frame skipping: while a session's hand is still and its last
+# FRAME_SKIP_AGREE_K predictions agree, reuse the prediction instead of
+# running the main model and refiners (landmarks are still computed)
+FRAME_SKIP = True
+FRAME_SKIP_MOTION = 0.03     # mean landmark motion, as a fraction of hand size
+FRAME_SKIP_AGREE_K = 3
+FRAME_SKIP_MAX_IN_ROW = 10   # re-run in full at least this often
+frame_samplers = TTLCache(4096, ROI_SESSION_TTL_S, name="frame_samplers")
+frame_skip_stats = SkipStats()
+
+def get_frame_sampler(session_id):
+    """Per-session StabilitySampler, or None when skipping is off or there is no session"""
+    if not FRAME_SKIP or session_id is None:
+        return None
+    sampler = frame_samplers.get(session_id)
+    if sampler is None:
+        sampler = StabilitySampler(FRAME_SKIP_MOTION, FRAME_SKIP_AGREE_K, FRAME_SKIP_MAX_IN_ROW, frame_skip_stats)
+    frame_samplers.put(session_id, sampler)
+    return sampler
+
+def get_refiner(name):
+    """(RefinerStage, LabelLookup) for a refiner, or None if it can't be loaded"""
+    try:
+        return models.get(name)
+    except RuntimeError:
+        return None
+
+def predict_asl_letter(image_data, session_id=None, candidates=None):
     """
     Predict ASL letter from image data
     image_data: base64 encoded image string
+    candidates: see predict_asl_frame
     Returns: (prediction, confidence, detected)
     """
+    from frames import decode_base64_frame
     try:
-        # Decode base64 image
-        image_data = image_data.split(',')[1] if ',' in image_data else image_data
-        image_bytes = base64.b64decode(image_data)
-        image = Image.open(io.BytesIO(image_bytes))
-        
-        # Convert to OpenCV format
-        frame = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-        frame = cv2.flip(frame, 1)  # Mirror the image
-        
-        h_img, w_img = frame.shape[:2]
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        res = hands.process(rgb)
+        with stage_ms.span('decode'):
+            rgb = decode_base64_frame(image_data)
+    except Exception as e:
+        print(f"Error decoding image: {e}")
+        return None, 0.0, False
+    return predict_asl_frame(rgb, session_id=session_id, candidates=candidates)
+
+def run_refiner(name, refiner, rgb, img_lms):
+    """
+    Crop the hand from the unmirrored RGB frame and run a refiner CNN.
+    img_lms are mirrored image landmarks; only the small crop is flipped
+    and colour-converted, never the full frame.
+    Returns: refined letter, or None if the crop is empty
+    """
+    import cv2
+    from features import get_hand_bbox
+    from refiners import REFINER_INPUT_SIZE
+    stage, labels = refiner
+    w = rgb.shape[1]
+    x1,y1,x2,y2 = get_hand_bbox(img_lms, rgb.shape)
+    crop = rgb[y1:y2, w - x2:w - x1]  # mirrored bbox mapped back onto the raw frame
+    if not crop.size:
+        return None
+    with stage_ms.span('convert'):
+        crop = cv2.resize(crop, (REFINER_INPUT_SIZE, REFINER_INPUT_SIZE))
+        crop = cv2.flip(crop, 1)
+        crop = cv2.cvtColor(crop, cv2.COLOR_RGB2BGR)  # refiners were trained on BGR crops
+    with stage_ms.span('refiner'):
+        subp = stage(crop)  # uint8 in; scaled to float32 [0, 1] inside the batch
+    if name == 'bw_refiner':
+        return 'W' if subp[0] > 0.5 else 'B'
+    return labels.decode(subp)[0]
+
+def get_roi_tracker(session_id):
+    """Per-session ROITracker, or None when ROI tracking is off or there is no session"""
+    if not ROI_TRACKING or session_id is None:
+        return None
+    from roi import ROITracker
+    from streaming import create_tracking_hands
+    roi = roi_trackers.get(session_id)
+    if roi is None:
+        roi = ROITracker(create_tracking_hands(), ROI_SIZE, ROI_PAD)
+    roi_trackers.put(session_id, roi)  # refresh the idle timeout
+    return roi
+
+def detect_landmarks(rgb, tracker=None, session_id=None):
+    """
+    Run MediaPipe on a frame: the WebSocket session's tracker, else the
+    HTTP session's ROI tracker, else the shared static-image instance
+    Returns: (world (21, 3), img (21, 3)) unmirrored, or None if no hand
+    """
+    if tracker is not None:
+        # Tracking-mode Hands already skips palm detection between frames
+        res = tracker.process(rgb)
+    else:
+        roi = get_roi_tracker(session_id)
+        if roi is not None:
+            return roi.process(rgb, models.get('hands'))
+        res = models.get('hands').process(rgb)
+    if not res.multi_hand_world_landmarks:
+        return None
+    return res.multi_hand_world_landmarks[0].landmark, res.multi_hand_landmarks[0].landmark
 
-        if not res.multi_hand_world_landmarks:
+def predict_asl_frame(rgb, tracker=None, session_id=None, candidates=None):
+    """
+    Predict ASL letter from a decoded frame
+    rgb: (H, W, 3) uint8 RGB array as captured (not yet mirrored)
+    tracker: per-session MediaPipe Hands (tracking mode); defaults to the
+             shared static-image instance
+    session_id: namespaces the refiner cache so clients never share results,
+                and keys the ROI tracker and frame sampler; without one the
+                cache is bypassed
+    candidates: optional list, filled with the main model's ranked
+                (letter, probability) pairs (ASL_TOP_K of them)
+    Returns: (prediction, confidence, detected)
+    """
+    from features import extract_features, mirror_landmarks
+    try:
+        # MediaPipe takes the decoded RGB frame directly: no flip, no BGR round-trip
+        h_img, w_img = rgb.shape[:2]
+        with stage_ms.span('mediapipe'):
+            found = detect_landmarks(rgb, tracker, session_id)
+        sampler = get_frame_sampler(session_id)
+
+        if found is None:
+            if sampler is not None:
+                sampler.reset()
+            frames_total.inc('no_hand')
             return None, 0.0, False
 
-        world_lms = res.multi_hand_world_landmarks[0].landmark
+        # Mirror the landmarks instead of the frame (the models were trained on mirrored frames)
+        with stage_ms.span('convert'):
+            world_lms = mirror_landmarks(found[0], image_space=False)
+            img_lms = mirror_landmarks(found[1], image_space=True)
+
+        # Still hand and a settled prediction: skip the models
+        if sampler is not None and (cached := sampler.check(img_lms)) is not None:
+            frames_total.inc('skipped')
+            if candidates is not None:
+                candidates.extend(cached[2])
+            return cached[0], cached[1], True
         
         # Build feature vector
-        coords = np.array([[p.x,p.y,p.z] for p in world_lms], dtype=np.float32).flatten()
-        angs = landmark_angles(world_lms)
-        dists = tip_distances(world_lms)
-        img_lms = res.multi_hand_landmarks[0].landmark
-        area = hull_area(img_lms, w_img, h_img)
-        feat = np.concatenate([coords, angs, dists, [area]]).reshape(1, -1)
+        with stage_ms.span('features'):
+            feat = extract_features(world_lms, img_lms, w_img, h_img).reshape(1, -1)
 
         # Main prediction
-        feat_s = scaler.transform(feat)
-        probs = main_model.predict(feat_s, verbose=0)[0]
-        pred = le.inverse_transform([np.argmax(probs)])[0]
-        conf = np.max(probs)
+        with stage_ms.span('scaler'):
+            feat_s = models.get('scaler').transform(feat)
+        with stage_ms.span('main_model'):
+            probs = models.get('main_model')(feat_s)[0]
+            labels = models.get('label_encoder')
+            pred, conf = labels.decode(probs)
+            ranked = labels.top_k(probs, ASL_TOP_K) if candidates is not None or sampler is not None else []
+            if candidates is not None:
+                candidates.extend(ranked)
 
         # Ambiguous sets
         ambig_closed = {'A','E','O','S','M','N','T'}
         ambig_bw = {'B','W'}
 
-        # Cascade to refiners if needed
+        # Cascade to refiners if needed (loaded on first use)
+        refiner_name = None
         if pred in ambig_closed and conf < 0.9:
-            x1,y1,x2,y2 = get_hand_bbox(img_lms, frame.shape)
-            crop = frame[y1:y2, x1:x2]
-            if crop.size:
-                crop = cv2.resize(crop, (128,128)) / 255.0
-                subp = closed_cnn.predict(crop[np.newaxis,...], verbose=0)[0]
-                pred = closed_le.inverse_transform([np.argmax(subp)])[0]
-
+            refiner_name = 'closed_refiner'
         elif pred in ambig_bw and conf < 0.9:
-            x1,y1,x2,y2 = get_hand_bbox(img_lms, frame.shape)
-            crop = frame[y1:y2, x1:x2]
-            if crop.size:
-                crop = cv2.resize(crop, (128,128)) / 255.0
-                subp = bw_cnn.predict(crop[np.newaxis,...], verbose=0)[0][0]
-                pred = 'W' if subp > 0.5 else 'B'
+            refiner_name = 'bw_refiner'
+
+        if refiner_name is not None:
+            # A held pose gives near-identical features: reuse the refined label
+            key = None
+            if session_id is not None:
+                key = (session_id, refiner_name, quantized_key(feat_s[0], REFINER_CACHE_STEP))
+            cached = refiner_cache.get(key) if key is not None else None
+            if cached is not None:
+                pred = cached
+                cascade_total.inc(refiner_name, 'cache_hit')
+            elif (refiner := get_refiner(refiner_name)):
+                refined = run_refiner(refiner_name, refiner, rgb, img_lms)
+                if refined is not None:
+                    cascade_total.inc(refiner_name, 'confirmed' if refined == pred else 'changed')
+                    pred = refined
+                    if key is not None:
+                        refiner_cache.put(key, refined)
+                else:
+                    cascade_total.inc(refiner_name, 'empty_crop')
+            else:
+                cascade_total.inc(refiner_name, 'unavailable')
 
+        if sampler is not None:
+            sampler.update(pred, conf, ranked)
+        frames_total.inc('predicted')
         return pred, conf, True
         
     except Exception as e:
         print(f"Error in prediction: {e}")
+        frames_total.inc('error')
         return None, 0.0, False
 
 # --- Flask routes ---------------------------------------------------
 
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+    if GLOVE_ONLY and request.endpoint in WEBCAM_ENDPOINTS:
+        return jsonify({'error': 'This server only serves the ESP32 glove endpoints'}), 404
+
+@app.after_request
+def count_request(response):
+    """Request counter and latency by endpoint; outcome from the status code"""
+    endpoint = request.endpoint or 'unknown'
+    code = response.status_code
+    outcome = 'ok' if code < 400 else 'busy' if code == 503 else 'client_error' if code < 500 else 'server_error'
+    requests_total.inc(endpoint, outcome)
+    if 'request_start' in g:
+        request_ms.observe(endpoint, (time.perf_counter() - g.request_start) * 1000.0)
+    return response
+
+def json_response(body, status=200):
+    """jsonify, timed as the 'json' stage"""
+    with stage_ms.span('json'):
+        response = jsonify(body)
+    return response, status
+
+def asl_response(prediction, confidence, detected, candidates=None):
+    """
+    JSON body shared by the webcam prediction endpoints
+    candidates: ranked (letter, probability) pairs, included when given
+    """
+    if detected:
+        response = {
+            'detected': True,
+            'prediction': prediction,
+            'confidence': float(confidence),
+            'audio_file': get_audio_file_path(prediction)
+        }
+        if candidates is not None:
+            response['candidates'] = [{'letter': l, 'confidence': p} for l, p in candidates]
+        return response
+    return {
+        'detected': False,
+        'prediction': None,
+        'confidence': 0.0,
+        'audio_file': None
+    }
+
+def wants_candidates():
+    """?candidates=1 adds the ranked candidate list to webcam responses"""
+    return request.args.get('candidates', '').lower() in ('1', 'true', 'yes')
+
+def client_session_id():
+    """
+    Session for ROI tracking, frame skipping and the refiner cache: the
+    X-Session-Id header, else one derived from the client address and
+    User-Agent so clients that don't send the header still get a session
+    """
+    session_id = request.headers.get('X-Session-Id')
+    if session_id:
+        return session_id
+    client = f"{request.remote_addr}|{request.headers.get('User-Agent', '')}"
+    return "anon-" + hashlib.sha1(client.encode()).hexdigest()[:16]
+
 @app.route('/predict', methods=['POST'])
 def predict():
     """Endpoint for ASL letter prediction from webcam"""
@@ -297,28 +754,212 @@ def predict():
             return jsonify({'error': 'No image data provided'}), 400
         
         image_data = data['image']
-        prediction, confidence, detected = predict_asl_letter(image_data)
-        
-        if detected:
-            audio_file = get_audio_file_path(prediction)
-            return jsonify({
-                'detected': True,
-                'prediction': prediction,
-                'confidence': float(confidence),
-                'audio_file': audio_file
-            })
-        else:
-            return jsonify({
-                'detected': False,
-                'prediction': None,
-                'confidence': 0.0,
-                'audio_file': None
-            })
+        candidates = [] if wants_candidates() else None
+        prediction, confidence, detected = predict_asl_letter(image_data, client_session_id(), candidates)
+        return json_response(asl_response(prediction, confidence, detected, candidates))
             
     except Exception as e:
         print(f"Error in /predict endpoint: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/predict/frame', methods=['POST'])
+def predict_frame():
+    """
+    Endpoint for ASL letter prediction from a binary webcam frame.
+    Body: raw JPEG/PNG bytes (Content-Type: image/jpeg, image/png), or packed
+    RGB bytes (Content-Type: application/octet-stream) with X-Frame-Width and
+    X-Frame-Height headers.
+    """
+    try:
+        data = request.get_data(cache=False)
+        if not data:
+            return jsonify({'error': 'No frame data provided'}), 400
+
+        from frames import decode_frame_bytes
+        try:
+            with stage_ms.span('decode'):
+                rgb = decode_frame_bytes(
+                    data,
+                    request.content_type,
+                    request.headers.get('X-Frame-Width'),
+                    request.headers.get('X-Frame-Height'),
+                )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        candidates = [] if wants_candidates() else None
+        prediction, confidence, detected = predict_asl_frame(rgb, session_id=client_session_id(),
+                                                             candidates=candidates)
+        return json_response(asl_response(prediction, confidence, detected, candidates))
+
+    except Exception as e:
+        print(f"Error in /predict/frame endpoint: {e}")
+        return jsonify({'error': str(e)}), 500
+
+@sock.route('/ws/predict')
+def ws_predict(ws):
+    """
+    Streaming webcam recognition. Send frames as binary JPEG/PNG messages
+    (or base64 data URLs as text); a prediction is pushed back for the
+    newest frame each time inference finishes, stale frames are dropped.
+    """
+    from streaming import StreamSession
+    StreamSession(ws, predict_asl_frame, asl_response).run()
+
+def get_esp32_device_id(data, headers=None):
+    """Glove id from the JSON body ('device' / 'device_id') or X-Device-Id header"""
+    headers = request.headers if headers is None else headers
+    device_id = data.get('device') or data.get('device_id') or headers.get('X-Device-Id')
+    return str(device_id) if device_id else ESP32_DEFAULT_DEVICE
+
+def esp32_response(session, sensor_data, prediction, confidence, detected, source='snapshot'):
+    """
+    Run one prediction through the device's smoothing policy and build the
+    response. The response is also stored as the device's latest.
+    """
+    response = {
+        'timestamp': datetime.now().isoformat(),
+        'device': session.device_id,
+        'sensor_data': sensor_data,
+        'detected': detected
+    }
+    if detected:
+        stable, play_audio = session.update(prediction, confidence)
+        response.update({
+            'prediction': prediction,
+            'stable_prediction': stable,
+            'confidence': float(confidence),
+            'source': source,
+            'audio_file': get_audio_file_path(stable) if play_audio else None,
+            'play_audio': play_audio
+        })
+    else:
+        response.update({
+            'prediction': None,
+            'stable_prediction': None,
+            'confidence': 0.0,
+            'audio_file': None,
+            'play_audio': False
+        })
+    session.latest = response
+    publish_esp32_event(session, response)
+    return response
+
+def publish_esp32_event(session, response):
+    """Push a response to SSE subscribers if audio fired or the stable letter changed to a new letter"""
+    stable = response['stable_prediction']
+    with session.lock:
+        changed = response['play_audio'] or (stable is not None and stable != session.last_pushed)
+        if changed and stable is not None:
+            session.last_pushed = stable
+    if changed:
+        esp32_events.publish(session.device_id, response)
+
+def parse_esp32_reading(data):
+    """
+    Pull the 5 sensor values out of an /esp32/predict JSON body.
+    Returns: (sensor_data, None) or (None, error message)
+    """
+    # Extract sensor data
+    sensor_data = None
+    if 'sensor_values' in data:
+        sensor_data = data['sensor_values']
+    elif 'sensors' in data:
+        sensor_data = data['sensors']
+    elif 'data' in data:
+        sensor_data = data['data']
+    elif all(k in data for k in ['thumb', 'pointer', 'middle', 'ring', 'pinky']):
+        # If ESP32 sends JSON with keys: pinky, ring, middle, pointer, thumb
+        # Extract and reorder to: thumb, pointer, middle, ring, pinky
+        try:
+            sensor_data = [
+                float(data['thumb']),    # thumb
+                float(data['pointer']), # pointer
+                float(data['middle']),  # middle
+                float(data['ring']),    # ring
+                float(data['pinky'])    # pinky
+            ]
+        except (ValueError, TypeError) as e:
+            return None, f'Invalid sensor value type: {e}'
+    else:
+        return None, 'No sensor data found or payload format is incorrect. Expected one of: `sensor_values`, `sensors`, `data`, OR a JSON object with keys `thumb`, `pointer`, `middle`, `ring`, `pinky`.'
+    
+    # Validate sensor data
+    if not isinstance(sensor_data, list) or len(sensor_data) != 5:
+        return None, f'Expected 5 sensor values, got {len(sensor_data) if isinstance(sensor_data, list) else "non-list"}'
+    try:
+        sensor_data = [float(value) for value in sensor_data]
+    except (ValueError, TypeError) as e:
+        return None, f'Invalid sensor value type: {e}'
+    if not all(np.isfinite(sensor_data)):
+        return None, 'Sensor values must be finite numbers'
+    
+    # Reorder sensor_data if it is in [pinky, ring, middle, index, thumb] order
+    # Assume incoming order is [pinky, ring, middle, index, thumb]
+    sensor_data = [
+        sensor_data[0],  # thumb
+        sensor_data[1],  # index
+        sensor_data[2],  # middle
+        sensor_data[3],  # ring
+        sensor_data[4],  # pinky
+    ]
+    return sensor_data, None
+
+def predict_esp32_reading(device_id, sensor_data):
+    """
+    Full /esp32/predict path for one reading: sequence window when
+    available, else this snapshot, then the device's smoothing policy.
+    Between sequence windows (stride > 1) the last window's result is
+    repeated without touching the smoothing state.
+    Returns: response dict (also stored as the device's latest)
+    """
+    session = esp32_sessions.get(device_id)
+    source = 'snapshot'
+    prediction = None
+    if esp32_sequence is not None:
+        prediction, confidence, warm = esp32_sequence.push(session, sensor_data)
+        if prediction is None and warm and session.latest is not None:
+            return dict(session.latest, timestamp=datetime.now().isoformat(), sensor_data=sensor_data,
+                        audio_file=None, play_audio=False)
+    if prediction is not None:
+        detected, source = True, 'sequence'
+    else:
+        prediction, confidence, detected = predict_esp32_letter(sensor_data)
+    return finish_esp32_reading(session, sensor_data, prediction, confidence, detected, source)
+
+def esp32_loading():
+    """True while the glove model is still pending or loading"""
+    return models.state('glove') in (PENDING, LAZY, LOADING)
+
+def esp32_loading_response():
+    response = jsonify({'error': 'Glove model is still loading, retry shortly'})
+    response.headers['Retry-After'] = str(ESP32_RETRY_AFTER_S)
+    return response, 503
+
+def predict_esp32_readings(items):
+    """
+    predict_esp32_reading for a list of (device_id, sensor_data) pairs:
+    snapshot readings share one forward pass (through the glove cache),
+    then go through their devices' smoothing in order.
+    Returns: list of response dicts
+    """
+    if esp32_sequence is not None:
+        # The sequence window is per-device and ordered: one reading at a time
+        return [predict_esp32_reading(device_id, sensor_data) for device_id, sensor_data in items]
+    letters, confidences = predict_esp32_batch([sensor_data for _, sensor_data in items])
+    return [
+        finish_esp32_reading(esp32_sessions.get(device_id), list(sensor_data), letter, confidence,
+                             letter is not None)
+        for (device_id, sensor_data), letter, confidence in zip(items, letters, confidences)
+    ]
+
+def finish_esp32_reading(session, sensor_data, prediction, confidence, detected, source='snapshot'):
+    """Smoothing, latest/event bookkeeping and sampled logging for one prediction"""
+    response = esp32_response(session, sensor_data, prediction, confidence, detected, source)
+    if next(esp32_log_counter) % ESP32_LOG_EVERY == 0:
+        esp32_log.info("ESP32 Prediction: %s", response)
+    return response
+
 @app.route('/esp32/predict', methods=['POST'])
 def esp32_predict():
     """Endpoint for ESP32 sensor data prediction"""
@@ -329,130 +970,232 @@ def esp32_predict():
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
-        # Extract sensor data
-        sensor_data = None
-        if 'sensor_values' in data:
-            sensor_data = data['sensor_values']
-        elif 'sensors' in data:
-            sensor_data = data['sensors']
-        elif 'data' in data:
-            sensor_data = data['data']
-        elif all(k in data for k in ['thumb', 'pointer', 'middle', 'ring', 'pinky']):
-            # If ESP32 sends JSON with keys: pinky, ring, middle, pointer, thumb
-            # Extract and reorder to: thumb, pointer, middle, ring, pinky
-            try:
-                sensor_data = [
-                    float(data['thumb']),    # thumb
-                    float(data['pointer']), # pointer
-                    float(data['middle']),  # middle
-                    float(data['ring']),    # ring
-                    float(data['pinky'])    # pinky
-                ]
-            except (ValueError, TypeError) as e:
-                return jsonify({'error': f'Invalid sensor value type: {e}'}), 400
-        else:
-            return jsonify({'error': 'No sensor data found or payload format is incorrect. Expected one of: `sensor_values`, `sensors`, `data`, OR a JSON object with keys `thumb`, `pointer`, `middle`, `ring`, `pinky`.'}), 400
-        
-        # Validate sensor data
-        if not isinstance(sensor_data, list) or len(sensor_data) != 5:
-            return jsonify({'error': f'Expected 5 sensor values, got {len(sensor_data) if isinstance(sensor_data, list) else "non-list"}'}), 400
-        
-        # Reorder sensor_data if it is in [pinky, ring, middle, index, thumb] order
-        if isinstance(sensor_data, list) and len(sensor_data) == 5:
-            # Assume incoming order is [pinky, ring, middle, index, thumb]
-            sensor_data = [
-                sensor_data[0],  # thumb
-                sensor_data[1],  # index
-                sensor_data[2],  # middle
-                sensor_data[3],  # ring
-                sensor_data[4],  # pinky
-            ]
+        sensor_data, error = parse_esp32_reading(data)
+        if error:
+            return jsonify({'error': error}), 400
+        if esp32_loading():
+            return esp32_loading_response()
         
-        # Make prediction
-        prediction, confidence, detected = predict_esp32_letter(sensor_data)
+        return json_response(predict_esp32_reading(get_esp32_device_id(data), sensor_data))
         
-        # Prepare response
+    except Exception as e:
+        print(f"Error in /esp32/predict endpoint: {e}")
+        return jsonify({'error': str(e)}), 500
+
+def parse_esp32_batch():
+    """
+    Parse a /esp32/predict_batch body.
+    JSON: {"device": id, "readings": [[v1..v5], ...] or [{"t": ms, "values": [v1..v5]}, ...]}
+    Binary (application/octet-stream): ESP32_BATCH_RECORD records, device id
+    in the X-Device-Id header or ?device= query parameter.
+    Returns: (device_id, timestamps list, (N, 5) float32 readings)
+    Raises ValueError on malformed input.
+    """
+    if request.mimetype == 'application/octet-stream':
+        body = request.get_data(cache=False)
+        if len(body) % ESP32_BATCH_RECORD.itemsize:
+            raise ValueError(f'Binary body must be a multiple of {ESP32_BATCH_RECORD.itemsize} bytes')
+        records = np.frombuffer(body, dtype=ESP32_BATCH_RECORD)
+        device_id = request.headers.get('X-Device-Id') or request.args.get('device')
+        return (str(device_id) if device_id else ESP32_DEFAULT_DEVICE,
+                records['t'].tolist(),
+                records['values'].astype(np.float32))
+
+    data = request.get_json(silent=True)
+    if not data or not isinstance(data.get('readings'), list):
+        raise ValueError('Expected a JSON object with a `readings` list')
+    timestamps, values = [], []
+    for reading in data['readings']:
+        if isinstance(reading, dict):
+            timestamps.append(reading.get('t', reading.get('timestamp')))
+            reading = reading.get('values', reading.get('sensor_values'))
+        else:
+            timestamps.append(None)
+        if not isinstance(reading, list) or len(reading) != 5:
+            raise ValueError('Each reading needs exactly 5 sensor values')
+        values.append(reading)
+    try:
+        readings = np.array(values, dtype=np.float32).reshape(-1, 5)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f'Invalid sensor value type: {e}')
+    return get_esp32_device_id(data), timestamps, readings
+
+@app.route('/esp32/predict_batch', methods=['POST'])
+def esp32_predict_batch():
+    """
+    Endpoint for batched ESP32 readings: classifies all readings in one
+    forward pass and runs them through the device's debouncer in order.
+    """
+    try:
+        try:
+            device_id, timestamps, readings = parse_esp32_batch()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        if len(readings) == 0:
+            return jsonify({'error': 'No readings provided'}), 400
+        if len(readings) > ESP32_MAX_BATCH_READINGS:
+            return jsonify({'error': f'At most {ESP32_MAX_BATCH_READINGS} readings per batch'}), 413
+        if esp32_loading():
+            return esp32_loading_response()
+        if esp32_engine is None and not ESP32_PLACEHOLDER:
+            return jsonify({'error': 'Glove model failed to load, see /health'}), 503
+
+        session = esp32_sessions.get(device_id)
+        letters, confidences = predict_esp32_batch(readings)
+        sources = ['snapshot'] * len(readings)
+        smooth = [True] * len(readings)
+        if esp32_sequence is not None:
+            for i, (letter, conf, warm) in enumerate(esp32_sequence.push_many(session, readings)):
+                if letter is not None:
+                    letters[i], confidences[i], sources[i] = letter, conf, 'sequence'
+                elif warm:
+                    smooth[i] = False  # between windows: only window results feed the debouncer
+
+        predictions = []
+        # Readings between windows leave the previous stable letter in place
+        stable = session.latest.get('stable_prediction') if session.latest else None
+        fired = None
+        for t, letter, conf, source, feed in zip(timestamps, letters, confidences, sources, smooth):
+            if feed:
+                stable, play_audio = session.update(letter, conf)
+                if play_audio:
+                    fired = stable
+            predictions.append({'t': t, 'prediction': letter, 'confidence': float(conf), 'source': source})
+
+        # Latest reflects the newest reading, with audio if any reading fired
         response = {
             'timestamp': datetime.now().isoformat(),
-            'sensor_data': sensor_data,
-            'detected': detected
+            'device': device_id,
+            'sensor_data': readings[-1].tolist(),
+            'detected': True,
+            'prediction': predictions[-1]['prediction'],
+            # A policy may release the letter after it fired earlier in the batch
+            'stable_prediction': stable if stable is not None else fired,
+            'confidence': predictions[-1]['confidence'],
+            'source': predictions[-1]['source'],
+            'audio_file': get_audio_file_path(fired) if fired else None,
+            'play_audio': fired is not None,
         }
-        
-        global esp32_last_letter, esp32_letter_count
-        if detected:
-            if prediction == esp32_last_letter:
-                esp32_letter_count += 1
-            else:
-                esp32_last_letter = prediction
-                esp32_letter_count = 1
+        session.latest = response
+        publish_esp32_event(session, response)
+        return json_response(dict(response, count=len(predictions), predictions=predictions))
 
-            if esp32_letter_count == 3:
-                audio_file = get_audio_file_path(prediction)
-                play_audio = True
-                esp32_letter_count = 0  # Reset after playing audio
-            else:
-                audio_file = None
-                play_audio = False
-
-            response.update({
-                'prediction': prediction,
-                'confidence': float(confidence),
-                'audio_file': audio_file,
-                'play_audio': play_audio
-            })
-        else:
-            response.update({
-                'prediction': None,
-                'confidence': 0.0,
-                'audio_file': None,
-                'play_audio': False
-            })
-        
-        print(f"ESP32 Prediction: {response}")
-        global latest_esp32_prediction
-        latest_esp32_prediction = response
-        return jsonify(response)
-        
     except Exception as e:
-        print(f"Error in /esp32/predict endpoint: {e}")
+        print(f"Error in /esp32/predict_batch endpoint: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/esp32/status', methods=['GET'])
-def esp32_status():
-    """Endpoint to check ESP32 integration status"""
-    return jsonify({
+def esp32_status_body():
+    """ESP32 integration status, shared by the Flask and async servers"""
+    return {
         'status': 'active',
-        'esp32_model_loaded': esp32_cnn_model is not None,
+        'esp32_model_loaded': esp32_engine is not None,
+        'esp32_backend': ESP32_BACKEND,
+        'sequence_model_loaded': esp32_sequence is not None,
         'endpoints': {
             'predict': '/esp32/predict',
-            'status': '/esp32/status'
+            'predict_batch': '/esp32/predict_batch',
+            'status': '/esp32/status',
+            'latest': '/esp32/latest?device=<id>',
+            'events': '/esp32/events?device=<id>'
         },
+        'devices': esp32_sessions.devices(),
+        'smoothing': ESP32_SMOOTHING,
         'data_format': {
             'sensor_values': '[value1, value2, value3, value4, value5]',
             'frequency': '1 per second'
-        }
-    })
+        },
+        'batching': esp32_batcher.stats() if esp32_batcher is not None else None,
+        'cache': dict(esp32_cache.stats(), enabled=ESP32_CACHE, step=ESP32_CACHE_STEP.tolist()),
+        'events': esp32_events.stats(),
+        'udp': esp32_udp.stats() if esp32_udp is not None else None
+    }
+
+@app.route('/esp32/status', methods=['GET'])
+def esp32_status():
+    """Endpoint to check ESP32 integration status"""
+    return jsonify(esp32_status_body())
 
 @app.route('/esp32/latest', methods=['GET'])
 def esp32_latest():
-    global latest_esp32_prediction
-    if latest_esp32_prediction is not None:
-        return jsonify(latest_esp32_prediction)
+    """Latest response for ?device=<id>, or for the most recently active glove"""
+    latest = esp32_sessions.latest(request.args.get('device'))
+    if latest is not None:
+        return jsonify(latest)
     else:
         return jsonify({'detected': False}), 200
 
+@app.route('/esp32/events', methods=['GET'])
+def esp32_event_stream():
+    """
+    Server-Sent Events: one `data:` message (same body as /esp32/latest)
+    whenever a glove's debounced letter changes to a new letter or
+    play_audio fires.
+    ?device=<id> limits the stream to one glove.
+    """
+    sub = esp32_events.subscribe(request.args.get('device'))
+    return Response(
+        stream_with_context(sse_stream(esp32_events, sub, ESP32_EVENT_HEARTBEAT_S)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
 @app.route('/health', methods=['GET'])
 def health():
-    """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'message': 'ASL Recognition API is running'})
+    """Health check endpoint: 503 until the required models are ready"""
+    ready = models.ready()
+    return jsonify({
+        'status': 'healthy' if ready else 'loading',
+        'message': 'ASL Recognition API is running' if ready else 'Models are still loading',
+        'models': models.status(),
+        'caches': {'refiner': refiner_cache.stats(), 'glove': esp32_cache.stats()},
+        'roi_tracking': {'enabled': ROI_TRACKING, 'sessions': len(roi_trackers)},
+        'frame_skip': {'enabled': FRAME_SKIP, **frame_skip_stats.snapshot()},
+        'refiner_batching': {
+            name: refiner[0].stats()
+            for name in ('closed_refiner', 'bw_refiner')
+            if (refiner := models.peek(name)) is not None
+        }
+    }), 200 if ready else 503
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus text-format metrics"""
+    batchers = []
+    if esp32_batcher is not None:
+        batchers.append(esp32_batcher)
+    for name in ('closed_refiner', 'bw_refiner'):
+        if (refiner := models.peek(name)) is not None:
+            batchers.append(refiner[0].batcher)
+    caches = (esp32_cache, refiner_cache)
+    body = render_prometheus(
+        requests_total.render(),
+        request_ms.render(),
+        stage_ms.render(),
+        frames_total.render(),
+        cascade_total.render(),
+        render_histograms('asl_batch_size', 'Micro-batch sizes by batcher',
+                          [({'batcher': b.name}, b.batch_size_hist) for b in batchers]),
+        render_histograms('asl_batch_queue_wait_ms', 'Micro-batch queue wait in milliseconds',
+                          [({'batcher': b.name}, b.queue_wait_hist) for b in batchers]),
+        *(render_samples(f'asl_cache_{key}_total', f'Cache {key} by cache', 'counter',
+                         [({'cache': c.name}, c.stats()[key]) for c in caches])
+          for key in ('hits', 'misses', 'evictions', 'expirations')),
+        render_samples('asl_cache_size', 'Cache entries by cache', 'gauge',
+                       [({'cache': c.name}, len(c)) for c in caches]),
+    )
+    return Response(body, mimetype='text/plain; version=0.0.4')
 
 if __name__ == "__main__":
-    # Load models before starting the server
-    load_models()
+    logging.basicConfig(format='%(asctime)s %(name)s %(levelname)s %(message)s')
+
+    # Load models in the background; /health reports readiness meanwhile
+    load_models(block=False)
     
     print("🚀 Starting Flask backend server...")
     print("Server will be available at: http://localhost:5000")
     print("ESP32 endpoint: http://localhost:5000/esp32/predict")
+    if ESP32_UDP:
+        start_esp32_udp()
     print("Press Ctrl+C to stop the server")
     
     app.run(host='0.0.0.0', port=5000, debug=False)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Async glove server: /esp32/predict, /esp32/status, /esp32/latest and
+/health on an aiohttp event loop. Request parsing and response writing stay
+on the loop, and each reading is awaited on the shared micro-batcher, so
+concurrent gloves coalesce into one forward pass and idle or slow glove
+connections cost a socket, not a thread. Past MAX_PENDING queued
+predictions it answers 503 with Retry-After instead of queueing more.
+
+Serves the glove model only (no TensorFlow/MediaPipe, like serve_glove.py).
+Compare with the Flask server using loadtest_glove.py.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from aiohttp import web
+
+import app as backend
+
+GLOVE_BACKEND = os.environ.get("GLOVE_BACKEND", "numpy")
+PORT = int(os.environ.get("PORT", 5000))
+INFERENCE_WORKERS = 4  # fallback when batching is off or the sequence model is loaded
+MAX_PENDING = 256      # predictions queued or running before we shed load
+RETRY_AFTER_S = 1
+
+executor = ThreadPoolExecutor(max_workers=INFERENCE_WORKERS, thread_name_prefix="glove-infer")
+pending = 0  # predictions queued or running; only touched on the loop thread
+
+def error(message, status):
+    return web.json_response({'error': message}, status=status)
+
+async def predict_reading(device_id, sensor_data):
+    """Await the batcher for a snapshot reading; blocking paths go to the pool"""
+    future = None
+    if backend.esp32_sequence is None:
+        future = backend.submit_esp32_letter(sensor_data)
+    if future is None:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, backend.predict_esp32_reading, device_id, sensor_data)
+    prediction, confidence, detected = await asyncio.wrap_future(future)
+    session = backend.esp32_sessions.get(device_id)
+    return backend.finish_esp32_reading(session, sensor_data, prediction, confidence, detected)
+
+async def esp32_predict(request):
+    global pending
+    try:
+        try:
+            data = await request.json()
+        except ValueError:
+            return error('Body must be JSON', 400)
+        if not data:
+            return error('No data provided', 400)
+        sensor_data, message = backend.parse_esp32_reading(data)
+        if message:
+            return error(message, 400)
+        device_id = backend.get_esp32_device_id(data, request.headers)
+
+        if backend.esp32_loading():
+            return web.json_response({'error': 'Glove model is still loading, retry shortly'}, status=503,
+                                     headers={'Retry-After': str(RETRY_AFTER_S)})
+        if pending >= MAX_PENDING:
+            return web.json_response({'error': 'Server busy'}, status=503,
+                                     headers={'Retry-After': str(RETRY_AFTER_S)})
+        pending += 1
+        try:
+            response = await predict_reading(device_id, sensor_data)
+        finally:
+            pending -= 1
+        return web.json_response(response)
+
+    except Exception as e:
+        print(f"Error in /esp32/predict endpoint: {e}")
+        return error(str(e), 500)
+
+async def esp32_status(request):
+    return web.json_response(dict(backend.esp32_status_body(), server='async'))
+
+async def esp32_latest(request):
+    latest = backend.esp32_sessions.latest(request.query.get('device'))
+    return web.json_response(latest if latest is not None else {'detected': False})
+
+async def health(request):
+    ready = backend.models.ready()
+    return web.json_response({
+        'status': 'healthy' if ready else 'loading',
+        'models': backend.models.status(),
+        'pending': pending,
+    }, status=200 if ready else 503)
+
+def create_app():
+    aio = web.Application()
+    aio.router.add_post('/esp32/predict', esp32_predict)
+    aio.router.add_get('/esp32/status', esp32_status)
+    aio.router.add_get('/esp32/latest', esp32_latest)
+    aio.router.add_get('/health', health)
+    return aio
+
+def main():
+    backend.ESP32_BACKEND = GLOVE_BACKEND
+    backend.load_models(block=True, glove_only=True)
+    print(f"🚀 Async glove server on http://localhost:{PORT} "
+          f"(micro-batched inference, max {MAX_PENDING} pending)")
+    web.run_app(create_app(), host='0.0.0.0', port=PORT, print=None)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# batching.py - Request-coalescing micro-batcher for small-input models
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from metrics import Histogram, BATCH_SIZE_BUCKETS, LATENCY_MS_BUCKETS
+
+class MicroBatcher:
+    """
+    Collects single samples submitted from concurrent request threads,
+    runs one batched forward pass per window and fans the rows back out.
+
+    predict_fn: callable taking a (N, ...) array and returning (N, ...) outputs
+    max_batch_size: dispatch as soon as this many samples are waiting
+    max_wait_ms: dispatch at most this long after the first sample arrived
+    collate_fn: turns the list of queued samples into the model input
+                (default np.stack); lets callers fill a preallocated buffer
+    """
+    def __init__(self, predict_fn, max_batch_size=32, max_wait_ms=3.0, name="batcher", collate_fn=None):
+        self.predict_fn = predict_fn
+        self.collate_fn = collate_fn or np.stack
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.name = name
+
+        self.batch_size_hist = Histogram(f"{name}_batch_size", BATCH_SIZE_BUCKETS)
+        self.queue_wait_hist = Histogram(f"{name}_queue_wait_ms", LATENCY_MS_BUCKETS)
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=1.0):
+        self._running = False
+        self._queue.put(None)  # wake the worker
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, sample):
+        """Queue one sample; returns a Future resolving to its output row"""
+        if not self._running:
+            raise RuntimeError(f"{self.name} is not running")
+        fut = Future()
+        self._queue.put((np.asarray(sample), fut, time.perf_counter()))
+        return fut
+
+    def predict(self, sample, timeout=None):
+        """Blocking helper: submit one sample and wait for its output row"""
+        return self.submit(sample).result(timeout=timeout)
+
+    def stats(self):
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000.0,
+            'pending': self._queue.qsize(),
+            'batch_size': self.batch_size_hist.snapshot(),
+            'queue_wait_ms': self.queue_wait_hist.snapshot(),
+        }
+
+    # --- worker --------------------------------------------------------
+
+    def _collect(self, first):
+        """Gather items until the window closes or the batch is full"""
+        batch = [first]
+        deadline = first[2] + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while self._running:
+            first = self._queue.get()
+            if first is None:
+                continue
+            batch = self._collect(first)
+
+            dispatched = time.perf_counter()
+            self.batch_size_hist.observe(len(batch))
+            for _, _, enqueued in batch:
+                self.queue_wait_hist.observe((dispatched - enqueued) * 1000.0)
+
+            try:
+                inputs = self.collate_fn([sample for sample, _, _ in batch])
+                outputs = self.predict_fn(inputs)
+                for i, (_, fut, _) in enumerate(batch):
+                    fut.set_result(outputs[i])
+            except Exception as e:
+                for _, fut, _ in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+
+        # Fail anything still queued so callers don't hang on shutdown
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[1].set_exception(RuntimeError(f"{self.name} stopped"))
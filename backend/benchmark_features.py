@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Parity check + benchmark: vectorized features.py vs the original per-landmark
+feature helpers that used to live in app.py / test_model.py.
+
+Runs on synthetic hands, so no webcam or MediaPipe install is needed.
+"""
+
+import sys
+import time
+from math import acos, degrees
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from features import extract_features, extract_features_batch
+
+N_HANDS = 500
+ITERATIONS = 2000
+
+# --- Original implementations (reference) ---------------------------------
+
+def legacy_landmark_angles(landmarks):
+    fingers = {
+        'thumb':   [(1,2,3),(2,3,4)],
+        'index':   [(5,6,7),(6,7,8)],
+        'middle':  [(9,10,11),(10,11,12)],
+        'ring':    [(13,14,15),(14,15,16)],
+        'pinky':   [(17,18,19),(18,19,20)],
+    }
+    coords = np.array([[p.x, p.y, p.z] for p in landmarks], dtype=np.float32)
+    angles = []
+    for joints in fingers.values():
+        for a, b, c in joints:
+            v1 = coords[a] - coords[b]
+            v2 = coords[c] - coords[b]
+            cosang = np.dot(v1, v2) / (np.linalg.norm(v1)*np.linalg.norm(v2) + 1e-6)
+            angles.append(degrees(acos(np.clip(cosang, -1, 1))))
+    return np.array(angles, dtype=np.float32)
+
+def legacy_tip_distances(landmarks):
+    pts = np.array([[p.x, p.y, p.z] for p in landmarks], dtype=np.float32)
+    wrist = pts[0]
+    tips  = pts[[4, 8, 12, 16, 20]]
+    return np.linalg.norm(tips - wrist, axis=1)
+
+def legacy_hull_area(landmarks, w, h):
+    pts = np.array([[int(p.x*w), int(p.y*h)] for p in landmarks], dtype=np.int32)
+    hull = cv2.convexHull(pts)
+    return cv2.contourArea(hull)
+
+def legacy_features(world_lms, img_lms, w, h):
+    coords = np.array([[p.x,p.y,p.z] for p in world_lms], dtype=np.float32).flatten()
+    angs = legacy_landmark_angles(world_lms)
+    dists = legacy_tip_distances(world_lms)
+    area = legacy_hull_area(img_lms, w, h)
+    return np.concatenate([coords, angs, dists, [area]])
+
+# --- Synthetic hands --------------------------------------------------------
+
+def to_landmarks(arr):
+    """Mimic MediaPipe landmark objects"""
+    return [SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in arr]
+
+def make_hands(n, rng):
+    world = rng.normal(scale=0.05, size=(n, 21, 3)).astype(np.float32)
+    img = rng.uniform(0.2, 0.8, size=(n, 21, 3)).astype(np.float32)
+    return world, img
+
+def bench(fn, iterations=ITERATIONS):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) * 1e6 / iterations
+
+def main():
+    rng = np.random.default_rng(0)
+    world, img = make_hands(N_HANDS, rng)
+    world_objs = [to_landmarks(h) for h in world]
+    img_objs = [to_landmarks(h) for h in img]
+    w, h = 640, 480
+
+    print("🧪 Feature extraction parity")
+    print("=" * 50)
+    legacy = np.stack([legacy_features(wl, il, w, h) for wl, il in zip(world_objs, img_objs)])
+    single = np.stack([extract_features(wl, il, w, h) for wl, il in zip(world_objs, img_objs)])
+    batch = extract_features_batch(world, img, w, h)
+
+    ok = True
+    for name, feats in (("extract_features", single), ("extract_features_batch", batch)):
+        diff = np.abs(feats - legacy)
+        angle_diff = diff[:, 63:73].max()
+        other_diff = np.delete(diff, np.s_[63:73], axis=1).max()
+        passed = angle_diff < 1e-2 and other_diff < 1e-5
+        ok &= passed
+        print(f"{'✅' if passed else '❌'} {name}: max |Δangle|={angle_diff:.2e}°, max |Δother|={other_diff:.2e}")
+
+    print("\n⏱️  Per-hand latency")
+    print("=" * 50)
+    wl, il = world_objs[0], img_objs[0]
+    t_legacy = bench(lambda: legacy_features(wl, il, w, h))
+    t_new = bench(lambda: extract_features(wl, il, w, h))
+    t_batch = bench(lambda: extract_features_batch(world, img, w, h), iterations=20) / N_HANDS
+    print(f"legacy helpers         {t_legacy:8.1f} µs")
+    print(f"extract_features       {t_new:8.1f} µs  ({t_legacy / t_new:.1f}x)")
+    print(f"extract_features_batch {t_batch:8.1f} µs  ({t_legacy / t_batch:.1f}x, N={N_HANDS})")
+
+    if not ok:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
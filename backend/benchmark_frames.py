@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Bytes-on-the-wire and decode-time comparison: base64 JSON /predict vs
+binary /predict/frame (JPEG bytes and raw RGB).
+"""
+
+import base64
+import io
+import json
+import time
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from frames import decode_frame_bytes
+
+SIZES = [(640, 480), (1280, 720)]
+JPEG_QUALITY = 92  # react-webcam's default screenshot quality
+ITERATIONS = 200
+
+def make_frame(w, h):
+    """Smooth gradient + noise so JPEG sizes look like a real webcam frame"""
+    rng = np.random.default_rng(0)
+    yy, xx = np.mgrid[0:h, 0:w]
+    base = np.stack([xx * 255 / w, yy * 255 / h, (xx + yy) * 127 / (w + h)], axis=-1)
+    return np.clip(base + rng.normal(scale=12, size=base.shape), 0, 255).astype(np.uint8)
+
+def legacy_decode(image_data):
+    """The original /predict decode chain up to hands.process()"""
+    image_data = image_data.split(',')[1] if ',' in image_data else image_data
+    image_bytes = base64.b64decode(image_data)
+    image = Image.open(io.BytesIO(image_bytes))
+    frame = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+    frame = cv2.flip(frame, 1)
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+def binary_decode(data, content_type, w=None, h=None):
+    # The pipeline mirrors landmarks rather than the frame, so no flip here
+    return decode_frame_bytes(data, content_type, w, h)
+
+def per_call_ms(fn):
+    fn()
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    return (time.perf_counter() - start) * 1000.0 / ITERATIONS
+
+def main():
+    print("📦 Frame ingestion: base64 JSON vs binary body")
+    print("=" * 72)
+    for w, h in SIZES:
+        rgb = make_frame(w, h)
+        ok, jpeg = cv2.imencode('.jpg', cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR),
+                                [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+        jpeg = jpeg.tobytes()
+        data_url = "data:image/jpeg;base64," + base64.b64encode(jpeg).decode()
+        json_body = json.dumps({'image': data_url}).encode()
+        raw = rgb.tobytes()
+
+        t_legacy = per_call_ms(lambda: legacy_decode(data_url))
+        t_jpeg = per_call_ms(lambda: binary_decode(jpeg, 'image/jpeg'))
+        t_raw = per_call_ms(lambda: binary_decode(raw, 'application/octet-stream', w, h))
+
+        print(f"{w}x{h}")
+        print(f"  base64 JSON  {len(json_body) / 1024:8.1f} KB  {t_legacy:6.2f} ms decode")
+        print(f"  JPEG body    {len(jpeg) / 1024:8.1f} KB  {t_jpeg:6.2f} ms decode  "
+              f"(-{1 - len(jpeg) / len(json_body):.0%} bytes, decode {t_legacy / t_jpeg:.2f}x base64 speed)")
+        print(f"  raw RGB body {len(raw) / 1024:8.1f} KB  {t_raw:6.2f} ms decode")
+    print("=" * 72)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Startup time and memory: full app.py vs the glove-only serve_glove.py.
+Each server is started in turn and polled until /health returns 200;
+reports time to ready, resident memory once ready (VmRSS) and its
+high-water mark (VmHWM), plus one /esp32/predict round trip.
+"""
+
+import json
+import subprocess
+import sys
+import time
+import urllib.request
+
+from benchmark_startup import poll_health, POLL_S, TIMEOUT_S
+
+PREDICT_URL = "http://localhost:5000/esp32/predict"
+SERVERS = [("full app.py", ["app.py"]), ("serve_glove.py", ["serve_glove.py"])]
+
+def proc_memory_mb(pid):
+    """(VmRSS, VmHWM) in MB from /proc"""
+    values = {}
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("VmRSS", "VmHWM"):
+                values[key] = int(rest.split()[0]) / 1024.0
+    return values.get("VmRSS"), values.get("VmHWM")
+
+def predict_ms():
+    body = json.dumps({"sensor_values": [1200, 300, 250, 280, 310]}).encode()
+    req = urllib.request.Request(PREDICT_URL, data=body, headers={"Content-Type": "application/json"})
+    start = time.perf_counter()
+    with urllib.request.urlopen(req, timeout=10) as r:
+        r.read()
+    return (time.perf_counter() - start) * 1000.0
+
+def measure(args):
+    """(ready s, rss MB, hwm MB, predict ms) or None if the server never got ready"""
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable] + args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - start < TIMEOUT_S:
+            if proc.poll() is not None:
+                return None
+            status, _ = poll_health()
+            if status == 200:
+                ready = time.perf_counter() - start
+                predict_ms()  # first request pays for lazy setup
+                latency = min(predict_ms() for _ in range(20))
+                rss, hwm = proc_memory_mb(proc.pid)
+                return ready, rss, hwm, latency
+            time.sleep(POLL_S)
+        return None
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+def main():
+    print("⏱️  Full app vs glove-only server")
+    print("=" * 72)
+    for label, args in SERVERS:
+        result = measure(args)
+        if result is None:
+            print(f"{label:<16} ❌ not ready after {TIMEOUT_S:.0f} s")
+            continue
+        ready, rss, hwm, latency = result
+        print(f"{label:<16} ready {ready:6.2f} s   RSS {rss:7.1f} MB   peak {hwm:7.1f} MB   "
+              f"/esp32/predict {latency:6.2f} ms")
+    print("=" * 72)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: Model.predict() vs the pre-traced InferenceEngine fast path
+for the four backend models (single-sample latency).
+"""
+
+import os
+import time
+
+import numpy as np
+import tensorflow as tf
+
+from inference import InferenceEngine
+
+MODELS = [
+    ("main_model", "asl_letter_model_v3.keras"),
+    ("closed_cnn", "closed_fist_refiner.keras"),
+    ("bw_cnn", "bw_refiner.keras"),
+    ("glove_cnn", "glove_cnn_model.keras"),
+]
+WARMUP = 10
+ITERATIONS = 200
+
+def time_calls(fn, x, iterations=ITERATIONS):
+    """Return per-call latencies in milliseconds"""
+    for _ in range(WARMUP):
+        fn(x)
+    times = np.empty(iterations)
+    for i in range(iterations):
+        start = time.perf_counter()
+        fn(x)
+        times[i] = (time.perf_counter() - start) * 1000.0
+    return times
+
+def summarize(times):
+    return np.median(times), np.percentile(times, 95)
+
+def main():
+    print("⏱️  Inference fast-path benchmark")
+    print("=" * 64)
+    print(f"{'model':<12} {'predict p50':>12} {'p95':>8} {'engine p50':>12} {'p95':>8} {'speedup':>8}")
+
+    for name, path in MODELS:
+        if not os.path.exists(path):
+            print(f"{name:<12} ⚠️  {path} not found, skipping")
+            continue
+
+        model = tf.keras.models.load_model(path)
+        engine = InferenceEngine(model, name=name).warmup()
+        x = np.random.rand(1, *engine.input_shape).astype(np.float32)
+
+        # Both paths must agree before timing means anything
+        ref = model.predict(x, verbose=0)
+        out = engine(x)
+        if not np.allclose(ref, out, atol=1e-5):
+            print(f"{name:<12} ❌ outputs differ (max abs diff {np.abs(ref - out).max():.2e})")
+            continue
+
+        p50_old, p95_old = summarize(time_calls(lambda v: model.predict(v, verbose=0), x))
+        p50_new, p95_new = summarize(time_calls(engine, x))
+        print(f"{name:<12} {p50_old:>10.2f}ms {p95_old:>6.2f}ms {p50_new:>10.2f}ms {p95_new:>6.2f}ms {p50_old / p50_new:>7.1f}x")
+
+    print("=" * 64)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Replay benchmark: pushes recorded inputs through the prediction pipeline
+and reports throughput, p50/p95/p99 latency and memory high-water mark.
+
+Inputs
+  --glove all_data.csv     datatocsv.py recording (thumb..pinky,label,sample_id)
+  --frames <dir>           directory of JPEG/PNG webcam frames (sorted by name)
+
+Targets
+  in-process (default)     predict_esp32_letter / predict_asl_letter in this process
+  --url http://host:5000   /esp32/predict and /predict over HTTP
+
+--stub swaps the Keras engines for tiny seeded NumPy models so the harness
+runs on a CPU-only box without TensorFlow; the scaler, label encoders and
+MediaPipe are the real ones. `serve` runs app.py with the same stubs so the
+HTTP path can be measured in CI too.
+
+  python benchmark_replay.py run --glove all_data.csv --frames frames/ --concurrency 8 --stub --out a.json
+  python benchmark_replay.py serve --stub --port 5001
+  python benchmark_replay.py diff a.json b.json
+"""
+
+import argparse
+import base64
+import csv
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+FINGER_NAMES = ["thumb", "pointer", "middle", "ring", "pinky"]
+FRAME_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+# --- inputs ----------------------------------------------------------
+
+def load_glove_stream(path, limit=None):
+    """Readings in recording order from a datatocsv.py CSV"""
+    readings = []
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                readings.append([float(row[k]) for k in FINGER_NAMES])
+            except (KeyError, ValueError):
+                continue
+            if limit and len(readings) >= limit:
+                break
+    return readings
+
+def load_frames(path, limit=None):
+    """Frames as base64 strings, as the frontend posts them to /predict"""
+    names = sorted(n for n in os.listdir(path) if n.lower().endswith(FRAME_EXTENSIONS))[:limit]
+    frames = []
+    for name in names:
+        with open(os.path.join(path, name), "rb") as f:
+            frames.append(base64.b64encode(f.read()).decode("ascii"))
+    return frames
+
+# --- stub models -----------------------------------------------------
+
+class TinyModel:
+    """
+    Seeded random projection + softmax (or sigmoid for one output) with the
+    InferenceEngine call signature: (N, ...) float32 -> (N, n_out)
+    """
+    def __init__(self, n_out, seed=0):
+        self.n_out = n_out
+        self.seed = seed
+        self._w = None
+        self._lock = threading.Lock()
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=np.float32).reshape(len(x), -1)
+        with self._lock:
+            if self._w is None or self._w.shape[0] != x.shape[1]:
+                rng = np.random.default_rng(self.seed)
+                self._w = rng.standard_normal((x.shape[1], self.n_out)).astype(np.float32) / np.sqrt(x.shape[1])
+        logits = x @ self._w
+        if self.n_out == 1:
+            return 1.0 / (1.0 + np.exp(-logits))
+        logits -= logits.max(axis=1, keepdims=True)
+        e = np.exp(logits)
+        return e / e.sum(axis=1, keepdims=True)
+
+    predict = __call__
+
+def install_stubs(backend):
+    """Replace the Keras loaders in the app module with TinyModel ones"""
+    n_letters = len(backend.load_pickle("label_encoder_v3.pkl").classes_)
+    outputs = {
+        "main_model": n_letters,
+        "closed_cnn": len(backend.load_pickle("closed_fist_le.pkl").classes_),
+        "bw_cnn": 1,
+    }
+    backend.load_keras_engine = lambda path, name: TinyModel(outputs.get(name, n_letters), seed=len(name))
+    n_glove = len(backend.load_class_list(backend.ESP32_CLASSES))
+    backend.load_esp32_engine = lambda kind: (None, TinyModel(n_glove, seed=5))
+    backend.load_esp32_sequence_model = lambda: None
+
+# --- targets ---------------------------------------------------------
+
+def in_process_target(stub):
+    import app as backend
+    if stub:
+        install_stubs(backend)
+    backend.load_models()
+
+    def glove(values):
+        letter, conf, detected = backend.predict_esp32_letter(values)
+        return letter if detected else None
+
+    def frame(image):
+        letter, conf, detected = backend.predict_asl_letter(image)
+        return letter if detected else None
+
+    return glove, frame
+
+def http_target(url):
+    def post(path, body):
+        req = urllib.request.Request(url.rstrip("/") + path, data=json.dumps(body).encode(),
+                                     headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=30) as r:
+            return json.loads(r.read())
+
+    def glove(values):
+        return post("/esp32/predict", {"sensor_values": values, "device": "replay"}).get("prediction")
+
+    def frame(image):
+        return post("/predict", {"image": image}).get("prediction")
+
+    return glove, frame
+
+# --- measurement -----------------------------------------------------
+
+def replay(fn, inputs, concurrency):
+    """Run fn over inputs on `concurrency` threads; returns (results, latencies ms, wall s, errors)"""
+    results = [None] * len(inputs)
+    latencies = np.zeros(len(inputs))
+    errors = 0
+
+    def one(i):
+        start = time.perf_counter()
+        try:
+            results[i] = fn(inputs[i])
+            return None
+        except Exception as e:
+            return e
+        finally:
+            latencies[i] = (time.perf_counter() - start) * 1000.0
+
+    wall0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for err in pool.map(one, range(len(inputs))):
+            errors += err is not None
+    return results, latencies, time.perf_counter() - wall0, errors
+
+def server_hwm_mb(pid):
+    """VmHWM of another process (the server) in MB, or None"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return None
+
+def summarize(name, results, latencies, wall, errors):
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if len(latencies) else (0.0, 0.0, 0.0)
+    summary = {
+        "count": len(latencies),
+        "errors": errors,
+        "throughput_per_s": len(latencies) / wall if wall else 0.0,
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "predictions": results,
+    }
+    print(f"{name:<7} {summary['count']:6d} reqs  {summary['throughput_per_s']:8.1f}/s  "
+          f"p50 {p50:7.2f}  p95 {p95:7.2f}  p99 {p99:7.2f} ms  errors {errors}")
+    return summary
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def cmd_run(args):
+    if not args.glove and not args.frames:
+        sys.exit("❌ Give --glove and/or --frames")
+    glove_fn, frame_fn = http_target(args.url) if args.url else in_process_target(args.stub)
+
+    report = {"commit": git_commit(), "target": args.url or "in-process", "stub": args.stub,
+              "concurrency": args.concurrency}
+    print(f"⏱️  Replay benchmark ({report['target']}, concurrency {args.concurrency}"
+          f"{', stub models' if args.stub else ''})")
+    print("=" * 78)
+    if args.glove:
+        readings = load_glove_stream(args.glove, args.limit)
+        report["glove"] = summarize("glove", *replay(glove_fn, readings, args.concurrency))
+    if args.frames:
+        frames = load_frames(args.frames, args.limit)
+        report["frames"] = summarize("frames", *replay(frame_fn, frames, args.concurrency))
+
+    # ru_maxrss is in KB on Linux
+    report["client_max_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    print(f"Memory high-water mark: {report['client_max_rss_mb']:.1f} MB (this process)")
+    if args.server_pid:
+        report["server_max_rss_mb"] = server_hwm_mb(args.server_pid)
+        if report["server_max_rss_mb"] is not None:
+            print(f"Memory high-water mark: {report['server_max_rss_mb']:.1f} MB (server pid {args.server_pid})")
+    print("=" * 78)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved {args.out}")
+
+def cmd_serve(args):
+    import app as backend
+    if args.stub:
+        install_stubs(backend)
+    backend.load_models(block=False)
+    print(f"🚀 Replay server on port {args.port} (pid {os.getpid()})")
+    backend.app.run(host="127.0.0.1", port=args.port, debug=False, threaded=True)
+
+def cmd_diff(args):
+    with open(args.old) as f:
+        old = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    print(f"Δ {old.get('commit')} → {new.get('commit')}")
+    print("=" * 78)
+    for kind in ("glove", "frames"):
+        if kind not in old or kind not in new:
+            continue
+        a, b = old[kind], new[kind]
+        pairs = list(zip(a["predictions"], b["predictions"]))
+        same = sum(x == y for x, y in pairs)
+        print(f"{kind}: predictions agree {same}/{len(pairs)}"
+              f" ({100.0 * same / len(pairs) if pairs else 0.0:.1f}%)")
+        for key in ("throughput_per_s", "p50_ms", "p95_ms", "p99_ms"):
+            change = (b[key] - a[key]) / a[key] * 100.0 if a[key] else 0.0
+            print(f"  {key:<17} {a[key]:9.2f} → {b[key]:9.2f}  ({change:+.1f}%)")
+    for key in ("client_max_rss_mb", "server_max_rss_mb"):
+        if old.get(key) and new.get(key):
+            print(f"{key:<19} {old[key]:9.1f} → {new[key]:9.1f} MB")
+    print("=" * 78)
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded inputs through the prediction pipeline")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="replay inputs and report latency/throughput")
+    run.add_argument("--glove", help="datatocsv.py CSV recording")
+    run.add_argument("--frames", help="directory of JPEG/PNG frames")
+    run.add_argument("--url", help="benchmark a running server instead of in-process")
+    run.add_argument("--concurrency", type=int, default=1)
+    run.add_argument("--limit", type=int, default=None, help="max inputs of each kind")
+    run.add_argument("--stub", action="store_true", help="tiny NumPy models instead of Keras")
+    run.add_argument("--server-pid", type=int, help="report this server's memory high-water mark")
+    run.add_argument("--out", help="write results JSON (for diff)")
+    run.set_defaults(func=cmd_run)
+
+    serve = sub.add_parser("serve", help="run app.py, optionally with stub models")
+    serve.add_argument("--stub", action="store_true")
+    serve.add_argument("--port", type=int, default=5001)
+    serve.set_defaults(func=cmd_serve)
+
+    diff = sub.add_parser("diff", help="compare two results JSON files")
+    diff.add_argument("old")
+    diff.add_argument("new")
+    diff.set_defaults(func=cmd_diff)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Hand-ROI tracking benchmark: runs a webcam sequence through MediaPipe
+Hands three ways - static-image mode on every full frame (the old HTTP
+path), a tracking-mode instance on full frames (the WebSocket path), and
+ROITracker with its own tracking-mode instance (the HTTP session path) -
+and reports frames/s of wall time and frames per CPU-second (FPS per core).
+
+Usage: python benchmark_roi.py <frames_dir | video_file | --synthetic> [max_frames]
+Frames are read in sorted filename order (jpg/png) or straight from a video.
+--synthetic builds a 640x480 sequence from a hand in frontend/public/asl.jpg
+drifting over a noisy background, for machines without a recording.
+"""
+
+import os
+import sys
+import time
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+from roi import ROITracker
+
+MAX_FRAMES = 300
+ROI_SIZE = 256
+ROI_PAD = 0.25
+SYNTHETIC_SOURCE = os.path.join(os.path.dirname(__file__), "..", "frontend", "public", "asl.jpg")
+SYNTHETIC_HAND = (0, 760, 340, 1160)  # x1, y1, x2, y2 of a hand (L) MediaPipe finds in asl.jpg
+
+def synthetic_frames(limit, w=640, h=480):
+    """A hand drifting slowly across a noisy background, like a held sign"""
+    chart = cv2.cvtColor(cv2.imread(SYNTHETIC_SOURCE), cv2.COLOR_BGR2RGB)
+    y1, x1, y2, x2 = SYNTHETIC_HAND[1], SYNTHETIC_HAND[0], SYNTHETIC_HAND[3], SYNTHETIC_HAND[2]
+    hand = cv2.resize(chart[y1:y2, x1:x2], None, fx=0.6, fy=0.6, interpolation=cv2.INTER_AREA)
+    hh, hw = hand.shape[:2]
+    rng = np.random.default_rng(0)
+    frames = []
+    for i in range(limit):
+        frame = np.full((h, w, 3), 235, np.int16) + rng.integers(-12, 12, (h, w, 3))
+        ox = int((w - hw) / 2 + 60 * np.sin(i / 40))
+        oy = int((h - hh) / 2 + 30 * np.sin(i / 57))
+        frame[oy:oy + hh, ox:ox + hw] = hand
+        frames.append(np.clip(frame, 0, 255).astype(np.uint8))
+    return frames
+
+def load_frames(source, limit):
+    """List of RGB frames from a directory of images or a video file"""
+    if source == "--synthetic":
+        return synthetic_frames(limit)
+    frames = []
+    if os.path.isdir(source):
+        names = sorted(n for n in os.listdir(source) if n.lower().endswith(('.jpg', '.jpeg', '.png')))
+        for name in names[:limit]:
+            bgr = cv2.imread(os.path.join(source, name))
+            if bgr is not None:
+                frames.append(cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB))
+    else:
+        cap = cv2.VideoCapture(source)
+        while len(frames) < limit:
+            ok, bgr = cap.read()
+            if not ok:
+                break
+            frames.append(cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB))
+        cap.release()
+    return frames
+
+def make_hands(static):
+    return mp.solutions.hands.Hands(static_image_mode=static, model_complexity=1, max_num_hands=1,
+                                    min_detection_confidence=0.5, min_tracking_confidence=0.5)
+
+def run(frames, mode):
+    """(wall s, cpu s, frames with a hand, roi stats or None)"""
+    detector = make_hands(True)
+    detector.process(frames[0])  # load the graph files before timing
+    hands = make_hands(mode == "static")
+    roi = ROITracker(hands, ROI_SIZE, ROI_PAD) if mode == "roi" else None
+    detected = 0
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    for rgb in frames:
+        if roi is not None:
+            found = roi.process(rgb, detector) is not None
+        else:
+            found = bool(hands.process(rgb).multi_hand_landmarks)
+        detected += found
+    wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+    hands.close()
+    detector.close()
+    return wall, cpu, detected, roi.stats() if roi is not None else None
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else MAX_FRAMES
+    frames = load_frames(sys.argv[1], limit)
+    if not frames:
+        print(f"❌ No frames found in {sys.argv[1]}")
+        sys.exit(1)
+    h, w = frames[0].shape[:2]
+
+    print(f"⏱️  Hand-ROI tracking, {len(frames)} frames at {w}x{h}")
+    print("=" * 60)
+    results = {}
+    modes = (("static, full", "static"), ("tracking, full", "tracking"), ("tracking, ROI", "roi"))
+    for label, mode in modes:
+        wall, cpu, detected, stats = run(frames, mode)
+        results[mode] = cpu
+        n = len(frames)
+        print(f"{label:<15} {n / wall:7.1f} fps  {n / cpu:7.1f} fps/core  "
+              f"{1000 * wall / n:6.2f} ms/frame  hands {detected}/{n}")
+        if stats:
+            print(f"                ROI frames {stats['roi_frames']}  full-frame {stats['full_frames']}  "
+                  f"recentered {stats['recentered']}  lost {stats['lost']}  "
+                  f"({100 * stats['roi_fraction']:.0f}% on ROI)")
+    print(f"\nCPU per frame vs static full frame: {results['static'] / results['tracking']:.2f}x less "
+          f"tracking, {results['static'] / results['roi']:.2f}x less with ROI")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Per-stage timing of the webcam pre-processing around MediaPipe, before and
+after crop-only refinement, at 640x480 and 1280x720.
+
+before: full-frame flip -> MediaPipe -> full-frame RGB->BGR -> crop -> resize
+after:  MediaPipe on the raw frame -> mirror 21 landmarks -> crop -> resize
+        -> flip + RGB->BGR on the 128x128 crop only
+
+MediaPipe itself is timed when it is installed (it costs the same in both).
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+from features import get_hand_bbox, mirror_landmarks
+
+SIZES = [(640, 480), (1280, 720)]
+ITERATIONS = 300
+REFINER_SIZE = 128
+
+def timed(fn, iterations=ITERATIONS):
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        out = fn()
+    return (time.perf_counter() - start) * 1000.0 / iterations, out
+
+def synthetic_hand(rng):
+    """Landmarks of a hand covering roughly a quarter of the frame"""
+    pts = rng.uniform(0.35, 0.6, size=(21, 3)).astype(np.float32)
+    pts[:, 2] = 0.0
+    return pts
+
+def try_mediapipe():
+    try:
+        import mediapipe as mp
+    except ImportError:
+        return None
+    return mp.solutions.hands.Hands(static_image_mode=True, max_num_hands=1)
+
+def main():
+    rng = np.random.default_rng(0)
+    hands = try_mediapipe()
+    print("⏱️  Webcam pipeline stages (ms per frame)")
+    print("=" * 60)
+    for w, h in SIZES:
+        rgb = rng.integers(0, 256, size=(h, w, 3), dtype=np.uint8)
+        lms = synthetic_hand(rng)
+
+        # --- before -------------------------------------------------
+        t_flip, flipped = timed(lambda: cv2.flip(rgb, 1))
+        t_bgr, bgr = timed(lambda: cv2.cvtColor(flipped, cv2.COLOR_RGB2BGR))
+        x1, y1, x2, y2 = get_hand_bbox(lms, bgr.shape)
+        t_crop_old, _ = timed(lambda: cv2.resize(bgr[y1:y2, x1:x2], (REFINER_SIZE, REFINER_SIZE)))
+        before = t_flip + t_bgr + t_crop_old
+
+        # --- after --------------------------------------------------
+        t_mirror, mirrored = timed(lambda: mirror_landmarks(lms, image_space=True))
+        x1, y1, x2, y2 = get_hand_bbox(mirrored, rgb.shape)
+
+        def crop_only():
+            crop = cv2.resize(rgb[y1:y2, w - x2:w - x1], (REFINER_SIZE, REFINER_SIZE))
+            return cv2.cvtColor(cv2.flip(crop, 1), cv2.COLOR_RGB2BGR)
+        t_crop_new, _ = timed(crop_only)
+        after = t_mirror + t_crop_new
+
+        print(f"{w}x{h}")
+        print(f"  before  flip {t_flip:6.3f}  RGB->BGR {t_bgr:6.3f}  crop+resize {t_crop_old:6.3f}  total {before:6.3f}")
+        print(f"  after   mirror lms {t_mirror:6.3f}  crop+resize+flip+BGR {t_crop_new:6.3f}  total {after:6.3f}"
+              f"  ({before / after:.1f}x)")
+        if hands is not None:
+            t_mp, _ = timed(lambda: hands.process(rgb), iterations=30)
+            print(f"  MediaPipe hands.process {t_mp:6.2f} (unchanged)")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark: launches app.py and reports
+  - time until /health first answers (server up, models may still load)
+  - time until /health returns 200 (all required models ready)
+  - per-model load times, and their sum vs wall time (parallel speedup)
+"""
+
+import json
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+HEALTH_URL = "http://localhost:5000/health"
+TIMEOUT_S = 180.0
+POLL_S = 0.05
+
+def poll_health():
+    """Returns (status_code, body) or (None, None) if the server isn't up"""
+    try:
+        with urllib.request.urlopen(HEALTH_URL, timeout=1) as r:
+            return r.status, json.loads(r.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+    except (urllib.error.URLError, ConnectionError, TimeoutError):
+        return None, None
+
+def main():
+    print("⏱️  Cold-start benchmark (python app.py)")
+    print("=" * 56)
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "app.py"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    first_answer = ready_at = None
+    body = None
+    try:
+        while time.perf_counter() - start < TIMEOUT_S:
+            if proc.poll() is not None:
+                print(f"❌ app.py exited with code {proc.returncode}")
+                sys.exit(1)
+            status, body = poll_health()
+            now = time.perf_counter() - start
+            if status is not None and first_answer is None:
+                first_answer = now
+            if status == 200:
+                ready_at = now
+                break
+            time.sleep(POLL_S)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+    if first_answer is None:
+        print("❌ /health never answered")
+        sys.exit(1)
+    print(f"/health first answered   {first_answer:7.2f} s")
+    if ready_at is None:
+        print(f"❌ Not ready after {TIMEOUT_S:.0f} s")
+    else:
+        print(f"All required models ready {ready_at:7.2f} s")
+
+    if body and 'models' in body:
+        print("\nPer-model load time")
+        total = 0.0
+        for name, info in body['models'].items():
+            load_ms = info['load_ms']
+            total += load_ms or 0.0
+            shown = f"{load_ms:8.0f} ms" if load_ms is not None else "       -   "
+            print(f"  {name:<16} {shown}  {info['state']}{' (lazy)' if info['lazy'] else ''}")
+        if ready_at:
+            print(f"\nSum of load times {total / 1000:.2f} s vs wall {ready_at:.2f} s")
+    print("=" * 56)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Worker-pool scaling benchmark: starts serve_workers.WorkerPool with 1, 2,
+4, ... workers and pushes JPEG frames through it from 2 client threads per
+worker (one session each, like separate webcam tabs), then reports
+throughput, latency and speedup / efficiency relative to one worker.
+
+Usage: python benchmark_workers.py [max_workers] [frames_per_run]
+Frames are the --synthetic sequence from benchmark_roi.py. Needs the full
+model set (TensorFlow + MediaPipe) and one core per worker to mean anything.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from benchmark_roi import synthetic_frames
+from serve_workers import WorkerPool
+
+FRAMES_PER_RUN = 400
+CLIENTS_PER_WORKER = 2
+JPEG_QUALITY = 92
+READY_TIMEOUT_S = 180
+BUSY_BACKOFF_S = 0.005
+
+def encode_frames(count):
+    frames = synthetic_frames(min(count, 120))
+    return [cv2.imencode('.jpg', cv2.cvtColor(f, cv2.COLOR_RGB2BGR),
+                         [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])[1].tobytes() for f in frames]
+
+def run(num_workers, jpegs, total):
+    """(frames/s, latencies in ms, 503 retries) for one pool size"""
+    pool = WorkerPool(num_workers).start()
+    deadline = time.monotonic() + READY_TIMEOUT_S
+    while len(pool.ready) < num_workers:
+        if not pool.workers_left or time.monotonic() > deadline:
+            pool.stop()
+            raise RuntimeError(f"only {len(pool.ready)}/{num_workers} workers got ready")
+        time.sleep(0.2)
+
+    clients = num_workers * CLIENTS_PER_WORKER
+    per_client = total // clients
+    latencies = []
+    retries = [0]
+    lock = threading.Lock()
+
+    def client(index):
+        session = f"bench-{index}"
+        for i in range(per_client):
+            frame = jpegs[(index * 7 + i) % len(jpegs)]
+            start = time.perf_counter()
+            while True:
+                fut = pool.submit('frame', (frame, 'image/jpeg', None, None), session)
+                if fut is not None:
+                    break
+                with lock:
+                    retries[0] += 1
+                time.sleep(BUSY_BACKOFF_S)
+            fut.result()
+            with lock:
+                latencies.append((time.perf_counter() - start) * 1000.0)
+
+    # One untimed frame per session warms each worker's trackers
+    for index in range(clients):
+        pool.submit('frame', (jpegs[0], 'image/jpeg', None, None), f"bench-{index}").result()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    pool.stop()
+    return len(latencies) / elapsed, np.array(latencies), retries[0]
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    total = int(sys.argv[2]) if len(sys.argv) > 2 else FRAMES_PER_RUN
+    jpegs = encode_frames(total)
+    sizes = [n for n in (1, 2, 4, 8, 16, 32) if n < max_workers] + [max_workers]
+
+    print(f"⏱️  Worker pool scaling, {total} frames per run, {os.cpu_count()} CPUs")
+    print("=" * 72)
+    base = None
+    for n in sizes:
+        fps, latencies, retries = run(n, jpegs, total)
+        base = base or fps
+        print(f"{n:>3} workers  {fps:7.1f} fps  p50 {np.percentile(latencies, 50):6.1f} ms  "
+              f"p95 {np.percentile(latencies, 95):6.1f} ms  speedup {fps / base:5.2f}x  "
+              f"efficiency {100 * fps / base / n:5.1f}%  503 retries {retries}")
+    print("=" * 72)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# cache.py - Bounded LRU cache with TTL and quantized-feature keys
+
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+_MISSING = object()
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries also expire after ttl_s seconds.
+    Counts hits, misses, LRU evictions and TTL expirations. on_evict(value)
+    is called for every value that leaves the cache other than by put()
+    replacing it, so values holding resources can release them.
+    """
+    def __init__(self, max_size=1024, ttl_s=None, name="cache", on_evict=None):
+        self.max_size = max_size
+        self.ttl_s = ttl_s
+        self.name = name
+        self.on_evict = on_evict
+        self._data = OrderedDict()  # key -> (value, stored_at)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            value, stored_at = entry
+            if self.ttl_s is not None and now - stored_at > self.ttl_s:
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                expired = value
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+        self._release([expired])
+        return default
+
+    def put(self, key, value):
+        now = time.monotonic()
+        dropped = []
+        with self._lock:
+            self._data[key] = (value, now)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                dropped.append(self._data.popitem(last=False)[1][0])
+                self.evictions += 1
+            if self.on_evict is not None and self.ttl_s is not None:
+                # Least recently used first: stop at the first entry still fresh
+                while self._data:
+                    oldest_key, (oldest, stored_at) = next(iter(self._data.items()))
+                    if now - stored_at <= self.ttl_s:
+                        break
+                    del self._data[oldest_key]
+                    dropped.append(oldest)
+                    self.expirations += 1
+        self._release(dropped)
+
+    def clear(self):
+        with self._lock:
+            dropped = [value for value, _ in self._data.values()]
+            self._data.clear()
+        self._release(dropped)
+
+    def _release(self, values):
+        if self.on_evict is not None:
+            for value in values:
+                self.on_evict(value)
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'max_size': self.max_size,
+            'ttl_s': self.ttl_s,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+def quantized_key(values, step):
+    """
+    Bucket `values` to multiples of `step` (scalar or per-element array) and
+    return the buckets as bytes, usable as a dict key.
+    """
+    return np.floor(np.asarray(values, dtype=np.float32) / step).astype(np.int32).tobytes()
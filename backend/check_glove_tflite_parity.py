@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Accuracy-parity check: TFLite float / int8 and NumPy glove backends vs the Keras model
+on recorded glove samples (all_data.csv from hardware/training/datatocsv.py).
+
+Usage: python check_glove_tflite_parity.py [path/to/all_data.csv]
+"""
+
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import tensorflow as tf
+
+from export_glove_tflite import KERAS_PATH, FLOAT_PATH, INT8_PATH, DATA_FILE, load_glove_csv
+from inference import InferenceEngine
+from numpy_engine import NumpyEngine
+from tflite_engine import TFLiteEngine
+
+CLASSES_PATH = "classes.json"
+MIN_AGREEMENT = 0.98  # int8 top-1 agreement with Keras we consider acceptable
+
+def per_call_ms(engine, x, iterations=200):
+    start = time.perf_counter()
+    for i in range(iterations):
+        engine(x[i % len(x)][np.newaxis])
+    return (time.perf_counter() - start) * 1000.0 / iterations
+
+def main():
+    data_file = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    if not os.path.exists(data_file):
+        print(f"❌ {data_file} not found (record one with hardware/training/datatocsv.py)")
+        sys.exit(1)
+
+    readings, labels = load_glove_csv(data_file)
+    x = readings.reshape(-1, 5, 1)
+    with open(CLASSES_PATH) as f:
+        classes = json.load(f)
+    print(f"🔎 Glove TFLite parity check on {len(x)} samples")
+    print("=" * 64)
+
+    reference = InferenceEngine(tf.keras.models.load_model(KERAS_PATH), name="keras").warmup()
+    ref_probs = reference(x)
+    ref_top1 = np.argmax(ref_probs, axis=1)
+
+    candidates = [("keras", reference)]
+    for name, path in (("tflite", FLOAT_PATH), ("tflite_int8", INT8_PATH)):
+        if os.path.exists(path):
+            candidates.append((name, TFLiteEngine(path, name=name).warmup()))
+        else:
+            print(f"⚠️  {path} not found, run export_glove_tflite.py first")
+    candidates.append(("numpy", NumpyEngine(KERAS_PATH, name="numpy").warmup()))
+
+    ok = True
+    for name, engine in candidates:
+        probs = engine(x)
+        top1 = np.argmax(probs, axis=1)
+        agreement = float(np.mean(top1 == ref_top1))
+        accuracy = float(np.mean([classes[i] == lbl for i, lbl in zip(top1, labels)]))
+        max_diff = float(np.abs(probs - ref_probs).max())
+        size_kb = os.path.getsize(engine.model_path if name != "keras" else KERAS_PATH) / 1024
+        print(f"{name:<12} agree={agreement:6.2%} acc={accuracy:6.2%} "
+              f"max|Δp|={max_diff:.3f} {per_call_ms(engine, x):.3f} ms/call {size_kb:.0f} KB")
+        if agreement < MIN_AGREEMENT:
+            ok = False
+
+    print("=" * 64)
+    if ok:
+        print("✅ All backends agree with the Keras model")
+    else:
+        print(f"❌ At least one backend is below {MIN_AGREEMENT:.0%} top-1 agreement")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
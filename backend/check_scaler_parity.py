@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Parity and latency check: folded AffineScaler vs sklearn StandardScaler
+(scaler_v3.pkl) on a sample feature set drawn around the training
+distribution (mean_ +/- 3 scale_), one row at a time as on the hot path.
+
+Usage: python check_scaler_parity.py [n_samples]
+"""
+
+import pickle
+import sys
+import time
+
+import numpy as np
+
+from export_scaler import SCALER_PATH
+from preprocess import AffineScaler
+
+MAX_ABS_DIFF = 1e-4  # in standard deviations
+ITERATIONS = 2000
+
+def per_call_us(fn, rows):
+    fn(rows[0])
+    start = time.perf_counter()
+    for i in range(ITERATIONS):
+        fn(rows[i % len(rows)])
+    return (time.perf_counter() - start) * 1e6 / ITERATIONS
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    with open(SCALER_PATH, "rb") as f:
+        scaler = pickle.load(f)
+    affine = AffineScaler.from_sklearn(scaler)
+
+    rng = np.random.default_rng(0)
+    mean = scaler.mean_ if scaler.mean_ is not None else 0.0
+    scale = scaler.scale_ if scaler.scale_ is not None else 1.0
+    feats = (mean + scale * rng.uniform(-3, 3, size=(n, scaler.n_features_in_))).astype(np.float32)
+    rows = feats[:, np.newaxis, :]  # (n, 1, F): one request row each
+
+    print(f"🔎 Scaler parity on {n} samples ({scaler.n_features_in_} features)")
+    print("=" * 56)
+    max_diff = float(np.abs(affine.transform(feats) - scaler.transform(feats)).max())
+    print(f"max |Δ| batch      {max_diff:.2e}")
+    row_diff = max(float(np.abs(affine.transform(r) - scaler.transform(r)).max()) for r in rows[:100])
+    print(f"max |Δ| per row    {row_diff:.2e}")
+
+    t_sklearn = per_call_us(scaler.transform, rows)
+    t_affine = per_call_us(affine.transform, rows)
+    print(f"sklearn transform  {t_sklearn:8.2f} µs/row")
+    print(f"AffineScaler       {t_affine:8.2f} µs/row  ({t_sklearn / t_affine:.1f}x)")
+    print("=" * 56)
+    if max(max_diff, row_diff) > MAX_ABS_DIFF:
+        print(f"❌ Outputs differ by more than {MAX_ABS_DIFF}")
+        sys.exit(1)
+    print("✅ AffineScaler matches the sklearn scaler")
+
+if __name__ == "__main__":
+    main()
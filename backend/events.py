@@ -0,0 +1,106 @@
+# events.py - Server-Sent Events fan-out with bounded per-subscriber queues
+
+import json
+import queue
+import threading
+
+class Subscriber:
+    """One SSE client: its device filter and a bounded event queue"""
+    def __init__(self, device_id, max_queue):
+        self.device_id = device_id
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.dropped = False
+
+class EventHub:
+    """
+    Publishes events to every subscriber whose device filter matches.
+    publish() never blocks: a subscriber whose queue is full is a slow
+    consumer and is dropped (its stream ends; the client reconnects).
+    """
+    def __init__(self, max_queue=32, name="events"):
+        self.max_queue = max_queue
+        self.name = name
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    def subscribe(self, device_id=None):
+        sub = Subscriber(device_id, self.max_queue)
+        with self._lock:
+            self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    def publish(self, device_id, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self.published += 1
+        delivered = 0
+        for sub in subscribers:
+            if sub.dropped or (sub.device_id is not None and sub.device_id != device_id):
+                continue
+            try:
+                sub.queue.put_nowait(event)
+                delivered += 1
+            except queue.Full:
+                self._drop(sub)
+        with self._lock:
+            self.delivered += delivered
+
+    def _drop(self, sub):
+        self.unsubscribe(sub)
+        if sub.dropped:
+            return
+        sub.dropped = True
+        with self._lock:
+            self.dropped += 1
+        # Discard its backlog until the end-of-stream marker fits
+        while True:
+            try:
+                sub.queue.put_nowait(None)
+                return
+            except queue.Full:
+                try:
+                    sub.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def stats(self):
+        return {
+            'subscribers': len(self._subscribers),
+            'max_queue': self.max_queue,
+            'published': self.published,
+            'delivered': self.delivered,
+            'dropped_subscribers': self.dropped,
+        }
+
+def sse_format(data, event=None):
+    """One SSE message; data is JSON-encoded"""
+    lines = f"event: {event}\n" if event else ""
+    return lines + f"data: {json.dumps(data)}\n\n"
+
+def sse_stream(hub, sub, heartbeat_s=15.0):
+    """
+    Generator of SSE text for one subscriber; sends a comment every
+    heartbeat_s so proxies keep the connection open and dead clients are
+    noticed. Unsubscribes when the client goes away.
+    """
+    try:
+        yield ": connected\n\n"
+        while True:
+            try:
+                event = sub.queue.get(timeout=heartbeat_s)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            if event is None:
+                yield sse_format({'reason': 'slow consumer'}, event='dropped')
+                return
+            yield sse_format(event)
+    finally:
+        hub.unsubscribe(sub)
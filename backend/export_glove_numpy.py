@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Export glove_cnn_model.keras to glove_cnn_numpy.npz (per-layer weights plus a
+JSON spec of the layer stack), then checks the NumPy forward pass against
+Keras on random 0-4095 readings, both from the npz and straight from the
+.keras archive (what ESP32_BACKEND = "numpy" / serve_glove.py loads).
+"""
+
+import json
+import sys
+
+import numpy as np
+import tensorflow as tf
+
+from numpy_engine import NumpyEngine, layer_spec
+
+KERAS_PATH = "glove_cnn_model.keras"
+NUMPY_PATH = "glove_cnn_numpy.npz"
+MAX_ABS_DIFF = 1e-4
+
+def main():
+    model = tf.keras.models.load_model(KERAS_PATH)
+    spec = {'input_shape': list(model.input_shape[1:]), 'layers': []}
+    arrays = {}
+    for i, layer in enumerate(model.layers):
+        spec['layers'].append(layer_spec(type(layer).__name__, layer.get_config(), len(layer.get_weights())))
+        for j, w in enumerate(layer.get_weights()):
+            arrays[f'{i}_{j}'] = w.astype(np.float32)
+    np.savez(NUMPY_PATH, spec=json.dumps(spec), **arrays)
+    print(f"✅ {KERAS_PATH} -> {NUMPY_PATH} ({len(spec['layers'])} layers)")
+
+    x = np.random.default_rng(0).uniform(0, 4095, size=(256,) + tuple(spec['input_shape'])).astype(np.float32)
+    expected = model.predict(x, verbose=0)
+    diff = max(float(np.abs(NumpyEngine(path)(x) - expected).max()) for path in (NUMPY_PATH, KERAS_PATH))
+    print(f"max |Δp| vs Keras: {diff:.2e}")
+    if diff > MAX_ABS_DIFF:
+        print("❌ NumPy forward pass does not match Keras")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Export glove_cnn_model.keras to TFLite (float and full-int8) for the
+server-side TFLite backends (ESP32_BACKEND = "tflite" / "tflite_int8").
+
+Calibrates int8 quantization on recorded glove data (all_data.csv from
+hardware/training/datatocsv.py) when available, otherwise on uniform
+0-4095 readings like translateto8.ipynb.
+"""
+
+import csv
+import os
+import sys
+
+import numpy as np
+import tensorflow as tf
+
+KERAS_PATH = "glove_cnn_model.keras"
+FLOAT_PATH = "glove_cnn_float.tflite"
+INT8_PATH = "glove_cnn_int8.tflite"
+DATA_FILE = "all_data.csv"
+FINGER_NAMES = ["thumb", "pointer", "middle", "ring", "pinky"]
+
+def load_glove_csv(path):
+    """
+    Read a datatocsv.py recording.
+    Returns: (readings (N, 5) float32, labels list)
+    """
+    readings, labels = [], []
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                readings.append([float(row[k]) for k in FINGER_NAMES])
+            except (KeyError, ValueError):
+                continue
+            labels.append(row.get("label"))
+    return np.array(readings, dtype=np.float32).reshape(-1, 5), labels
+
+def representative_dataset(readings, n=200):
+    if len(readings):
+        idx = np.random.choice(len(readings), size=min(n, len(readings)), replace=False)
+        samples = readings[idx]
+    else:
+        samples = np.random.uniform(0, 4095, size=(n, 5)).astype(np.float32)
+
+    def gen():
+        for s in samples:
+            yield [s.reshape(1, 5, 1)]
+    return gen
+
+def convert_float(model):
+    """Float32 .tflite bytes"""
+    return tf.lite.TFLiteConverter.from_keras_model(model).convert()
+
+def convert_int8(model, readings):
+    """Full-int8 .tflite bytes, calibrated on (N, 5) readings (uniform if empty)"""
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = representative_dataset(readings)
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.int8
+    converter.inference_output_type = tf.int8
+    return converter.convert()
+
+def main():
+    data_file = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    model = tf.keras.models.load_model(KERAS_PATH)
+
+    with open(FLOAT_PATH, "wb") as f:
+        f.write(convert_float(model))
+    print(f"✅ Float model written to {FLOAT_PATH}")
+
+    readings = np.empty((0, 5), dtype=np.float32)
+    if os.path.exists(data_file):
+        readings, _ = load_glove_csv(data_file)
+        print(f"📊 Calibrating on {len(readings)} recorded readings from {data_file}")
+    else:
+        print(f"⚠️  {data_file} not found, calibrating on uniform 0-4095 readings")
+
+    with open(INT8_PATH, "wb") as f:
+        f.write(convert_int8(model, readings))
+    print(f"✅ Int8 model written to {INT8_PATH}")
+
+if __name__ == "__main__":
+    main()
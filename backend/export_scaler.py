@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Fold scaler_v3.pkl (sklearn StandardScaler) into a NumPy affine transform
+and save it as scaler_v3_affine.npz, which app.py loads in place of the
+pickle so the hot path never calls into sklearn.
+"""
+
+import pickle
+
+from preprocess import AffineScaler
+
+SCALER_PATH = "scaler_v3.pkl"
+AFFINE_PATH = "scaler_v3_affine.npz"
+
+def main():
+    with open(SCALER_PATH, "rb") as f:
+        scaler = pickle.load(f)
+    affine = AffineScaler.from_sklearn(scaler)
+    affine.save(AFFINE_PATH)
+    print(f"✅ {SCALER_PATH} -> {AFFINE_PATH} ({affine.n_features_in_} features)")
+
+if __name__ == "__main__":
+    main()
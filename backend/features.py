@@ -0,0 +1,124 @@
+# features.py - Vectorized landmark feature extraction for the ASL models
+
+import cv2
+import numpy as np
+
+# Joint triples (a, b, c) whose angle at b is measured; 2 per finger
+ANGLE_TRIPLES = np.array([
+    (1, 2, 3), (2, 3, 4),        # thumb
+    (5, 6, 7), (6, 7, 8),        # index
+    (9, 10, 11), (10, 11, 12),   # middle
+    (13, 14, 15), (14, 15, 16),  # ring
+    (17, 18, 19), (18, 19, 20),  # pinky
+], dtype=np.intp)
+WRIST = 0
+TIPS = np.array([4, 8, 12, 16, 20], dtype=np.intp)
+
+N_LANDMARKS = 21
+N_FEATURES = N_LANDMARKS * 3 + len(ANGLE_TRIPLES) + len(TIPS) + 1  # 79
+
+def landmarks_to_array(landmarks):
+    """
+    Convert MediaPipe landmark objects to a (21, 3) float32 array.
+    Arrays are passed through unchanged (as float32).
+    """
+    if isinstance(landmarks, np.ndarray):
+        return landmarks.astype(np.float32, copy=False)
+    return np.array([(p.x, p.y, p.z) for p in landmarks], dtype=np.float32)
+
+def mirror_landmarks(coords, image_space):
+    """
+    Mirror landmarks horizontally, as if they had been detected on a
+    cv2.flip(frame, 1) image, so the frame itself never has to be flipped.
+    image_space=True: normalized image coords, x -> 1 - x
+    image_space=False: world coords (metres around the hand centre), x -> -x
+    Angles, tip distances and hull area are reflection-invariant; only the
+    raw coordinates change.
+    """
+    mirrored = landmarks_to_array(coords).copy()
+    mirrored[..., 0] = 1.0 - mirrored[..., 0] if image_space else -mirrored[..., 0]
+    return mirrored
+
+def landmark_angles(coords):
+    """
+    Compute 2 joint angles per finger from world landmarks.
+    coords: (21, 3) or (N, 21, 3)
+    Returns a (10,) or (N, 10) array of angles in degrees.
+    """
+    coords = landmarks_to_array(coords)
+    a = coords[..., ANGLE_TRIPLES[:, 0], :]
+    b = coords[..., ANGLE_TRIPLES[:, 1], :]
+    c = coords[..., ANGLE_TRIPLES[:, 2], :]
+    v1 = a - b
+    v2 = c - b
+    dot = np.einsum('...ij,...ij->...i', v1, v2)
+    norms = np.linalg.norm(v1, axis=-1) * np.linalg.norm(v2, axis=-1)
+    cosang = np.clip(dot / (norms + 1e-6), -1, 1)
+    return np.degrees(np.arccos(cosang)).astype(np.float32)
+
+def tip_distances(coords):
+    """
+    Compute Euclidean distance from each fingertip to the wrist.
+    coords: (21, 3) or (N, 21, 3)
+    Returns a (5,) or (N, 5) array of distances.
+    """
+    coords = landmarks_to_array(coords)
+    return np.linalg.norm(coords[..., TIPS, :] - coords[..., WRIST:WRIST + 1, :], axis=-1)
+
+def hull_area(img_coords, w, h):
+    """
+    Compute 2D convex-hull area of the hand projection.
+    img_coords: (21, 2+) normalized image-space landmarks
+    w,h: frame width & height in pixels
+    """
+    # float64 scaling + truncation matches int(p.x*w) on the raw landmarks
+    pts = landmarks_to_array(img_coords)[:, :2] * np.array([w, h], dtype=np.float64)
+    hull = cv2.convexHull(pts.astype(np.int32))
+    return cv2.contourArea(hull)
+
+def get_hand_bbox(landmarks, frame_shape, pad=0.2):
+    """
+    Return a padded bounding box (x1,y1,x2,y2) in pixel coords
+    around the hand landmarks.
+    """
+    h, w = frame_shape[:2]
+    pts = landmarks_to_array(landmarks)
+    (min_x, min_y), (max_x, max_y) = pts[:, :2].min(axis=0), pts[:, :2].max(axis=0)
+    x1 = int(max(0, (min_x - pad) * w))
+    x2 = int(min(w, (max_x + pad) * w))
+    y1 = int(max(0, (min_y - pad) * h))
+    y2 = int(min(h, (max_y + pad) * h))
+    return x1, y1, x2, y2
+
+def extract_features(world_lms, img_lms, w, h):
+    """
+    Build the 79-value feature vector for the main model:
+    63 world coords, 10 joint angles, 5 tip distances, hull area.
+    Landmarks may be MediaPipe objects or arrays; each is converted once.
+    Returns a (79,) float32 array.
+    """
+    world = landmarks_to_array(world_lms)
+    feat = np.empty(N_FEATURES, dtype=np.float32)
+    feat[:63] = world.reshape(-1)
+    feat[63:73] = landmark_angles(world)
+    feat[73:78] = tip_distances(world)
+    feat[78] = hull_area(img_lms, w, h)
+    return feat
+
+def extract_features_batch(world, img, w, h):
+    """
+    Batched variant for offline re-featurization.
+    world: (N, 21, 3) world landmarks
+    img: (N, 21, 2+) normalized image landmarks
+    Returns an (N, 79) float32 array.
+    """
+    world = landmarks_to_array(world)
+    img = landmarks_to_array(img)
+    n = world.shape[0]
+    feats = np.empty((n, N_FEATURES), dtype=np.float32)
+    feats[:, :63] = world.reshape(n, -1)
+    feats[:, 63:73] = landmark_angles(world)
+    feats[:, 73:78] = tip_distances(world)
+    # Hull construction is inherently sequential; one cv2 call per hand
+    feats[:, 78] = [hull_area(pts, w, h) for pts in img]
+    return feats
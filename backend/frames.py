@@ -0,0 +1,60 @@
+# frames.py - Webcam frame decoding for the /predict endpoints
+
+import base64
+import io
+
+import numpy as np
+from PIL import Image
+
+ENCODED_TYPES = {'image/jpeg', 'image/jpg', 'image/png', 'image/webp'}
+RAW_RGB_TYPES = {'application/octet-stream', 'image/x-raw-rgb'}
+
+def decode_base64_frame(image_data):
+    """
+    Legacy path: base64 (optionally data-URL) string -> RGB uint8 array.
+    """
+    image_data = image_data.split(',')[1] if ',' in image_data else image_data
+    image_bytes = base64.b64decode(image_data)
+    image = Image.open(io.BytesIO(image_bytes))
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    return np.asarray(image)
+
+def decode_encoded_frame(data):
+    """
+    JPEG/PNG bytes -> RGB uint8 array, decoded by Pillow straight from the
+    request body. Pillow's libjpeg-turbo decodes to RGB directly; going
+    through cv2.imdecode (BGR) plus a BGR->RGB pass was slower than the
+    legacy base64 path it replaced.
+    """
+    try:
+        image = Image.open(io.BytesIO(data))
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        return np.asarray(image)
+    except (OSError, SyntaxError, Image.DecompressionBombError) as e:
+        raise ValueError(f"Could not decode image bytes: {e}")
+
+def decode_raw_rgb_frame(data, width, height):
+    """
+    Raw packed RGB bytes -> (height, width, 3) view, no copy.
+    """
+    expected = width * height * 3
+    if width <= 0 or height <= 0 or len(data) != expected:
+        raise ValueError(f"Expected {expected} bytes for {width}x{height} RGB, got {len(data)}")
+    return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+
+def decode_frame_bytes(data, content_type, width=None, height=None):
+    """
+    Decode a binary request body based on its Content-Type.
+    Raw RGB bodies need the frame width/height (from request headers).
+    Returns an RGB uint8 array.
+    """
+    content_type = (content_type or '').split(';')[0].strip().lower()
+    if content_type in RAW_RGB_TYPES:
+        if width is None or height is None:
+            raise ValueError("Raw RGB frames need X-Frame-Width and X-Frame-Height headers")
+        return decode_raw_rgb_frame(data, int(width), int(height))
+    if content_type in ENCODED_TYPES or not content_type:
+        return decode_encoded_frame(data)
+    raise ValueError(f"Unsupported Content-Type '{content_type}'")
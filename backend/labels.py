@@ -0,0 +1,51 @@
+# labels.py - Index -> label lookup arrays replacing LabelEncoder.inverse_transform
+
+import numpy as np
+
+class LabelLookup:
+    """
+    Plain index -> label array built once from a fitted LabelEncoder (or a
+    class list). Decoding is an argmax and an array index, vectorized over
+    batches, with none of sklearn's per-call validation.
+    """
+    def __init__(self, classes):
+        self.classes = np.array([str(c) for c in classes], dtype=object)
+
+    @classmethod
+    def from_encoder(cls, encoder):
+        return cls(encoder.classes_)
+
+    @property
+    def classes_(self):
+        return self.classes
+
+    def __len__(self):
+        return len(self.classes)
+
+    def __getitem__(self, idx):
+        return self.classes[idx]
+
+    def inverse_transform(self, indices):
+        """Drop-in for LabelEncoder.inverse_transform (no validation)"""
+        return self.classes[np.asarray(indices, dtype=np.intp)]
+
+    def decode(self, probs):
+        """
+        probs: (C,) -> (label, confidence)
+               (N, C) -> (labels (N,) array, confidences (N,) array)
+        """
+        probs = np.asarray(probs)
+        idx = np.argmax(probs, axis=-1)
+        if probs.ndim == 1:
+            return self.classes[idx], float(probs[idx])
+        return self.classes[idx], probs[np.arange(len(idx)), idx]
+
+    def top_k(self, probs, k=5):
+        """Ranked [(label, probability), ...] for one (C,) row, best first"""
+        probs = np.asarray(probs).ravel()
+        k = min(max(int(k), 0), len(probs))
+        if k == 0:
+            return []
+        idx = np.argpartition(-probs, k - 1)[:k] if k < len(probs) else np.arange(len(probs))
+        idx = idx[np.argsort(-probs[idx])]
+        return [(self.classes[i], float(probs[i])) for i in idx]
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Concurrent-connection load test for the glove endpoints.
+
+For each level of idle connections (gloves that connected but are slow to
+send: partial request headers, held open), ACTIVE gloves post readings
+over keep-alive connections at GLOVE_HZ for DURATION_S. Reports active
+glove throughput, p50/p99 latency, errors, and the server's thread count
+and RSS, so the Flask server (a thread per connection) can be compared
+with async_glove.py (a socket per connection).
+
+Usage:
+  python app.py            (or: python async_glove.py)
+  python loadtest_glove.py --server-pid <pid> [--idle 0 100 1000 4000]
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import time
+
+import numpy as np
+
+HOST = "127.0.0.1"
+PORT = 5000
+ACTIVE = 50
+GLOVE_HZ = 20
+DURATION_S = 10.0
+REQUEST_TIMEOUT_S = 5.0
+
+def raise_fd_limit():
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    return hard
+
+def server_stats(pid):
+    """(threads, RSS MB) of the server process, or (None, None)"""
+    if not pid:
+        return None, None
+    threads = rss = None
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("Threads:"):
+                threads = int(line.split()[1])
+            elif line.startswith("VmRSS:"):
+                rss = int(line.split()[1]) / 1024.0
+    return threads, rss
+
+async def open_idle(host, port, n):
+    """n connections that send half a request and then hang"""
+    conns = []
+    for _ in range(n):
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b"POST /esp32/predict HTTP/1.1\r\nHost: glove\r\n")
+            await writer.drain()
+            conns.append(writer)
+        except OSError:
+            break
+    return conns
+
+async def post(reader, writer, body):
+    writer.write(b"POST /esp32/predict HTTP/1.1\r\nHost: glove\r\nContent-Type: application/json\r\n"
+                 b"Connection: keep-alive\r\nContent-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body)
+    await writer.drain()
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed")
+    length, keep_alive = 0, True
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        name = name.strip().lower()
+        if name == "content-length":
+            length = int(value)
+        elif name == "connection" and value.strip().lower() == "close":
+            keep_alive = False
+    await reader.readexactly(length)
+    return int(status_line.split()[1]), keep_alive
+
+async def active_glove(host, port, device, deadline, latencies, errors):
+    rng = np.random.default_rng(device)
+    reader = writer = None
+    interval = 1.0 / GLOVE_HZ
+    while time.perf_counter() < deadline:
+        body = json.dumps({"device": f"load-{device}",
+                           "sensor_values": rng.integers(0, 4096, 5).tolist()}).encode()
+        start = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), REQUEST_TIMEOUT_S)
+            status, keep_alive = await asyncio.wait_for(post(reader, writer, body), REQUEST_TIMEOUT_S)
+            if status != 200:
+                errors.append(status)
+            else:
+                latencies.append((time.perf_counter() - start) * 1000.0)
+            if not keep_alive:
+                writer.close()
+                writer = None
+        except (OSError, asyncio.TimeoutError, ConnectionError, asyncio.IncompleteReadError) as e:
+            errors.append(type(e).__name__)
+            if writer is not None:
+                writer.close()
+            writer = None
+        await asyncio.sleep(max(0.0, interval - (time.perf_counter() - start)))
+    if writer is not None:
+        writer.close()
+
+async def run_level(host, port, idle, active, duration, pid):
+    idle_conns = await open_idle(host, port, idle)
+    await asyncio.sleep(0.5)
+    threads, rss = server_stats(pid)
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(active_glove(host, port, d, deadline, latencies, errors) for d in range(active)))
+    for writer in idle_conns:
+        writer.close()
+    lat = np.array(latencies) if latencies else np.zeros(1)
+    return {
+        "idle_open": len(idle_conns),
+        "ok": len(latencies),
+        "errors": len(errors),
+        "rps": len(latencies) / duration,
+        "p50_ms": float(np.percentile(lat, 50)),
+        "p99_ms": float(np.percentile(lat, 99)),
+        "server_threads": threads,
+        "server_rss_mb": rss,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--idle", type=int, nargs="+", default=[0, 100, 1000, 4000])
+    parser.add_argument("--active", type=int, default=ACTIVE)
+    parser.add_argument("--duration", type=float, default=DURATION_S)
+    parser.add_argument("--server-pid", type=int, help="report the server's threads and RSS")
+    args = parser.parse_args()
+
+    print(f"⏱️  Glove load test against {args.host}:{args.port} "
+          f"({args.active} active gloves at {GLOVE_HZ} Hz, fd limit {raise_fd_limit()})")
+    print("=" * 92)
+    print(f"{'idle conns':>10} {'ok':>7} {'errors':>7} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'threads':>8} {'RSS MB':>8}")
+    for idle in args.idle:
+        r = asyncio.run(run_level(args.host, args.port, idle, args.active, args.duration, args.server_pid))
+        threads = r['server_threads'] if r['server_threads'] is not None else '-'
+        rss = f"{r['server_rss_mb']:.0f}" if r['server_rss_mb'] is not None else '-'
+        print(f"{r['idle_open']:>10} {r['ok']:>7} {r['errors']:>7} {r['rps']:>8.1f} {r['p50_ms']:>8.2f} "
+              f"{r['p99_ms']:>8.2f} {threads:>8} {rss:>8}")
+    print("=" * 92)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# metrics.py - Lightweight in-process metrics for the Flask backend
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Default bucket bounds
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+LATENCY_MS_BUCKETS = (0.5, 1, 2, 3, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+class Histogram:
+    """
+    Thread-safe fixed-bucket histogram.
+    buckets: sorted upper bounds; values above the last bound go to +Inf.
+    """
+    def __init__(self, name, buckets):
+        self.name = name
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._sum = 0.0
+            self._count = 0
+
+    def observe(self, value):
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[idx] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self):
+        """
+        Return cumulative bucket counts (Prometheus style) plus count/sum/mean.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total, count = self._sum, self._count
+        cumulative = {}
+        running = 0
+        for bound, c in zip(list(self.buckets) + ['+Inf'], counts):
+            running += c
+            cumulative[str(bound)] = running
+        return {
+            'buckets': cumulative,
+            'count': count,
+            'sum': total,
+            'mean': total / count if count else 0.0,
+        }
+
+    def prometheus_lines(self, name, labels=None):
+        """Bucket/sum/count sample lines in Prometheus text format"""
+        with self._lock:
+            counts = list(self._counts)
+            total, count = self._sum, self._count
+        base = dict(labels or {})
+        lines = []
+        running = 0
+        for bound, c in zip(list(self.buckets) + ['+Inf'], counts):
+            running += c
+            lines.append(f"{name}_bucket{_labels(dict(base, le=bound))} {running}")
+        lines.append(f"{name}_sum{_labels(base)} {total}")
+        lines.append(f"{name}_count{_labels(base)} {count}")
+        return lines
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{v}"' for k, v in labels.items()) + '}'
+
+def render_histograms(name, help_text, series):
+    """
+    Prometheus text for several Histograms sharing one metric name.
+    series: iterable of (labels dict, Histogram)
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for labels, hist in series:
+        lines.extend(hist.prometheus_lines(name, labels))
+    return '\n'.join(lines)
+
+class LabeledHistogram:
+    """
+    One Histogram per value of a single label, e.g. per pipeline stage.
+    span(value) times a block in milliseconds.
+    """
+    def __init__(self, name, help_text, label, buckets=LATENCY_MS_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label = label
+        self.buckets = buckets
+        self._hists = {}
+        self._lock = threading.Lock()
+
+    def _get(self, value):
+        hist = self._hists.get(value)
+        if hist is None:
+            with self._lock:
+                hist = self._hists.setdefault(value, Histogram(f"{self.name}_{value}", self.buckets))
+        return hist
+
+    def observe(self, value, amount):
+        self._get(value).observe(amount)
+
+    @contextmanager
+    def span(self, value):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._get(value).observe((time.perf_counter() - start) * 1000.0)
+
+    def snapshot(self):
+        return {value: hist.snapshot() for value, hist in list(self._hists.items())}
+
+    def render(self):
+        series = [({self.label: value}, hist) for value, hist in list(self._hists.items())]
+        return render_histograms(self.name, self.help_text, series)
+
+class Counter:
+    """Thread-safe counter keyed by a fixed tuple of label values"""
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def get(self, *labels):
+        return self._values.get(labels, 0)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            lines.append(f"{self.name}{_labels(dict(zip(self.labelnames, labels)))} {value}")
+        return '\n'.join(lines)
+
+def render_samples(name, help_text, kind, series):
+    """
+    Prometheus text for values read from elsewhere (e.g. cache stats).
+    kind: 'counter' or 'gauge'; series: iterable of (labels dict, value)
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for labels, value in series:
+        lines.append(f"{name}{_labels(labels)} {value}")
+    return '\n'.join(lines)
+
+def render_prometheus(*sections):
+    """Join rendered metric families into one /metrics body"""
+    return '\n'.join(s for s in sections if s) + '\n'
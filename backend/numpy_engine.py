@@ -0,0 +1,163 @@
+# numpy_engine.py - TensorFlow-free forward pass for small exported Keras models
+
+import io
+import json
+import time
+import zipfile
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+ACTIVATIONS = {
+    'linear': lambda x: x,
+    'relu': lambda x: np.maximum(x, 0.0, out=x),
+    'sigmoid': lambda x: 1.0 / (1.0 + np.exp(-x)),
+    'tanh': np.tanh,
+}
+
+def softmax(x):
+    x = x - x.max(axis=-1, keepdims=True)
+    np.exp(x, out=x)
+    x /= x.sum(axis=-1, keepdims=True)
+    return x
+
+ACTIVATIONS['softmax'] = softmax
+
+def _same_padding(length, size, stride):
+    """(left, right) padding Keras uses for padding='same'"""
+    out = -(-length // stride)
+    total = max((out - 1) * stride + size - length, 0)
+    return total // 2, total - total // 2
+
+def conv1d(x, kernel, bias, stride, padding):
+    """x: (N, L, Cin), kernel: (k, Cin, Cout) -> (N, L', Cout) as one matmul"""
+    k = kernel.shape[0]
+    if padding == 'same':
+        x = np.pad(x, ((0, 0), _same_padding(x.shape[1], k, stride), (0, 0)))
+    windows = sliding_window_view(x, k, axis=1)[:, ::stride]        # (N, L', Cin, k)
+    cols = windows.transpose(0, 1, 3, 2).reshape(x.shape[0], -1, k * x.shape[2])
+    out = cols @ kernel.reshape(k * kernel.shape[1], kernel.shape[2])
+    if bias is not None:
+        out += bias
+    return out
+
+def max_pool1d(x, size, stride, padding):
+    if padding == 'same':
+        x = np.pad(x, ((0, 0), _same_padding(x.shape[1], size, stride), (0, 0)), constant_values=-np.inf)
+    return sliding_window_view(x, size, axis=1)[:, ::stride].max(axis=-1)
+
+def _first(value):
+    return int(np.ravel(value)[0])
+
+def layer_spec(kind, config, n_weights):
+    """Engine spec for one layer from its Keras class name and get_config()"""
+    spec = {'type': kind, 'n_weights': n_weights}
+    if config.get('activation') not in (None, 'linear'):
+        spec['activation'] = config['activation']
+    if kind == 'Conv1D':
+        if config['dilation_rate'] not in (1, (1,), [1]) or config.get('groups', 1) != 1:
+            raise ValueError(f"{config.get('name')}: dilated / grouped Conv1D is not supported")
+        spec.update(strides=_first(config['strides']), padding=config['padding'])
+    elif kind == 'MaxPooling1D':
+        pool = _first(config['pool_size'])
+        spec.update(pool_size=pool, strides=_first(config.get('strides') or pool), padding=config['padding'])
+    elif kind == 'Rescaling':
+        spec.update(scale=float(config['scale']), offset=float(config['offset']))
+    return spec
+
+def load_keras_file(path):
+    """
+    (spec, weights per layer) straight from a Keras 3 .keras archive
+    (config.json + model.weights.h5), without TensorFlow. Only plain
+    layer stacks (Sequential, or a Functional chain) are supported.
+    """
+    import h5py
+    with zipfile.ZipFile(path) as archive:
+        config = json.loads(archive.read('config.json'))
+        weights_file = io.BytesIO(archive.read('model.weights.h5'))
+    if config['class_name'] not in ('Sequential', 'Functional'):
+        raise ValueError(f"{path}: unsupported model class {config['class_name']}")
+    layer_configs = config['config']['layers']
+    spec = {'input_shape': None, 'layers': []}
+    weights = []
+    with h5py.File(weights_file, 'r') as h5:
+        for i, layer in enumerate(layer_configs):
+            kind, cfg = layer['class_name'], layer['config']
+            if kind == 'InputLayer':
+                spec['input_shape'] = list(cfg['batch_shape'][1:])
+                continue
+            inbound = layer.get('inbound_nodes') or []
+            if config['class_name'] == 'Functional' and inbound:
+                history = inbound[0]['args'][0]['config']['keras_history'][0]
+                if history != layer_configs[i - 1]['config']['name']:
+                    raise ValueError(f"{path}: {cfg['name']} is not a plain layer stack")
+            group = h5.get(f"layers/{cfg['name']}/vars")
+            arrays = [] if group is None else [group[k][()].astype(np.float32) for k in sorted(group, key=int)]
+            spec['layers'].append(layer_spec(kind, cfg, len(arrays)))
+            weights.append(arrays)
+    if spec['input_shape'] is None:
+        spec['input_shape'] = list(cfg.get('build_config', {}).get('input_shape', [None])[1:])
+    return spec, weights
+
+class NumpyEngine:
+    """
+    Runs a small Keras layer stack with the same call interface as
+    InferenceEngine / TFLiteEngine: engine(x) with x shaped
+    (N, *input_shape) returns (N, outputs) float32.
+
+    Reads the weights straight from the .keras archive (h5py, no
+    TensorFlow), or from an npz written by export_glove_numpy.py.
+    Supports the layers the glove CNN uses (Conv1D, MaxPooling1D,
+    GlobalMax/AveragePooling1D, Flatten, Dense, Dropout, Rescaling).
+    """
+    def __init__(self, model_path, name=None):
+        self.model_path = model_path
+        self.name = name or model_path
+        if model_path.endswith('.keras'):
+            spec, weights = load_keras_file(model_path)
+        else:
+            with np.load(model_path, allow_pickle=False) as data:
+                spec = json.loads(str(data['spec']))
+                weights = [[data[f'{i}_{j}'].astype(np.float32) for j in range(layer.get('n_weights', 0))]
+                           for i, layer in enumerate(spec['layers'])]
+        self.input_shape = tuple(spec['input_shape'])
+        self.layers = list(zip(spec['layers'], weights))
+        self.warmup_ms = None
+
+    def warmup(self, batch_size=1):
+        start = time.perf_counter()
+        self(np.zeros((batch_size,) + self.input_shape, dtype=np.float32))
+        self.warmup_ms = (time.perf_counter() - start) * 1000.0
+        return self
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=np.float32).reshape((-1,) + self.input_shape)
+        for layer, weights in self.layers:
+            kind = layer['type']
+            if kind == 'Conv1D':
+                x = conv1d(x, weights[0], weights[1] if len(weights) > 1 else None,
+                           layer['strides'], layer['padding'])
+            elif kind == 'Dense':
+                x = x @ weights[0]
+                if len(weights) > 1:
+                    x += weights[1]
+            elif kind == 'MaxPooling1D':
+                x = max_pool1d(x, layer['pool_size'], layer['strides'], layer['padding'])
+            elif kind == 'GlobalMaxPooling1D':
+                x = x.max(axis=1)
+            elif kind == 'GlobalAveragePooling1D':
+                x = x.mean(axis=1)
+            elif kind == 'Flatten':
+                x = x.reshape(len(x), -1)
+            elif kind == 'Rescaling':
+                x = x * np.float32(layer['scale']) + np.float32(layer['offset'])
+            elif kind in ('Dropout', 'InputLayer'):
+                continue
+            else:
+                raise ValueError(f"Unsupported layer type {kind}")
+            if 'activation' in layer:
+                x = ACTIVATIONS[layer['activation']](x)
+        return x
+
+    def predict(self, x):
+        return self(x)
@@ -0,0 +1,48 @@
+# preprocess.py - sklearn StandardScaler folded into a NumPy affine transform
+
+import os
+import pickle
+
+import numpy as np
+
+class AffineScaler:
+    """
+    StandardScaler.transform as a single multiply-add: x * a + b with
+    a = 1 / scale_ and b = -mean_ / scale_, precomputed in float32.
+    No sklearn input validation on the hot path; same transform() API.
+    """
+    def __init__(self, a, b):
+        self.a = np.ascontiguousarray(a, dtype=np.float32)
+        self.b = np.ascontiguousarray(b, dtype=np.float32)
+        self.n_features_in_ = len(self.a)
+
+    @classmethod
+    def from_sklearn(cls, scaler):
+        n = scaler.n_features_in_
+        mean = scaler.mean_ if getattr(scaler, 'mean_', None) is not None else np.zeros(n)
+        scale = scaler.scale_ if getattr(scaler, 'scale_', None) is not None else np.ones(n)
+        mean = np.asarray(mean, dtype=np.float64)
+        scale = np.asarray(scale, dtype=np.float64)
+        # Fold in float64, store float32
+        return cls(1.0 / scale, -mean / scale)
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        return cls(data['a'], data['b'])
+
+    def save(self, path):
+        np.savez(path, a=self.a, b=self.b)
+
+    def transform(self, x):
+        """x: (N, F) or (F,) features -> standardized float32, same shape"""
+        out = np.multiply(x, self.a, dtype=np.float32)
+        out += self.b
+        return out
+
+def load_scaler(npz_path, pickle_path):
+    """AffineScaler from the exported npz, else folded from the sklearn pickle"""
+    if os.path.exists(npz_path):
+        return AffineScaler.load(npz_path)
+    with open(pickle_path, "rb") as f:
+        return AffineScaler.from_sklearn(pickle.load(f))
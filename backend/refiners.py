@@ -0,0 +1,44 @@
+# refiners.py - Batched refiner stage shared by concurrent webcam requests
+
+import numpy as np
+
+from batching import MicroBatcher
+
+REFINER_INPUT_SIZE = 128
+
+class RefinerStage:
+    """
+    Coalesces hand crops from concurrent requests into one batched call
+    per refiner per scheduling tick.
+
+    Callers submit resized uint8 crops (REFINER_INPUT_SIZE x REFINER_INPUT_SIZE x 3);
+    the batching thread scales them to [0, 1] straight into a preallocated
+    float32 buffer, so there is no float64 intermediate and no per-batch
+    allocation.
+    """
+    def __init__(self, engine, name, max_batch_size=16, max_wait_ms=2.0, size=REFINER_INPUT_SIZE):
+        self.engine = engine
+        self.name = name
+        self._buffer = np.empty((max_batch_size, size, size, 3), dtype=np.float32)
+        self.batcher = MicroBatcher(
+            engine,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            name=f"{name}_batcher",
+            collate_fn=self._collate,
+        ).start()
+
+    def _collate(self, crops):
+        # Only the batcher thread calls this, and the engine copies its
+        # input into a tensor before the buffer is reused
+        batch = self._buffer[:len(crops)]
+        for i, crop in enumerate(crops):
+            np.multiply(crop, np.float32(1.0 / 255.0), out=batch[i], casting='unsafe')
+        return batch
+
+    def __call__(self, crop):
+        """crop: resized uint8 crop; returns this crop's output row"""
+        return self.batcher.predict(crop)
+
+    def stats(self):
+        return self.batcher.stats()
@@ -0,0 +1,124 @@
+# registry.py - Concurrent / lazy model loading with readiness reporting
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+PENDING = 'pending'
+LAZY = 'lazy'
+LOADING = 'loading'
+READY = 'ready'
+FAILED = 'failed'
+DISABLED = 'disabled'
+
+class Artifact:
+    """One loadable thing (model, encoder, graph) and its load state"""
+    def __init__(self, name, loader, required, lazy):
+        self.name = name
+        self.loader = loader
+        self.required = required
+        self.lazy = lazy
+        self.state = LAZY if lazy else PENDING
+        self.value = None
+        self.error = None
+        self.load_ms = None
+        self.done = threading.Event()
+        self.lock = threading.Lock()
+
+    def load(self):
+        """Run the loader once; concurrent callers wait for the first"""
+        with self.lock:
+            if self.done.is_set() or self.state == LOADING:
+                started = False
+            else:
+                self.state = LOADING
+                started = True
+        if not started:
+            self.done.wait()
+            return
+        start = time.perf_counter()
+        try:
+            self.value = self.loader()
+            self.state = READY
+            print(f"✅ {self.name} ready ({(time.perf_counter() - start) * 1000:.0f} ms)")
+        except Exception as e:
+            self.error = str(e)
+            self.state = FAILED
+            print(f"❌ {self.name} failed to load: {e}")
+        finally:
+            self.load_ms = (time.perf_counter() - start) * 1000.0
+            self.done.set()
+
+class ModelRegistry:
+    """
+    Loads eager artifacts concurrently on background threads and lazy ones
+    on first get(). get() blocks until the artifact is ready.
+    """
+    def __init__(self, max_workers=4):
+        self._artifacts = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="model-loader")
+        self.started_at = None
+
+    def register(self, name, loader, required=True, lazy=False):
+        self._artifacts[name] = Artifact(name, loader, required, lazy)
+
+    def disable(self, *names):
+        """Never load these (e.g. a serving mode that doesn't need them)"""
+        for name in names:
+            artifact = self._artifacts[name]
+            artifact.state = DISABLED
+            artifact.error = "disabled in this serving mode"
+            artifact.done.set()
+
+    def start(self):
+        """Kick off every eager artifact in the background"""
+        self.started_at = time.perf_counter()
+        for artifact in self._artifacts.values():
+            if not artifact.lazy and artifact.state != DISABLED:
+                self._executor.submit(artifact.load)
+        return self
+
+    def get(self, name, timeout=None):
+        artifact = self._artifacts[name]
+        if not artifact.done.is_set():
+            if artifact.lazy:
+                artifact.load()
+            elif not artifact.done.wait(timeout):
+                raise TimeoutError(f"{name} is still loading")
+        if artifact.state in (FAILED, DISABLED):
+            raise RuntimeError(f"{name} failed to load: {artifact.error}")
+        return artifact.value
+
+    def state(self, name):
+        return self._artifacts[name].state
+
+    def peek(self, name):
+        """Value if already loaded, else None; never triggers or waits for a load"""
+        artifact = self._artifacts[name]
+        return artifact.value if artifact.state == READY else None
+
+    def wait_until_ready(self, timeout=None):
+        """Block until all required artifacts have finished; True if all loaded"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for artifact in self._artifacts.values():
+            if artifact.required and not artifact.lazy and artifact.state != DISABLED:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                artifact.done.wait(remaining)
+        return self.ready()
+
+    def ready(self):
+        """All required eager artifacts loaded; lazy ones load on demand and never block readiness"""
+        return all(a.state == READY for a in self._artifacts.values()
+                   if a.required and not a.lazy and a.state != DISABLED)
+
+    def status(self):
+        return {
+            name: {
+                'state': a.state,
+                'required': a.required,
+                'lazy': a.lazy,
+                'load_ms': a.load_ms,
+                'error': a.error,
+            }
+            for name, a in self._artifacts.items()
+        }
@@ -0,0 +1,128 @@
+# roi.py - Hand region-of-interest tracking to avoid full-frame detection
+
+import threading
+
+import cv2
+import numpy as np
+
+from features import landmarks_to_array
+
+class ROITracker:
+    """
+    Remembers where the hand was in the previous frames of a session. While
+    the hand is tracked, MediaPipe only sees a padded square crop around it,
+    downscaled to `size` pixels, instead of the full frame; when the hand is
+    lost it falls back to the full frame.
+
+    `hands` is the session's own tracking-mode MediaPipe Hands and only
+    ever sees crops, so landmarks carry over between frames and palm
+    detection only runs after a loss. The crop window stays put until the
+    hand nears its edge or changes size, keeping the carried-over landmarks
+    in the same coordinates. Full frames go to a separate static-image
+    detector so they never disturb the tracked state.
+
+    Landmarks are returned in full-frame coordinates either way.
+    """
+    def __init__(self, hands, size=256, pad=0.25):
+        self.hands = hands
+        self.size = size
+        self.pad = pad
+        self.bbox = None   # (x1, y1, x2, y2) pixels in the raw frame
+        self.crop = None   # current crop window, pixels in the raw frame
+        self.crop_hand = None  # hand size when the crop was placed
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.recentered = 0
+        self.lost = 0
+        self.lock = threading.Lock()
+
+    def _roi(self, w, h):
+        """Padded square around the last bbox, clamped to the frame"""
+        x1, y1, x2, y2 = self.bbox
+        cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+        half = max(x2 - x1, y2 - y1) * (0.5 + self.pad)
+        rx1, ry1 = int(max(0, cx - half)), int(max(0, cy - half))
+        rx2, ry2 = int(min(w, cx + half)), int(min(h, cy + half))
+        return rx1, ry1, rx2, ry2
+
+    def _update_bbox(self, img, w, h):
+        xs, ys = img[:, 0] * w, img[:, 1] * h
+        self.bbox = (xs.min(), ys.min(), xs.max(), ys.max())
+
+    def _crop_window(self, w, h):
+        """Keep the crop while the hand sits well inside it at a similar size"""
+        x1, y1, x2, y2 = self.bbox
+        hand = max(x2 - x1, y2 - y1)
+        if self.crop is not None:
+            cx1, cy1, cx2, cy2 = self.crop
+            margin = hand * self.pad / 2
+            # Crop edges clamped to the frame border never need the margin
+            inside = ((cx1 == 0 or x1 - cx1 >= margin) and (cy1 == 0 or y1 - cy1 >= margin)
+                      and (cx2 == w or cx2 - x2 >= margin) and (cy2 == h or cy2 - y2 >= margin))
+            if inside and 0.8 <= hand / self.crop_hand <= 1.25:
+                return self.crop
+            self.recentered += 1
+        self.crop, self.crop_hand = self._roi(w, h), hand
+        return self.crop
+
+    @staticmethod
+    def _extract(res):
+        if not res.multi_hand_world_landmarks:
+            return None
+        world = landmarks_to_array(res.multi_hand_world_landmarks[0].landmark)
+        img = landmarks_to_array(res.multi_hand_landmarks[0].landmark)
+        return world, img
+
+    def process(self, rgb, detector):
+        """
+        Run MediaPipe on the ROI, or the full frame through `detector` (a
+        static-image Hands) when not tracking
+        Returns: (world (21, 3), img (21, 3) normalized to the full frame) or None
+        """
+        with self.lock:
+            return self._process(rgb, detector)
+
+    def _process(self, rgb, detector):
+        h, w = rgb.shape[:2]
+        if self.bbox is not None:
+            rx1, ry1, rx2, ry2 = self._crop_window(w, h)
+            cw, ch = rx2 - rx1, ry2 - ry1
+            if cw > 1 and ch > 1:
+                scale = min(1.0, self.size / max(cw, ch))
+                crop = rgb[ry1:ry2, rx1:rx2]
+                if scale < 1.0:
+                    crop = cv2.resize(crop, (max(1, round(cw * scale)), max(1, round(ch * scale))),
+                                      interpolation=cv2.INTER_AREA)
+                found = self._extract(self.hands.process(np.ascontiguousarray(crop)))
+                if found is not None:
+                    world, img = found
+                    # Map crop-normalized coords back onto the full frame
+                    img[:, 0] = (rx1 + img[:, 0] * cw) / w
+                    img[:, 1] = (ry1 + img[:, 1] * ch) / h
+                    img[:, 2] *= cw / w  # z shares x's scale
+                    self.roi_frames += 1
+                    self._update_bbox(img, w, h)
+                    return world, img
+            self.lost += 1
+            self.bbox = None
+            self.crop = None
+
+        self.full_frames += 1
+        found = self._extract(detector.process(rgb))
+        if found is not None:
+            self._update_bbox(found[1], w, h)
+        return found
+
+    def close(self):
+        with self.lock:
+            self.hands.close()
+
+    def stats(self):
+        total = self.roi_frames + self.full_frames
+        return {
+            'roi_frames': self.roi_frames,
+            'full_frames': self.full_frames,
+            'recentered': self.recentered,
+            'lost': self.lost,
+            'roi_fraction': self.roi_frames / total if total else 0.0,
+        }
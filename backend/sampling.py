@@ -0,0 +1,87 @@
+# sampling.py - Adaptive per-session frame skipping for a stable hand pose
+
+import threading
+from collections import deque
+
+import numpy as np
+
+class SkipStats:
+    """Thread-safe frame/skip counters shared by all samplers"""
+    def __init__(self):
+        self.frames = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    def record(self, skipped):
+        with self._lock:
+            self.frames += 1
+            self.skipped += skipped
+
+    def snapshot(self):
+        return {
+            'frames': self.frames,
+            'skipped': self.skipped,
+            'skipped_fraction': self.skipped / self.frames if self.frames else 0.0,
+        }
+
+def landmark_motion(prev, cur):
+    """Mean landmark displacement, relative to the hand's bbox size"""
+    size = max(np.ptp(cur[:, 0]), np.ptp(cur[:, 1]), 1e-6)
+    return float(np.linalg.norm(cur[:, :2] - prev[:, :2], axis=1).mean() / size)
+
+class StabilitySampler:
+    """
+    Decides per frame whether a session's prediction can be reused.
+
+    A frame is skipped (the cached prediction returned without running the
+    main model or refiners) when the hand moved less than motion_threshold
+    since the last frame AND the last agree_k full predictions agree. Any
+    motion drops straight back to full rate; max_skips forces a full
+    prediction every so often even for a perfectly still hand.
+    """
+    def __init__(self, motion_threshold=0.03, agree_k=3, max_skips=10, stats=None):
+        self.motion_threshold = motion_threshold
+        self.max_skips = max_skips
+        self.recent = deque(maxlen=agree_k)
+        self.last_lms = None
+        self.cached = None   # (prediction, confidence, ranked candidates)
+        self.skips_in_row = 0
+        self.frames = 0
+        self.skipped = 0
+        self.stats = stats
+        self.lock = threading.Lock()
+
+    def check(self, img_lms):
+        """Cached (prediction, confidence, candidates) if this frame can be skipped, else None"""
+        with self.lock:
+            prev, self.last_lms = self.last_lms, img_lms
+            self.frames += 1
+            skip = (
+                self.cached is not None
+                and prev is not None
+                and len(self.recent) == self.recent.maxlen
+                and len(set(self.recent)) == 1
+                and self.skips_in_row < self.max_skips
+                and landmark_motion(prev, img_lms) < self.motion_threshold
+            )
+            if skip:
+                self.skips_in_row += 1
+                self.skipped += 1
+            if self.stats is not None:
+                self.stats.record(skip)
+            return self.cached if skip else None
+
+    def update(self, prediction, confidence, candidates=()):
+        """Record a fully computed prediction"""
+        with self.lock:
+            self.recent.append(prediction)
+            self.cached = (prediction, confidence, list(candidates))
+            self.skips_in_row = 0
+
+    def reset(self):
+        """Hand lost: forget the pose so the next frame runs in full"""
+        with self.lock:
+            self.recent.clear()
+            self.last_lms = None
+            self.cached = None
+            self.skips_in_row = 0
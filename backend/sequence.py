@@ -0,0 +1,105 @@
+# sequence.py - Sliding-window streaming inference for the glove sequence model
+
+import numpy as np
+
+from labels import LabelLookup
+
+class ReadingRingBuffer:
+    """
+    Fixed-size ring buffer of the most recent sensor readings.
+
+    Storage is preallocated at 2 * window rows and every reading is written
+    twice (at i and i + window), so the current window is always the
+    contiguous slice data[head:head + window] - no per-sample allocation
+    and no np.roll/concatenate to read it out in time order.
+    """
+    def __init__(self, window, channels=5):
+        self.window = window
+        self.channels = channels
+        self._data = np.zeros((2 * window, channels), dtype=np.float32)
+        self._head = 0   # index of the oldest reading in the window
+        self.count = 0   # readings pushed so far (saturates at window)
+
+    def push(self, reading):
+        i = self._head
+        self._data[i] = reading
+        self._data[i + self.window] = reading
+        self._head = (i + 1) % self.window
+        if self.count < self.window:
+            self.count += 1
+
+    @property
+    def full(self):
+        return self.count == self.window
+
+    def view(self):
+        """(window, channels) view, oldest first. Valid until the next push."""
+        return self._data[self._head:self._head + self.window]
+
+    def reset(self):
+        self._head = 0
+        self.count = 0
+
+class SequenceStage:
+    """
+    Streaming classifier over each device's last `window` readings.
+    Buffers live on the device session (sessions.DeviceSession), so they are
+    evicted together with the session.
+
+    engine: callable (N, window, channels) -> (N, classes) probabilities
+    labels: LabelLookup or index -> letter list
+    stride: classify every `stride` samples once the window is full
+    """
+    def __init__(self, engine, labels, window, channels=5, stride=1):
+        self.engine = engine
+        self.labels = labels if isinstance(labels, LabelLookup) else LabelLookup(labels)
+        self.window = window
+        self.channels = channels
+        self.stride = max(1, int(stride))
+
+    def push(self, session, reading):
+        """
+        Append one reading for this device and classify the window if due.
+        Returns: (letter, confidence, warm); letter is None while warming up
+        (warm False) and between strides (warm True)
+        """
+        with session.lock:
+            buf = session.buffer
+            if buf is None:
+                buf = session.buffer = ReadingRingBuffer(self.window, self.channels)
+            buf.push(reading)
+            if not buf.full or session.samples_since_classify + 1 < self.stride:
+                session.samples_since_classify += 1
+                return None, 0.0, buf.full
+            session.samples_since_classify = 0
+            # Infer under the lock: the view is overwritten by the next push
+            probs = self.engine(buf.view()[np.newaxis])[0]
+        letter, confidence = self.labels.decode(probs)
+        return letter, confidence, True
+
+    def push_many(self, session, readings):
+        """
+        Append a batch of readings and classify every due window in one
+        forward pass.
+        Returns: list of (letter, confidence, warm) per reading, as push()
+        """
+        results = [(None, 0.0, True)] * len(readings)
+        due, windows = [], []
+        with session.lock:
+            buf = session.buffer
+            if buf is None:
+                buf = session.buffer = ReadingRingBuffer(self.window, self.channels)
+            for i, reading in enumerate(readings):
+                buf.push(reading)
+                if not buf.full or session.samples_since_classify + 1 < self.stride:
+                    session.samples_since_classify += 1
+                    results[i] = (None, 0.0, buf.full)
+                    continue
+                session.samples_since_classify = 0
+                due.append(i)
+                windows.append(buf.view().copy())
+        if windows:
+            letters, confidences = self.labels.decode(self.engine(np.stack(windows)))
+            for i, letter, p in zip(due, letters, confidences):
+                results[i] = (letter, float(p), True)
+        return results
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Glove-only server: /esp32/* (plus /health, /metrics and UDP ingestion on
+port 5005) without TensorFlow, MediaPipe or OpenCV. The glove CNN runs as a
+pure-NumPy forward pass over the weights in glove_cnn_model.keras (h5py),
+or through the TFLite interpreter with GLOVE_BACKEND=tflite / tflite_int8
+and tflite-runtime installed.
+"""
+
+import os
+import sys
+import time
+
+START = time.perf_counter()
+
+import app as backend
+
+GLOVE_BACKEND = os.environ.get("GLOVE_BACKEND", "numpy")
+PORT = int(os.environ.get("PORT", 5000))
+HEAVY_MODULES = ("tensorflow", "mediapipe", "cv2")
+
+def main():
+    backend.ESP32_BACKEND = GLOVE_BACKEND
+    backend.load_models(block=True, glove_only=True)
+    backend.start_esp32_udp()
+
+    loaded = [m for m in HEAVY_MODULES if m in sys.modules]
+    if loaded:
+        print(f"⚠️  Glove-only server imported {', '.join(loaded)}")
+    print(f"🚀 Glove-only server ready in {time.perf_counter() - START:.2f} s "
+          f"(backend={GLOVE_BACKEND}) on http://localhost:{PORT}")
+    backend.app.run(host='0.0.0.0', port=PORT, debug=False)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Production serving mode for webcam recognition: N inference worker
+processes (each loads the models once via app.load_models()) behind a
+lightweight Flask dispatcher with a bounded queue.
+
+When every worker is busy and the queue is full, requests are rejected with
+HTTP 503 + Retry-After instead of piling up. The dispatcher never imports
+TensorFlow or MediaPipe, so /health answers immediately.
+
+Serves /predict, /predict/frame and /health; glove traffic keeps using app.py.
+
+Usage: python serve_workers.py [num_workers]
+"""
+
+import hashlib
+import itertools
+import multiprocessing as mp
+import multiprocessing.connection
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+
+from flask import Flask, request, jsonify
+from flask_cors import CORS
+
+NUM_WORKERS = os.cpu_count() or 1
+QUEUE_PER_WORKER = 4        # queued requests allowed per worker before 503
+REQUEST_TIMEOUT_S = 10.0
+RETRY_AFTER_S = 1
+MAX_ATTEMPTS = 2            # dispatches per task when workers exit before starting it
+RESPAWN_DELAY_S = 1.0
+AFFINITY_SLACK = 1          # extra queued tasks a session's own worker may have before it spills over
+HOST = '0.0.0.0'
+PORT = 5000
+
+# --- Worker process --------------------------------------------------------
+
+def worker_main(task_queue, result_conn):
+    """
+    Load models once, then serve tasks until a None sentinel arrives.
+    Messages to the dispatcher go over this worker's own pipe, so a worker
+    dying mid-write can't block the others. They are (kind, pid, payload): 'ready' with the
+    registry's readiness (a worker whose models failed returns, exit code 0)
+    and 'done' with (task_id, status, result). Tasks are served in order.
+    """
+    # One thread per op per process: cores are used by processes, not TF pools
+    os.environ.setdefault("TF_NUM_INTRAOP_THREADS", "1")
+    os.environ.setdefault("TF_NUM_INTEROP_THREADS", "1")
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+    import app as backend
+    from frames import decode_frame_bytes
+    pid = os.getpid()
+    backend.load_models()
+    ready = backend.models.ready()
+    result_conn.send(('ready', pid, ready))
+    if not ready:
+        return
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        task_id, kind, payload, session_id, want_candidates = task
+        candidates = [] if want_candidates else None
+        try:
+            if kind == 'predict':
+                prediction = backend.predict_asl_letter(payload, session_id, candidates)
+            elif kind == 'frame':
+                data, content_type, width, height = payload
+                rgb = decode_frame_bytes(data, content_type, width, height)
+                prediction = backend.predict_asl_frame(rgb, session_id=session_id, candidates=candidates)
+            else:
+                raise ValueError(f"Unknown task kind '{kind}'")
+            result = backend.asl_response(*prediction, candidates)
+            result_conn.send(('done', pid, (task_id, 200, result)))
+        except ValueError as e:
+            result_conn.send(('done', pid, (task_id, 400, {'error': str(e)})))
+        except Exception as e:
+            result_conn.send(('done', pid, (task_id, 500, {'error': str(e)})))
+
+# --- Dispatcher --------------------------------------------------------
+
+class Worker:
+    """One worker slot: its process, private task queue and assigned tasks"""
+    def __init__(self, index):
+        self.index = index
+        self.process = None
+        self.queue = None
+        self.conn = None       # read end of the worker's result pipe
+        self.tasks = {}        # task id -> task tuple in queue order, until 'done' or exit
+        self.ready = False
+        self.failed = False
+        self.restarts = 0
+
+    @property
+    def alive(self):
+        return self.process is not None and not self.failed
+
+class WorkerPool:
+    """
+    N worker processes, each with its own task queue. A session's requests
+    go to the same worker (rendezvous hash over the live workers) so its ROI
+    tracker, frame sampler and refiner cache stay warm; when that worker has
+    more than AFFINITY_SLACK tasks over the least loaded one, the task goes
+    there instead. Each worker holds at most 1 + queue_per_worker tasks;
+    beyond that requests get a 503.
+
+    A worker that exits is respawned after RESPAWN_DELAY_S. Workers serve
+    their queue in order, so its oldest unfinished task is the one it was
+    running: that task fails with a 500, the rest are dispatched again (at
+    most MAX_ATTEMPTS times in total). A worker whose models failed to load
+    is not respawned.
+    """
+    def __init__(self, num_workers, queue_per_worker=QUEUE_PER_WORKER):
+        self._ctx = mp.get_context('spawn')  # don't fork a process that may hold TF state
+        self.num_workers = num_workers
+        self.per_worker = 1 + queue_per_worker
+        self._workers = [Worker(i) for i in range(num_workers)]
+        self._pending = {}     # task id -> (Future, attempts)
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._stopping = False
+        self.rejected = 0
+        self.redispatched = 0
+
+    def start(self):
+        for worker in self._workers:
+            self._spawn(worker)
+        threading.Thread(target=self._collect, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._stopping = True
+        for worker in self._workers:
+            if worker.process is not None and worker.process.is_alive():
+                worker.queue.put(None)
+        for worker in self._workers:
+            if worker.process is not None:
+                worker.process.join(timeout=5)
+
+    def _spawn(self, worker):
+        queue = self._ctx.Queue()
+        reader, writer = self._ctx.Pipe(duplex=False)
+        process = self._ctx.Process(target=worker_main, args=(queue, writer), daemon=True)
+        process.start()
+        writer.close()  # only the worker holds the write end: EOF means it exited
+        with self._lock:
+            worker.queue, worker.conn, worker.process = queue, reader, process
+
+    # Pool state, read by /health
+    @property
+    def ready(self):
+        return [w.index for w in self._workers if w.ready]
+
+    @property
+    def failed(self):
+        return [w.index for w in self._workers if w.failed]
+
+    @property
+    def processes(self):
+        return [w.process for w in self._workers if w.process is not None]
+
+    @property
+    def capacity(self):
+        return sum(w.alive for w in self._workers) * self.per_worker
+
+    @property
+    def workers_left(self):
+        return any(w.alive for w in self._workers)
+
+    @property
+    def restarts(self):
+        return sum(w.restarts for w in self._workers)
+
+    def _route(self, session_id):
+        """Worker for a task, or None when every live worker is full (lock held)"""
+        live = [w for w in self._workers if w.alive]
+        candidates = [w for w in live if w.ready] or live
+        if not candidates:
+            return None
+        key = (session_id or '').encode()
+        preferred = max(candidates, key=lambda w: hashlib.sha1(key + b'#%d' % w.index).digest())
+        least = min(candidates, key=lambda w: len(w.tasks))
+        if len(least.tasks) >= self.per_worker:
+            return None
+        if len(preferred.tasks) <= len(least.tasks) + AFFINITY_SLACK and len(preferred.tasks) < self.per_worker:
+            return preferred
+        return least
+
+    def submit(self, kind, payload, session_id=None, candidates=False):
+        """Queue a task; returns a Future, or None when saturated"""
+        with self._lock:
+            worker = self._route(session_id)
+            if worker is None:
+                self.rejected += 1
+                return None
+            task_id = next(self._ids)
+            fut = Future()
+            self._pending[task_id] = (fut, 1)
+            task = (task_id, kind, payload, session_id, candidates)
+            worker.tasks[task_id] = task
+            worker.queue.put(task)
+        return fut
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._pending)
+
+    def _finish(self, task_id, status, result):
+        """Resolve a task once"""
+        with self._lock:
+            entry = self._pending.pop(task_id, None)
+        if entry is not None:
+            entry[0].set_result((status, result))
+
+    def _collect(self):
+        """Read every worker's results; EOF on a pipe means that worker exited"""
+        while not self._stopping:
+            with self._lock:
+                conns = {w.conn: w for w in self._workers if w.conn is not None}
+            if not conns:
+                if all(w.failed for w in self._workers):
+                    break
+                time.sleep(0.1)  # every worker is waiting to respawn
+                continue
+            for conn in mp.connection.wait(list(conns), timeout=0.5):
+                worker = conns[conn]
+                try:
+                    kind, pid, payload = conn.recv()
+                except (EOFError, OSError):
+                    conn.close()
+                    with self._lock:
+                        worker.conn = None
+                    if not self._stopping:
+                        self._handle_exit(worker)
+                    continue
+                if kind == 'ready':
+                    if payload:
+                        worker.ready = True
+                        print(f"✅ Worker {pid} ready ({len(self.ready)}/{self.num_workers})")
+                    else:
+                        worker.failed = True
+                        print(f"❌ Worker {pid} failed to load its models, exiting")
+                elif kind == 'done':
+                    with self._lock:
+                        worker.tasks.pop(payload[0], None)
+                    self._finish(*payload)
+        # Nobody is left to pull queued tasks
+        with self._lock:
+            task_ids = list(self._pending)
+        for task_id in task_ids:
+            self._finish(task_id, 503, {'error': 'No inference workers running'})
+
+    def _handle_exit(self, worker):
+        process = worker.process
+        process.join(timeout=1.0)
+        with self._lock:
+            worker.process = None
+            tasks = list(worker.tasks.values())
+            worker.tasks = {}
+            was_ready, worker.ready = worker.ready, False
+            worker.failed = worker.failed or process.exitcode == 0
+        if not worker.failed:
+            worker.restarts += 1
+            print(f"⚠️  Worker {process.pid} exited (code {process.exitcode}), respawning")
+            threading.Timer(RESPAWN_DELAY_S, self._respawn, args=(worker,)).start()
+        if tasks and was_ready:
+            # The task it was running; retrying it could take down the next worker too
+            self._finish(tasks.pop(0)[0], 500, {'error': 'Inference worker exited'})
+        for task in tasks:
+            self._redispatch(task)
+
+    def _respawn(self, worker):
+        if not self._stopping:
+            self._spawn(worker)
+
+    def _redispatch(self, task):
+        task_id, _, _, session_id, _ = task
+        with self._lock:
+            entry = self._pending.get(task_id)
+            if entry is None:
+                return
+            fut, attempts = entry
+            worker = self._route(session_id) if attempts < MAX_ATTEMPTS else None
+            if worker is not None:
+                self._pending[task_id] = (fut, attempts + 1)
+                worker.tasks[task_id] = task
+                worker.queue.put(task)
+                self.redispatched += 1
+                return
+        if self.workers_left:
+            self._finish(task_id, 500, {'error': 'Inference worker exited'})
+        else:
+            self._finish(task_id, 503, {'error': 'No inference workers running'})
+
+app = Flask(__name__)
+CORS(app)
+pool = None
+
+def client_session_id():
+    """Same session derivation as app.client_session_id (header, else address + User-Agent)"""
+    session_id = request.headers.get('X-Session-Id')
+    if session_id:
+        return session_id
+    client = f"{request.remote_addr}|{request.headers.get('User-Agent', '')}"
+    return "anon-" + hashlib.sha1(client.encode()).hexdigest()[:16]
+
+def wants_candidates():
+    return request.args.get('candidates', '').lower() in ('1', 'true', 'yes')
+
+def dispatch(kind, payload):
+    fut = pool.submit(kind, payload, client_session_id(), wants_candidates())
+    if fut is None:
+        response = jsonify({'error': 'Server busy, retry shortly'})
+        response.headers['Retry-After'] = str(RETRY_AFTER_S)
+        return response, 503
+    try:
+        status, result = fut.result(timeout=REQUEST_TIMEOUT_S)
+    except TimeoutError:
+        return jsonify({'error': 'Inference timed out'}), 504
+    return jsonify(result), status
+
+@app.route('/predict', methods=['POST'])
+def predict():
+    """Endpoint for ASL letter prediction from webcam (base64 JSON)"""
+    data = request.get_json(silent=True)
+    if not data or 'image' not in data:
+        return jsonify({'error': 'No image data provided'}), 400
+    return dispatch('predict', data['image'])
+
+@app.route('/predict/frame', methods=['POST'])
+def predict_frame():
+    """Endpoint for ASL letter prediction from a binary frame"""
+    data = request.get_data(cache=False)
+    if not data:
+        return jsonify({'error': 'No frame data provided'}), 400
+    return dispatch('frame', (
+        data,
+        request.content_type,
+        request.headers.get('X-Frame-Width'),
+        request.headers.get('X-Frame-Height'),
+    ))
+
+@app.route('/health', methods=['GET'])
+def health():
+    """Health check: 503 until at least one worker has loaded its models"""
+    body = {
+        'status': 'healthy' if pool.ready else 'starting',
+        'workers': pool.num_workers,
+        'workers_ready': len(pool.ready),
+        'workers_failed': len(pool.failed),
+        'workers_alive': sum(p.is_alive() for p in pool.processes),
+        'restarts': pool.restarts,
+        'redispatched': pool.redispatched,
+        'in_flight': pool.in_flight(),
+        'capacity': pool.capacity,
+        'rejected': pool.rejected,
+    }
+    return jsonify(body), 200 if pool.ready else 503
+
+def main():
+    global pool
+    num_workers = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_WORKERS
+    print(f"🚀 Starting {num_workers} inference workers...")
+    pool = WorkerPool(num_workers).start()
+
+    print(f"Dispatcher available at: http://localhost:{PORT}")
+    print("Press Ctrl+C to stop the server")
+    try:
+        app.run(host=HOST, port=PORT, debug=False, threaded=True)
+    finally:
+        pool.stop()
+
+if __name__ == "__main__":
+    main()
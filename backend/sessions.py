@@ -0,0 +1,180 @@
+# sessions.py - Per-device glove sessions with pluggable letter smoothing
+
+import threading
+import time
+from collections import OrderedDict, deque
+
+# --- Smoothing policies --------------------------------------------------------
+#
+# Each policy sees one (letter, confidence) per detected sample and returns
+# (stable_letter, play_audio). All updates are O(1) per sample.
+
+class ConsecutivePolicy:
+    """
+    Original behaviour: play audio once the same letter has been seen
+    n times in a row, then start counting again. The last letter that
+    played stays stable until another one does.
+    """
+    def __init__(self, n=3):
+        self.n = n
+        self.last = None
+        self.count = 0
+        self.stable = None
+
+    def update(self, letter, confidence):
+        if letter == self.last:
+            self.count += 1
+        else:
+            self.last = letter
+            self.count = 1
+        if self.count == self.n:
+            self.count = 0  # Reset after playing audio
+            self.stable = letter
+            return letter, True
+        return self.stable, False
+
+class VotePolicy:
+    """
+    N-of-M voting: a letter becomes stable once it holds at least n of the
+    last m votes, and stays stable until another letter does (hysteresis).
+    Audio plays on each change of the stable letter.
+    """
+    def __init__(self, n=3, m=5):
+        self.n = n
+        self.window = deque(maxlen=m)
+        self.counts = {}
+        self.stable = None
+
+    def update(self, letter, confidence):
+        if len(self.window) == self.window.maxlen:
+            old = self.window[0]
+            self.counts[old] -= 1
+        self.window.append(letter)
+        self.counts[letter] = self.counts.get(letter, 0) + 1
+
+        if letter != self.stable and self.counts[letter] >= self.n:
+            self.stable = letter
+            return letter, True
+        return self.stable, False
+
+class EwmaPolicy:
+    """
+    Confidence-weighted exponential smoothing with hysteresis: each letter's
+    score decays by (1 - alpha) per sample and the observed letter gains
+    alpha * confidence. A letter becomes stable when its score reaches
+    `enter`; the stable letter is released when its score drops below `exit`.
+
+    Decay is applied lazily through a shared scale factor, so only the
+    observed and stable letters are touched per sample.
+    """
+    def __init__(self, alpha=0.5, enter=0.7, exit=0.4):
+        self.alpha = alpha
+        self.enter = enter
+        self.exit = exit
+        self.raw = {}
+        self.scale = 1.0
+        self.stable = None
+
+    def score(self, letter):
+        return self.raw.get(letter, 0.0) * self.scale
+
+    def update(self, letter, confidence):
+        self.scale *= (1.0 - self.alpha)
+        if self.scale < 1e-12:
+            # Renormalize occasionally to stay in float range
+            self.raw = {k: v * self.scale for k, v in self.raw.items()}
+            self.scale = 1.0
+        self.raw[letter] = self.raw.get(letter, 0.0) + self.alpha * float(confidence) / self.scale
+
+        if self.stable is not None and self.score(self.stable) < self.exit:
+            self.stable = None
+        if letter != self.stable and self.score(letter) >= self.enter:
+            if self.stable is None or self.score(letter) > self.score(self.stable):
+                self.stable = letter
+                return letter, True
+        return self.stable, False
+
+POLICIES = {
+    'consecutive': ConsecutivePolicy,
+    'vote': VotePolicy,
+    'ewma': EwmaPolicy,
+}
+
+def make_policy(config):
+    """config: dict with 'policy' plus that policy's keyword arguments"""
+    config = dict(config)
+    name = config.pop('policy', 'consecutive')
+    if name not in POLICIES:
+        raise ValueError(f"Unknown smoothing policy '{name}', expected one of {list(POLICIES)}")
+    return POLICIES[name](**config)
+
+# --- Sessions --------------------------------------------------------
+
+class DeviceSession:
+    """Smoothing state and latest response for one glove"""
+    def __init__(self, device_id, policy):
+        self.device_id = device_id
+        self.policy = policy
+        self.latest = None
+        self.last_pushed = None  # stable letter last sent to event subscribers
+        self.last_seen = time.monotonic()
+        # Sliding-window state for sequence.SequenceStage (created on first use)
+        self.buffer = None
+        self.samples_since_classify = 0
+        self.lock = threading.Lock()
+
+    def update(self, letter, confidence):
+        with self.lock:
+            return self.policy.update(letter, confidence)
+
+class SessionStore:
+    """
+    Thread-safe device_id -> DeviceSession map. Sessions are kept in
+    last-seen order so idle ones are evicted from the front in O(1) each.
+    on_evict(device_id) callbacks let other per-device state go with them.
+    """
+    def __init__(self, policy_config, idle_timeout_s=300.0):
+        self.policy_config = policy_config
+        self.idle_timeout_s = idle_timeout_s
+        self.on_evict = []
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_device = None
+
+    def get(self, device_id):
+        """Return the session for device_id, creating it if needed"""
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            session = self._sessions.get(device_id)
+            if session is None:
+                session = DeviceSession(device_id, make_policy(self.policy_config))
+                self._sessions[device_id] = session
+            else:
+                self._sessions.move_to_end(device_id)
+            session.last_seen = now
+            self._last_device = device_id
+            return session
+
+    def latest(self, device_id=None):
+        """Latest response for device_id, or for the most recently active device"""
+        with self._lock:
+            self._evict_idle(time.monotonic())
+            device_id = device_id if device_id is not None else self._last_device
+            session = self._sessions.get(device_id)
+            return session.latest if session is not None else None
+
+    def devices(self):
+        with self._lock:
+            return list(self._sessions)
+
+    def _evict_idle(self, now):
+        while self._sessions:
+            device_id, session = next(iter(self._sessions.items()))
+            if now - session.last_seen < self.idle_timeout_s:
+                break
+            self._sessions.popitem(last=False)
+            if device_id == self._last_device:
+                self._last_device = None
+            for callback in self.on_evict:
+                callback(device_id)
@@ -0,0 +1,130 @@
+# streaming.py - Long-lived WebSocket sessions for webcam recognition
+
+import json
+import threading
+import time
+import uuid
+
+import mediapipe as mp
+from simple_websocket import ConnectionClosed
+
+from frames import decode_base64_frame, decode_frame_bytes
+
+def create_tracking_hands():
+    """
+    Per-session MediaPipe Hands in tracking mode: palm detection only runs
+    when tracking is lost, instead of on every frame.
+    """
+    return mp.solutions.hands.Hands(
+        static_image_mode=False,
+        model_complexity=1,
+        max_num_hands=1,
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5
+    )
+
+class LatestFrameSlot:
+    """
+    Single-slot mailbox between the socket reader and the inference loop.
+    A new frame replaces any frame that hasn't been picked up yet, so a
+    client that sends faster than we can infer never builds a backlog.
+    """
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._item = None
+        self._closed = False
+        self.received = 0
+        self.dropped = 0
+
+    def put(self, item):
+        with self._cond:
+            if self._item is not None:
+                self.dropped += 1
+            self._item = item
+            self.received += 1
+            self._cond.notify()
+
+    def get(self):
+        """Block for the next frame; returns None once closed"""
+        with self._cond:
+            while self._item is None and not self._closed:
+                self._cond.wait()
+            item, self._item = self._item, None
+            return item
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+
+def decode_message(message):
+    """
+    Binary messages are JPEG/PNG bytes; text messages are a base64 data URL
+    or a JSON object with an 'image' field (same as the /predict body).
+    """
+    if isinstance(message, (bytes, bytearray)):
+        return decode_frame_bytes(message, 'image/jpeg')
+    if message.lstrip().startswith('{'):
+        message = json.loads(message)['image']
+    return decode_base64_frame(message)
+
+class StreamSession:
+    """
+    One connected webcam client. A reader thread keeps only the newest
+    frame; the calling thread decodes, infers and pushes each result.
+
+    predict_fn(rgb, tracker, session_id) -> (prediction, confidence, detected)
+    respond_fn(prediction, confidence, detected) -> dict
+    """
+    def __init__(self, ws, predict_fn, respond_fn):
+        self.ws = ws
+        self.predict_fn = predict_fn
+        self.respond_fn = respond_fn
+        self.slot = LatestFrameSlot()
+        self.tracker = create_tracking_hands()
+        self.session_id = uuid.uuid4().hex
+        self.processed = 0
+
+    def _read_loop(self):
+        seq = 0
+        try:
+            while True:
+                message = self.ws.receive()
+                if message is None:
+                    continue
+                seq += 1
+                self.slot.put((seq, message, time.perf_counter()))
+        except ConnectionClosed:
+            pass
+        finally:
+            self.slot.close()
+
+    def run(self):
+        reader = threading.Thread(target=self._read_loop, daemon=True)
+        reader.start()
+        try:
+            while True:
+                item = self.slot.get()
+                if item is None:
+                    break
+                seq, message, received_at = item
+                try:
+                    rgb = decode_message(message)
+                except Exception as e:
+                    self.ws.send(json.dumps({'error': f'Invalid frame: {e}'}))
+                    continue
+
+                prediction, confidence, detected = self.predict_fn(rgb, self.tracker, self.session_id)
+                self.processed += 1
+                response = self.respond_fn(prediction, confidence, detected)
+                response.update({
+                    'frame': seq,
+                    'dropped': self.slot.dropped,
+                    'latency_ms': (time.perf_counter() - received_at) * 1000.0,
+                })
+                self.ws.send(json.dumps(response))
+        except ConnectionClosed:
+            pass
+        finally:
+            self.slot.close()
+            self.tracker.close()
@@ -8,67 +8,10 @@ import mediapipe as mp
 import numpy as np
 import tensorflow as tf
 import pickle
-from math import acos, degrees
 import time
 import json
 
-# --- Feature helpers --------------------------------------------------------
-
-def landmark_angles(landmarks):
-    """
-    Compute 2 joint angles per finger from world landmarks.
-    Returns a (10,) array of angles in degrees.
-    """
-    fingers = {
-        'thumb':   [(1,2,3),(2,3,4)],
-        'index':   [(5,6,7),(6,7,8)],
-        'middle':  [(9,10,11),(10,11,12)],
-        'ring':    [(13,14,15),(14,15,16)],
-        'pinky':   [(17,18,19),(18,19,20)],
-    }
-    coords = np.array([[p.x, p.y, p.z] for p in landmarks], dtype=np.float32)
-    angles = []
-    for joints in fingers.values():
-        for a, b, c in joints:
-            v1 = coords[a] - coords[b]
-            v2 = coords[c] - coords[b]
-            cosang = np.dot(v1, v2) / (np.linalg.norm(v1)*np.linalg.norm(v2) + 1e-6)
-            angles.append(degrees(acos(np.clip(cosang, -1, 1))))
-    return np.array(angles, dtype=np.float32)
-
-def tip_distances(landmarks):
-    """
-    Compute Euclidean distance from each fingertip to the wrist.
-    Returns a (5,) array of distances.
-    """
-    pts = np.array([[p.x, p.y, p.z] for p in landmarks], dtype=np.float32)
-    wrist = pts[0]
-    tips  = pts[[4, 8, 12, 16, 20]]
-    return np.linalg.norm(tips - wrist, axis=1)
-
-def hull_area(landmarks, w, h):
-    """
-    Compute 2D convex-hull area of the hand projection.
-    landmarks: normalized image-space landmarks
-    w,h: frame width & height in pixels
-    """
-    pts = np.array([[int(p.x*w), int(p.y*h)] for p in landmarks], dtype=np.int32)
-    hull = cv2.convexHull(pts)
-    return cv2.contourArea(hull)
-
-def get_hand_bbox(landmarks, frame_shape, pad=0.2):
-    """
-    Return a padded bounding box (x1,y1,x2,y2) in pixel coords
-    around the hand landmarks.
-    """
-    h, w = frame_shape[:2]
-    xs = [p.x for p in landmarks]
-    ys = [p.y for p in landmarks]
-    x1 = int(max(0, (min(xs) - pad) * w))
-    x2 = int(min(w, (max(xs) + pad) * w))
-    y1 = int(max(0, (min(ys) - pad) * h))
-    y2 = int(min(h, (max(ys) + pad) * h))
-    return x1, y1, x2, y2
+from features import extract_features, get_hand_bbox, landmarks_to_array
 
 # --- Model loading --------------------------------------------------------
 
@@ -133,14 +76,10 @@ def predict_asl_letter(frame):
         
         if res.multi_hand_world_landmarks:
             world_lms = res.multi_hand_world_landmarks[0].landmark
-            img_lms = res.multi_hand_landmarks[0].landmark
+            img_lms = landmarks_to_array(res.multi_hand_landmarks[0].landmark)
             
             # Build feature vector
-            coords = np.array([[p.x,p.y,p.z] for p in world_lms], dtype=np.float32).flatten()
-            angs = landmark_angles(world_lms)
-            dists = tip_distances(world_lms)
-            area = hull_area(img_lms, w_img, h_img)
-            feat = np.concatenate([coords, angs, dists, [area]]).reshape(1, -1)
+            feat = extract_features(world_lms, img_lms, w_img, h_img).reshape(1, -1)
             
             # Main prediction
             feat_s = scaler.transform(feat)
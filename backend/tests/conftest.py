@@ -0,0 +1,13 @@
+# conftest.py - Run the tests from backend/ so model paths resolve as in app.py
+
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+@pytest.fixture(autouse=True)
+def backend_cwd(monkeypatch):
+    monkeypatch.chdir(BACKEND_DIR)
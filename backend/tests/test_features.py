@@ -0,0 +1,36 @@
+# test_features.py - Vectorized features.py vs the original per-landmark helpers
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from benchmark_features import legacy_features, make_hands, to_landmarks
+from features import extract_features, extract_features_batch
+
+MAX_ANGLE_DIFF = 1e-3   # degrees
+MAX_OTHER_DIFF = 1e-5
+W, H = 640, 480
+ANGLES = np.s_[63:73]
+
+@pytest.fixture(scope="module")
+def hands():
+    world, img = make_hands(200, np.random.default_rng(0))
+    legacy = np.stack([legacy_features(to_landmarks(wl), to_landmarks(il), W, H)
+                       for wl, il in zip(world, img)])
+    return world, img, legacy
+
+def check(feats, legacy):
+    diff = np.abs(feats - legacy)
+    assert diff[:, ANGLES].max() <= MAX_ANGLE_DIFF
+    assert np.delete(diff, ANGLES, axis=1).max() <= MAX_OTHER_DIFF
+
+def test_extract_features_matches_legacy(hands):
+    world, img, legacy = hands
+    feats = np.stack([extract_features(to_landmarks(wl), to_landmarks(il), W, H)
+                      for wl, il in zip(world, img)])
+    check(feats, legacy)
+
+def test_extract_features_batch_matches_legacy(hands):
+    world, img, legacy = hands
+    check(extract_features_batch(world, img, W, H), legacy)
@@ -0,0 +1,58 @@
+# test_glove_backends.py - TFLite float / int8 and NumPy glove backends vs Keras
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from numpy_engine import NumpyEngine
+
+KERAS_PATH = "glove_cnn_model.keras"
+CLASSES_PATH = "classes.json"
+MAX_FLOAT_DIFF = 1e-4   # max |Δp| for float backends
+MIN_AGREEMENT = 0.98    # int8 top-1 agreement, as in check_glove_tflite_parity.py
+
+def readings(n=512):
+    return np.random.default_rng(0).uniform(0, 4095, size=(n, 5, 1)).astype(np.float32)
+
+def test_numpy_engine_loads_keras_archive():
+    engine = NumpyEngine(KERAS_PATH).warmup()
+    with open(CLASSES_PATH) as f:
+        classes = json.load(f)
+    probs = engine(readings())
+    assert engine.input_shape == (5, 1)
+    assert probs.shape == (512, len(classes))
+    assert np.allclose(probs.sum(axis=1), 1.0, atol=1e-5)
+
+@pytest.fixture(scope="module")
+def keras_model():
+    tf = pytest.importorskip("tensorflow")
+    return tf.keras.models.load_model(KERAS_PATH)
+
+def test_numpy_engine_matches_keras(keras_model):
+    x = readings()
+    diff = np.abs(NumpyEngine(KERAS_PATH)(x) - keras_model.predict(x, verbose=0))
+    assert diff.max() <= MAX_FLOAT_DIFF
+
+def test_tflite_float_matches_keras(keras_model, tmp_path):
+    from export_glove_tflite import convert_float
+    from tflite_engine import TFLiteEngine
+    path = tmp_path / "glove_float.tflite"
+    path.write_bytes(convert_float(keras_model))
+    x = readings()
+    diff = np.abs(TFLiteEngine(str(path))(x) - keras_model.predict(x, verbose=0))
+    assert diff.max() <= MAX_FLOAT_DIFF
+
+def test_tflite_int8_agrees_with_keras(keras_model, tmp_path):
+    from export_glove_tflite import DATA_FILE, convert_int8, load_glove_csv
+    from tflite_engine import TFLiteEngine
+    if not os.path.exists(DATA_FILE):
+        pytest.skip(f"{DATA_FILE} not found (record one with hardware/training/datatocsv.py)")
+    recorded, _ = load_glove_csv(DATA_FILE)
+    path = tmp_path / "glove_int8.tflite"
+    path.write_bytes(convert_int8(keras_model, recorded))
+    x = recorded.reshape(-1, 5, 1)
+    expected = np.argmax(keras_model.predict(x, verbose=0), axis=1)
+    agreement = np.mean(np.argmax(TFLiteEngine(str(path))(x), axis=1) == expected)
+    assert agreement >= MIN_AGREEMENT
@@ -0,0 +1,43 @@
+# test_scaler.py - Folded AffineScaler vs the sklearn StandardScaler pickle
+
+import pickle
+import warnings
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from export_scaler import SCALER_PATH
+from preprocess import AffineScaler
+
+MAX_ABS_DIFF = 1e-5  # in standard deviations
+
+@pytest.fixture(scope="module")
+def scaler():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # pickled with another sklearn version
+        with open(SCALER_PATH, "rb") as f:
+            return pickle.load(f)
+
+def sample(scaler, n):
+    """Features around the training distribution: mean_ +/- 3 scale_"""
+    rng = np.random.default_rng(0)
+    return (scaler.mean_ + scaler.scale_ * rng.uniform(-3, 3, size=(n, scaler.n_features_in_))).astype(np.float32)
+
+def test_affine_matches_sklearn_batch(scaler):
+    feats = sample(scaler, 1000)
+    diff = np.abs(AffineScaler.from_sklearn(scaler).transform(feats) - scaler.transform(feats))
+    assert diff.max() <= MAX_ABS_DIFF
+
+def test_affine_matches_sklearn_per_row(scaler):
+    affine = AffineScaler.from_sklearn(scaler)
+    for row in sample(scaler, 50)[:, np.newaxis, :]:
+        assert np.abs(affine.transform(row) - scaler.transform(row)).max() <= MAX_ABS_DIFF
+
+def test_affine_save_load_roundtrip(scaler, tmp_path):
+    affine = AffineScaler.from_sklearn(scaler)
+    affine.save(tmp_path / "affine.npz")
+    loaded = AffineScaler.load(tmp_path / "affine.npz")
+    feats = sample(scaler, 10)
+    assert np.array_equal(loaded.transform(feats), affine.transform(feats))
@@ -0,0 +1,84 @@
+# tflite_engine.py - TFLite interpreter backend (float or int8) for small models
+
+import threading
+import time
+
+import numpy as np
+
+def load_interpreter_class():
+    """
+    Prefer the standalone runtime; fall back to the interpreter bundled with
+    TF. Resolved on first use so importing this module stays cheap.
+    """
+    try:
+        from tflite_runtime.interpreter import Interpreter
+    except ImportError:
+        try:
+            from tensorflow.lite import Interpreter
+        except ImportError:
+            raise ImportError("TFLite backend needs tflite-runtime or tensorflow installed")
+    return Interpreter
+
+class TFLiteEngine:
+    """
+    Runs a .tflite model with the same call interface as InferenceEngine:
+    engine(x) with x shaped (N, *input_shape) returns (N, outputs) float32.
+
+    For fully-quantized (int8/uint8) models the raw float inputs are
+    quantized with the input tensor's scale/zero-point and the outputs are
+    dequantized back to probabilities, so callers can pass raw 0-4095
+    sensor readings exactly as they would to the Keras model.
+    """
+    def __init__(self, model_path, name=None, num_threads=1):
+        Interpreter = load_interpreter_class()
+        self.model_path = model_path
+        self.name = name or model_path
+        self.interpreter = Interpreter(model_path=model_path, num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+        self.input_shape = tuple(int(d) for d in self._input['shape'][1:])
+        self.input_dtype = self._input['dtype']
+        self.output_dtype = self._output['dtype']
+        self.quantized = np.issubdtype(self.input_dtype, np.integer)
+        self._batch = int(self._input['shape'][0])
+        self._lock = threading.Lock()  # the interpreter is not thread-safe
+        self.warmup_ms = None
+
+    def warmup(self, batch_size=1):
+        start = time.perf_counter()
+        self(np.zeros((batch_size,) + self.input_shape, dtype=np.float32))
+        self.warmup_ms = (time.perf_counter() - start) * 1000.0
+        return self
+
+    def _quantize_input(self, x):
+        if not self.quantized:
+            return x.astype(self.input_dtype, copy=False)
+        scale, zero_point = self._input['quantization']
+        info = np.iinfo(self.input_dtype)
+        q = np.round(x / scale + zero_point)
+        return np.clip(q, info.min, info.max).astype(self.input_dtype)
+
+    def _dequantize_output(self, y):
+        if not np.issubdtype(self.output_dtype, np.integer):
+            return y.astype(np.float32, copy=False)
+        scale, zero_point = self._output['quantization']
+        return (y.astype(np.float32) - zero_point) * scale
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=np.float32)
+        n = x.shape[0]
+        q = self._quantize_input(x)
+        with self._lock:
+            if n != self._batch:
+                self.interpreter.resize_tensor_input(self._input['index'], (n,) + self.input_shape)
+                self.interpreter.allocate_tensors()
+                self._batch = n
+            self.interpreter.set_tensor(self._input['index'], q)
+            self.interpreter.invoke()
+            y = self.interpreter.get_tensor(self._output['index'])
+        return self._dequantize_output(y)
+
+    def predict(self, x, verbose=0):
+        return self(x)
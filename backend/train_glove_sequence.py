@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Train the sliding-window glove sequence model used by app.py
+(ESP32_SEQUENCE_MODEL) from recordings made with
+hardware/training/datatocsv.py (2 s at 20 Hz per sample_id).
+
+Usage: python train_glove_sequence.py [path/to/all_data.csv]
+"""
+
+import csv
+import json
+import sys
+from collections import defaultdict
+
+import numpy as np
+import tensorflow as tf
+
+DATA_FILE = "all_data.csv"
+MODEL_PATH = "glove_seq_model.keras"
+CLASSES_PATH = "glove_seq_classes.json"
+FINGER_NAMES = ["thumb", "pointer", "middle", "ring", "pinky"]
+WINDOW = 40        # readings per window (2 s at 20 Hz)
+STRIDE = 4         # step between training windows within a recording
+ADC_MAX = 4095.0   # raw 12-bit readings; scaling is part of the model
+EPOCHS = 40
+
+def load_recordings(path):
+    """
+    Returns: {sample_id: (label, (T, 5) float32 readings)}
+    """
+    rows = defaultdict(list)
+    labels = {}
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                values = [float(row[k]) for k in FINGER_NAMES]
+            except (KeyError, ValueError):
+                continue
+            rows[row["sample_id"]].append(values)
+            labels[row["sample_id"]] = row["label"]
+    return {sid: (labels[sid], np.array(r, dtype=np.float32)) for sid, r in rows.items()}
+
+def make_windows(readings):
+    """Slide a WINDOW-long window over one recording (edge-padded if short)"""
+    if len(readings) < WINDOW:
+        pad = np.repeat(readings[-1:], WINDOW - len(readings), axis=0)
+        readings = np.concatenate([readings, pad])
+    starts = range(0, len(readings) - WINDOW + 1, STRIDE)
+    return np.stack([readings[s:s + WINDOW] for s in starts])
+
+def build_model(n_classes):
+    return tf.keras.Sequential([
+        tf.keras.layers.Input(shape=(WINDOW, len(FINGER_NAMES))),
+        tf.keras.layers.Rescaling(1.0 / ADC_MAX),
+        tf.keras.layers.Conv1D(32, 5, padding="same", activation="relu"),
+        tf.keras.layers.Conv1D(64, 5, padding="same", activation="relu"),
+        tf.keras.layers.GRU(64),
+        tf.keras.layers.Dense(64, activation="relu"),
+        tf.keras.layers.Dense(n_classes, activation="softmax"),
+    ])
+
+def main():
+    data_file = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    recordings = load_recordings(data_file)
+    classes = sorted({label for label, _ in recordings.values()})
+    print(f"📊 {len(recordings)} recordings, classes: {', '.join(classes)}")
+
+    # Split by recording so windows from one take never leak across sets
+    rng = np.random.default_rng(0)
+    ids = list(recordings)
+    rng.shuffle(ids)
+    n_val = max(1, len(ids) // 5)
+    splits = {'val': ids[:n_val], 'train': ids[n_val:]}
+
+    data = {}
+    for name, split_ids in splits.items():
+        xs, ys = [], []
+        for sid in split_ids:
+            label, readings = recordings[sid]
+            windows = make_windows(readings)
+            xs.append(windows)
+            ys.append(np.full(len(windows), classes.index(label)))
+        data[name] = (np.concatenate(xs), np.concatenate(ys))
+
+    model = build_model(len(classes))
+    model.compile(optimizer="adam", loss="sparse_categorical_crossentropy", metrics=["accuracy"])
+    model.fit(*data['train'], validation_data=data['val'], epochs=EPOCHS, batch_size=32, verbose=2)
+
+    _, acc = model.evaluate(*data['val'], verbose=0)
+    print(f"✅ Validation accuracy: {acc:.2%}")
+    model.save(MODEL_PATH)
+    with open(CLASSES_PATH, "w") as f:
+        json.dump(classes, f)
+    print(f"✅ Saved {MODEL_PATH} and {CLASSES_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+# udp_ingest.py - Compact binary UDP ingestion for glove readings
+
+import socket
+import struct
+import threading
+
+# Reading datagram: device id (8 ASCII bytes, NUL-padded), uint32 sequence
+# number, 5 x uint16 readings (thumb, pointer, middle, ring, pinky), all
+# little-endian. A datagram may carry several records back to back.
+READING = struct.Struct('<8sI5H')
+# Result datagram sent back to the sender for each accepted reading:
+# device id, sequence number, raw letter, stable letter (b' ' for none),
+# flags, confidence scaled to 0-65535
+RESULT = struct.Struct('<8sI1s1sBH')
+FLAG_DETECTED = 0x01
+FLAG_PLAY_AUDIO = 0x02
+
+SEQ_MOD = 1 << 32
+SEQ_HALF = 1 << 31
+# Gaps this close to the newest reading are remembered, so a reordered
+# reading that arrives late is taken back out of the loss count
+REORDER_WINDOW = 64
+# Datagrams drained from the socket into one prediction batch
+MAX_DRAIN = 256
+
+def pack_reading(device_id, seq, values):
+    return READING.pack(device_id.encode('ascii')[:8], seq % SEQ_MOD, *(int(v) for v in values))
+
+def _letter_byte(letter):
+    return letter.encode('ascii')[:1] if letter else b' '
+
+def pack_result(device_id, seq, response):
+    flags = (FLAG_DETECTED if response['detected'] else 0) | (FLAG_PLAY_AUDIO if response['play_audio'] else 0)
+    return RESULT.pack(device_id.encode('ascii')[:8], seq, _letter_byte(response['prediction']),
+                       _letter_byte(response['stable_prediction']), flags,
+                       int(round(min(max(response['confidence'], 0.0), 1.0) * 65535)))
+
+def unpack_result(data):
+    """Sender side: (device_id, seq, prediction, stable, detected, play_audio, confidence)"""
+    device, seq, pred, stable, flags, conf = RESULT.unpack(data)
+    return (device.rstrip(b'\0').decode('ascii'), seq, pred.decode().strip() or None,
+            stable.decode().strip() or None, bool(flags & FLAG_DETECTED),
+            bool(flags & FLAG_PLAY_AUDIO), conf / 65535.0)
+
+class SequenceTracker:
+    """
+    Per-device sequence numbers with serial-number arithmetic (mod 2^32).
+    Newer readings are accepted and any gap is counted as lost; duplicates
+    and readings older than the newest seen are dropped, since a late
+    reading would only rewind the smoothing state. A late reading that
+    fills a remembered gap was reordered, not lost. Sequence 0 marks a
+    device restart.
+    """
+    def __init__(self):
+        self.last = {}
+        self.missing = {}  # device_id -> recent sequence numbers counted as lost
+        self.accepted = 0
+        self.lost = 0
+        self.duplicates = 0
+        self.late = 0
+        self._lock = threading.Lock()
+
+    def accept(self, device_id, seq):
+        with self._lock:
+            last = self.last.get(device_id)
+            if last is None or seq == 0:
+                self.last[device_id] = seq
+                self.missing[device_id] = set()
+                self.accepted += 1
+                return True
+            diff = (seq - last) % SEQ_MOD
+            missing = self.missing[device_id]
+            if diff == 0:
+                self.duplicates += 1
+                return False
+            if diff >= SEQ_HALF:
+                if seq in missing:
+                    missing.discard(seq)
+                    self.lost -= 1
+                    self.late += 1
+                elif (last - seq) % SEQ_MOD < REORDER_WINDOW:
+                    self.duplicates += 1  # an older reading we already accepted
+                else:
+                    self.late += 1
+                return False
+            self.lost += diff - 1
+            missing.update((seq - k) % SEQ_MOD for k in range(1, min(diff, REORDER_WINDOW)))
+            if missing:
+                self.missing[device_id] = {m for m in missing if (seq - m) % SEQ_MOD < REORDER_WINDOW}
+            self.last[device_id] = seq
+            self.accepted += 1
+            return True
+
+    def forget(self, device_id):
+        """Drop a device's state (its session went idle)"""
+        with self._lock:
+            self.last.pop(device_id, None)
+            self.missing.pop(device_id, None)
+
+    def stats(self):
+        return {
+            'devices': len(self.last),
+            'accepted': self.accepted,
+            'lost': self.lost,
+            'duplicates': self.duplicates,
+            'late': self.late,
+        }
+
+class UdpIngestServer:
+    """
+    Receives reading datagrams on one socket. Each wakeup drains every
+    pending datagram (up to MAX_DRAIN) and hands all accepted readings to
+    predict_fn([(device_id, values), ...]) -> [response dict, ...] as one
+    batch, in arrival order (the smoothing state is ordered per device).
+    Each result is sent back to its datagram's source address.
+    """
+    def __init__(self, predict_fn, host='0.0.0.0', port=5005, reply=True):
+        self.predict_fn = predict_fn
+        self.host = host
+        self.port = port
+        self.reply = reply
+        self.tracker = SequenceTracker()
+        self.datagrams = 0
+        self.malformed = 0
+        self._sock = None
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self._sock.bind((self.host, self.port))
+        except OSError:
+            self._sock.close()
+            self._sock = None
+            raise
+        self._sock.settimeout(0.5)
+        self.port = self._sock.getsockname()[1]
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="udp-ingest", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=1.0):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _receive(self):
+        """Block for one datagram, then take whatever else is already queued"""
+        datagrams = [self._sock.recvfrom(65535)]
+        self._sock.setblocking(False)
+        try:
+            while len(datagrams) < MAX_DRAIN:
+                datagrams.append(self._sock.recvfrom(65535))
+        except (BlockingIOError, InterruptedError):
+            pass
+        finally:
+            self._sock.settimeout(0.5)
+        return datagrams
+
+    def _run(self):
+        while self._running:
+            try:
+                datagrams = self._receive()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            batch = []  # (device_id, seq, values, addr)
+            for data, addr in datagrams:
+                self.datagrams += 1
+                if not data or len(data) % READING.size:
+                    self.malformed += 1
+                    continue
+                for device, seq, *values in READING.iter_unpack(data):
+                    try:
+                        device_id = device.rstrip(b'\0').decode('ascii')
+                    except UnicodeDecodeError:
+                        self.malformed += 1
+                        continue
+                    if self.tracker.accept(device_id, seq):
+                        batch.append((device_id, seq, values, addr))
+            if not batch:
+                continue
+            try:
+                responses = self.predict_fn([(device_id, values) for device_id, _, values, _ in batch])
+                if self.reply:
+                    for (device_id, seq, _, addr), response in zip(batch, responses):
+                        self._sock.sendto(pack_result(device_id, seq, response), addr)
+            except Exception as e:
+                print(f"Error in UDP ingestion: {e}")
+
+    def stats(self):
+        return dict(self.tracker.stats(), port=self.port, datagrams=self.datagrams, malformed=self.malformed)
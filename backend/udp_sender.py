@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Stand-in glove for the UDP ingestion listener: sends reading datagrams at
+a fixed rate with optional simulated loss, reordering and duplication,
+collects the result datagrams and prints a summary.
+
+  python udp_sender.py                       # against app.py on localhost:5005
+  python udp_sender.py --csv all_data.csv --loss 0.05 --reorder 0.05
+  python udp_sender.py --self-test           # bundled listener with a stub model
+
+--self-test starts a UdpIngestServer in this process with a stub predictor,
+so loss/reorder handling can be checked on localhost without any models.
+"""
+
+import argparse
+import csv
+import random
+import socket
+import time
+
+from udp_ingest import RESULT, UdpIngestServer, pack_reading, unpack_result
+
+FINGER_NAMES = ["thumb", "pointer", "middle", "ring", "pinky"]
+
+def load_readings(path, limit):
+    readings = []
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                readings.append([int(float(row[k])) for k in FINGER_NAMES])
+            except (KeyError, ValueError):
+                continue
+            if len(readings) >= limit:
+                break
+    return readings
+
+def synthetic_readings(n, rng):
+    """A held pose every 40 readings, with ADC noise"""
+    readings = []
+    for i in range(n):
+        if i % 40 == 0:
+            pose = [rng.randint(0, 4095) for _ in range(5)]
+        readings.append([min(4095, max(0, v + rng.randint(-8, 8))) for v in pose])
+    return readings
+
+def stub_predict(items):
+    """Letters from the bent-finger pattern; stands in for predict_esp32_readings"""
+    responses = []
+    for device_id, values in items:
+        letter = chr(65 + sum(1 << i for i, v in enumerate(values) if v > 2048) % 26)
+        responses.append({'detected': True, 'prediction': letter, 'stable_prediction': letter,
+                          'confidence': 0.9, 'play_audio': False})
+    return responses
+
+def schedule(n, loss, reorder, duplicate, rng):
+    """Send order of sequence numbers after simulated loss / swaps / duplicates"""
+    order = [seq for seq in range(1, n + 1) if rng.random() >= loss]
+    for i in range(len(order) - 1):
+        if rng.random() < reorder:
+            order[i], order[i + 1] = order[i + 1], order[i]
+    out = []
+    for seq in order:
+        out.append(seq)
+        if rng.random() < duplicate:
+            out.append(seq)
+    return out, n - len(order)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5005)
+    parser.add_argument("--device", default="glove-1")
+    parser.add_argument("--csv", help="datatocsv.py recording to replay")
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--hz", type=float, default=50.0)
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument("--reorder", type=float, default=0.0)
+    parser.add_argument("--duplicate", type=float, default=0.0)
+    parser.add_argument("--self-test", action="store_true")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    readings = load_readings(args.csv, args.count) if args.csv else synthetic_readings(args.count, rng)
+    order, dropped = schedule(len(readings), args.loss, args.reorder, args.duplicate, rng)
+
+    server = None
+    if args.self_test:
+        server = UdpIngestServer(stub_predict, host="127.0.0.1", port=0).start()
+        args.port = server.port
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.settimeout(0.001)
+    results = {}
+    interval = 1.0 / args.hz
+
+    def drain():
+        while True:
+            try:
+                data, _ = sock.recvfrom(RESULT.size)
+            except (socket.timeout, BlockingIOError):
+                return
+            device, seq, pred, stable, detected, play_audio, conf = unpack_result(data)
+            results[seq] = (stable, time.perf_counter())
+
+    print(f"📡 Sending {len(order)} datagrams to {args.host}:{args.port} as '{args.device}' "
+          f"(dropped {dropped}, reorder {args.reorder:.0%}, duplicate {args.duplicate:.0%})")
+    sent_at = {}
+    for seq in order:
+        sock.sendto(pack_reading(args.device, seq, readings[seq - 1]), (args.host, args.port))
+        sent_at.setdefault(seq, time.perf_counter())
+        deadline = time.perf_counter() + interval
+        while time.perf_counter() < deadline:
+            drain()
+    end = time.perf_counter() + 0.5
+    while time.perf_counter() < end:
+        drain()
+
+    rtts = sorted((results[s][1] - sent_at[s]) * 1000.0 for s in results if s in sent_at)
+    print("=" * 60)
+    print(f"results received   {len(results)}")
+    if rtts:
+        print(f"round trip         p50 {rtts[len(rtts) // 2]:.2f} ms  max {rtts[-1]:.2f} ms")
+    if server is not None:
+        stats = server.stats()
+        server.stop()
+        print(f"listener           accepted {stats['accepted']}  lost {stats['lost']}  "
+              f"late {stats['late']}  duplicates {stats['duplicates']}  malformed {stats['malformed']}")
+        # Every datagram is accepted, or dropped as a duplicate / late arrival;
+        # only readings that never arrived (before the newest one) count as lost
+        expected_lost = len(set(range(1, max(order) + 1)) - set(order)) if order else 0
+        ok = (stats['accepted'] == len(results)
+              and stats['accepted'] + stats['late'] + stats['duplicates'] == len(order)
+              and stats['lost'] == expected_lost)
+        print("✅ Listener handled loss/reordering as expected" if ok else "❌ Unexpected listener counts")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -17,8 +17,20 @@ const AVAILABLE_LETTERS = ['B', 'W', 'A', 'R', 'K', 'J'];
 // const AVAILABLE_LETTERS = ['B', 'W']; // Only B and W
 // const AVAILABLE_LETTERS = ['A', 'B', 'C', 'D', 'E']; // Only first 5 letters
 
+// One id per browser tab, so the backend keeps this tab's hand tracking,
+// frame skipping and refiner cache separate from other clients
+const getSessionId = () => {
+  let id = sessionStorage.getItem('speakez-session-id');
+  if (!id) {
+    id = crypto.randomUUID();
+    sessionStorage.setItem('speakez-session-id', id);
+  }
+  return id;
+};
+
 const LearnMain = () => {
   const webcamRef = useRef(null);
+  const sessionId = useRef(getSessionId());
   const [webcamActive, setWebcamActive] = useState(false);
   const [currentLetter, setCurrentLetter] = useState('');
   const [isLearning, setIsLearning] = useState(false);
@@ -46,6 +58,7 @@ const LearnMain = () => {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
+          'X-Session-Id': sessionId.current,
         },
         body: JSON.stringify({ image: imageSrc }),
       });
@@ -136,11 +136,14 @@ const PairingMain = () => {
       setCurrentLetter(result.prediction);
       setConfidence(result.confidence);
       
-      // Automatically play audio for the detected letter
-      playLetterAudio(result.prediction);
-      
-      // Update connection message to show successful detection
-      setConnectionMessage(`Letter ${result.prediction} detected! Audio played.`);
+      // Play audio only when the backend's debouncer fires, once per trigger
+      if (result.play_audio) {
+        const letter = result.stable_prediction || result.prediction;
+        playLetterAudio(letter);
+        setConnectionMessage(`Letter ${letter} detected! Audio played.`);
+      } else {
+        setConnectionMessage(`Letter ${result.prediction} detected!`);
+      }
       setLastESP32DataTime(Date.now());
     } else {
       console.log('❌ No letter detected in this data');
@@ -226,18 +229,13 @@ const PairingMain = () => {
 
   useEffect(() => {
     if (!isConnected) return;
-    const poll = setInterval(async () => {
-      try {
-        const res = await fetch('http://localhost:5000/esp32/latest');
-        if (res.ok) {
-          const data = await res.json();
-          processESP32Prediction(data);
-        }
-      } catch (e) {
-        // Optionally handle error
-      }
-    }, 2000);
-    return () => clearInterval(poll);
+    // Pushed only when the debounced letter changes or audio should play;
+    // EventSource reconnects on its own if the stream drops
+    const events = new EventSource('http://localhost:5000/esp32/events');
+    events.onmessage = (e) => {
+      processESP32Prediction(JSON.parse(e.data));
+    };
+    return () => events.close();
   }, [isConnected]);
 
   return (
@@ -0,0 +1,96 @@
+#include <WiFi.h>
+#include <HTTPClient.h>
+
+// Wi-Fi credentials
+const char* ssid = "SSID";
+
+const char* password = "Password";
+
+// Flask batch endpoint (change IP if needed)
+const char* serverURL = "http://IP:5000/esp32/predict_batch";
+const char* deviceId = "glove-1";
+
+// ADC1-compatible GPIO pins
+const int thumb   = 39;  // ADC1_CH3
+const int pointer = 34;  // ADC1_CH6
+const int middle  = 35;  // ADC1_CH7
+const int ring    = 32;  // ADC1_CH4
+const int pinky   = 33;  // ADC1_CH5
+
+// Sample at 25 Hz, send every 20 samples (~1.25 requests per second)
+const long sampleInterval = 40;
+const int batchSize = 20;
+
+// One record: uint32 timestamp (ms) + 5 x uint16 readings, little-endian
+const int recordSize = 14;
+uint8_t batch[batchSize * recordSize];
+int batchCount = 0;
+unsigned long previousMillis = 0;
+
+HTTPClient http;
+
+void putU16(uint8_t* p, uint16_t v) {
+  p[0] = v & 0xFF;
+  p[1] = (v >> 8) & 0xFF;
+}
+
+void putU32(uint8_t* p, uint32_t v) {
+  putU16(p, v & 0xFFFF);
+  putU16(p + 2, (v >> 16) & 0xFFFF);
+}
+
+void setup() {
+  Serial.begin(115200);
+
+  // Connect to Wi-Fi
+  WiFi.begin(ssid, password);
+  Serial.print("Connecting to WiFi");
+  while (WiFi.status() != WL_CONNECTED) {
+    delay(500);
+    Serial.print(".");
+  }
+  Serial.println("\nConnected!");
+
+  // Reuse one connection for every batch
+  http.setReuse(true);
+}
+
+void sendBatch() {
+  if (WiFi.status() != WL_CONNECTED) {
+    Serial.println("WiFi Disconnected");
+    return;
+  }
+  http.begin(serverURL);
+  http.addHeader("Content-Type", "application/octet-stream");
+  http.addHeader("X-Device-Id", deviceId);
+  int httpResponseCode = http.POST(batch, batchCount * recordSize);
+
+  if (httpResponseCode > 0) {
+    Serial.println("Server Response: " + http.getString());
+  } else {
+    Serial.println("Error sending POST: " + String(httpResponseCode));
+  }
+  http.end();
+}
+
+void loop() {
+  unsigned long currentMillis = millis();
+
+  if (currentMillis - previousMillis >= sampleInterval) {
+    previousMillis = currentMillis;
+
+    uint8_t* rec = batch + batchCount * recordSize;
+    putU32(rec, currentMillis);
+    putU16(rec + 4,  analogRead(thumb));
+    putU16(rec + 6,  analogRead(pointer));
+    putU16(rec + 8,  analogRead(middle));
+    putU16(rec + 10, analogRead(ring));
+    putU16(rec + 12, analogRead(pinky));
+    batchCount++;
+
+    if (batchCount == batchSize) {
+      sendBatch();
+      batchCount = 0;
+    }
+  }
+}
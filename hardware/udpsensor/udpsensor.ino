@@ -0,0 +1,89 @@
+#include <WiFi.h>
+#include <WiFiUdp.h>
+
+// Wi-Fi credentials
+const char* ssid = "SSID";
+
+const char* password = "Password";
+
+// Backend UDP ingestion listener (change IP if needed)
+const char* serverIP = "IP";
+const int serverPort = 5005;
+const char* deviceId = "glove-1";  // up to 8 ASCII characters
+
+// ADC1-compatible GPIO pins
+const int thumb   = 39;  // ADC1_CH3
+const int pointer = 34;  // ADC1_CH6
+const int middle  = 35;  // ADC1_CH7
+const int ring    = 32;  // ADC1_CH4
+const int pinky   = 33;  // ADC1_CH5
+
+// One datagram per reading at 25 Hz
+const long sampleInterval = 40;
+
+// Datagram: 8-byte device id, uint32 sequence number, 5 x uint16 readings,
+// little-endian (22 bytes). Sequence 0 tells the server we restarted.
+const int packetSize = 22;
+uint8_t packet[packetSize];
+uint32_t seq = 0;
+unsigned long previousMillis = 0;
+
+// Result: device id, uint32 seq, raw letter, stable letter, flags, uint16 confidence
+const int resultSize = 17;
+uint8_t result[resultSize];
+
+WiFiUDP udp;
+
+void putU16(uint8_t* p, uint16_t v) {
+  p[0] = v & 0xFF;
+  p[1] = (v >> 8) & 0xFF;
+}
+
+void putU32(uint8_t* p, uint32_t v) {
+  putU16(p, v & 0xFFFF);
+  putU16(p + 2, (v >> 16) & 0xFFFF);
+}
+
+void setup() {
+  Serial.begin(115200);
+
+  // Connect to Wi-Fi
+  WiFi.begin(ssid, password);
+  Serial.print("Connecting to WiFi");
+  while (WiFi.status() != WL_CONNECTED) {
+    delay(500);
+    Serial.print(".");
+  }
+  Serial.println("\nConnected!");
+
+  memset(packet, 0, 8);
+  strncpy((char*)packet, deviceId, 8);
+  udp.begin(serverPort);
+}
+
+void loop() {
+  unsigned long currentMillis = millis();
+
+  if (currentMillis - previousMillis >= sampleInterval) {
+    previousMillis = currentMillis;
+
+    putU32(packet + 8,  seq++);
+    putU16(packet + 12, analogRead(thumb));
+    putU16(packet + 14, analogRead(pointer));
+    putU16(packet + 16, analogRead(middle));
+    putU16(packet + 18, analogRead(ring));
+    putU16(packet + 20, analogRead(pinky));
+
+    udp.beginPacket(serverIP, serverPort);
+    udp.write(packet, packetSize);
+    udp.endPacket();
+  }
+
+  // Results arrive asynchronously; print when the stable letter should be spoken
+  if (udp.parsePacket() == resultSize) {
+    udp.read(result, resultSize);
+    if (result[14] & 0x02) {
+      Serial.println("Play audio for: " + String((char)result[13]));
+    }
+  }
+}